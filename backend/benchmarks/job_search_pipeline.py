@@ -0,0 +1,108 @@
+"""
+Benchmark per-search CPU time of the job result pipeline.
+
+Compares the previous pandas pipeline (DataFrame construction, column
+rename, drop_duplicates, sort_values, to_dict('records')) with the
+JobRecord pipeline now used by JobSearcher, on synthetic provider results
+of typical search sizes. Provider HTTP time is excluded. Run from backend/:
+
+    python benchmarks/job_search_pipeline.py [iterations]
+
+The pandas baseline is skipped if pandas is not installed.
+"""
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+from job_search import JobRecord, JobSearcher  # noqa: E402
+
+SIZES = (10, 20, 50)
+
+DISPLAY_COLUMNS = ["Job Title", "Company", "Location", "Job Type", "Salary",
+                   "Date Posted", "Apply Link", "Source"]
+
+
+def provider_rows(n: int, seed: int = 7):
+    """Provider-shaped job dicts with a few (title, company) duplicates."""
+    rng = random.Random(seed)
+    titles = ["Backend Engineer", "Data Scientist", "Frontend Developer", "SRE", "ML Engineer"]
+    companies = ["Acme", "Initech", "Globex", "Umbrella", "Hooli", "Stark"]
+    rows = []
+    for i in range(n):
+        rows.append({
+            "Job Title": rng.choice(titles),
+            "Company": rng.choice(companies),
+            "Location": "Austin, TX",
+            "Job Type": "FULLTIME",
+            "Salary": f"${rng.randint(90, 180) * 1000:,} yearly",
+            "Date Posted": f"2026-10-{rng.randint(1, 28):02d}T00:00:00Z",
+            "Apply Link": f"https://example.com/jobs/{i}",
+            "Source": rng.choice(["JSearch API", "Adzuna API"]),
+            "Description": "Build and operate services in Python and Go. " * 20,
+        })
+    return rows
+
+
+def pandas_pipeline(rows):
+    """The DataFrame pipeline search_jobs_with_status used before JobRecord."""
+    import pandas as pd
+    jobs_df = pd.DataFrame(rows)
+    jobs_df = jobs_df[[col for col in DISPLAY_COLUMNS if col in jobs_df.columns]]
+    jobs_df = jobs_df.drop_duplicates(subset=["Job Title", "Company"])
+    jobs_df = jobs_df.sort_values("Date Posted", ascending=False)
+    return jobs_df.reset_index(drop=True).to_dict("records")
+
+
+def record_pipeline(rows):
+    """Providers now build JobRecords; clean, sort and serialize them."""
+    jobs = [
+        JobRecord(row["Job Title"], row["Company"], row["Location"], row["Job Type"], row["Salary"],
+                  row["Date Posted"], row["Apply Link"], row["Source"], row["Description"])
+        for row in rows
+    ]
+    return [job.to_dict() for job in JobSearcher._clean_jobs(jobs)[0]]
+
+
+def same_results(a, b) -> bool:
+    """Same jobs in the same date order; pandas' default sort does not keep tie order."""
+    key = lambda job: (job["Date Posted"], job["Apply Link"])  # noqa: E731
+    return (sorted(a, key=key) == sorted(b, key=key)
+            and [job["Date Posted"] for job in a] == [job["Date Posted"] for job in b])
+
+
+def cpu_us(fn, rows, iterations: int) -> float:
+    """Mean process CPU time of fn(rows) in microseconds."""
+    fn(rows)  # warm up imports and caches
+    started = time.process_time()
+    for _ in range(iterations):
+        fn(rows)
+    return (time.process_time() - started) / iterations * 1e6
+
+
+def main(iterations: int):
+    try:
+        import pandas  # noqa: F401
+        have_pandas = True
+    except ImportError:
+        have_pandas = False
+        print("pandas not installed: skipping the DataFrame baseline\n")
+
+    print(f"{'jobs':>5}  {'pandas (us)':>12}  {'records (us)':>13}  {'speedup':>8}")
+    for size in SIZES:
+        rows = provider_rows(size)
+        records = cpu_us(record_pipeline, rows, iterations)
+        if have_pandas:
+            baseline = cpu_us(pandas_pipeline, rows, iterations)
+            assert same_results(pandas_pipeline(rows), record_pipeline(rows))
+            print(f"{size:>5}  {baseline:>12.1f}  {records:>13.1f}  {baseline / records:>7.0f}x")
+        else:
+            print(f"{size:>5}  {'-':>12}  {records:>13.1f}  {'-':>8}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
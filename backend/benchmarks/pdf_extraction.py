@@ -0,0 +1,238 @@
+"""
+Benchmark the PDF text engines behind PDF_BACKEND.
+
+Generates a corpus of resume PDFs (the sample resumes from
+skill_extraction.py laid out at 1, 2 and 5 pages, with section headings
+and a two-column skills block) and runs it through every installed engine
+in PDF_BACKENDS. Each engine runs in a fresh process, as in the worker
+pool, and is reported with pages/sec, peak RSS, the number of tokens its
+text would send to the LLM and the share of the source words it recovers.
+Run from backend/:
+
+    python benchmarks/pdf_extraction.py [--repeat N] [--backends a,b] [resume.pdf ...]
+
+Given PDF files, those are used instead and word recall is not reported.
+Token counts use tiktoken's cl100k_base encoding if it is installed (and
+can be loaded) and a word/punctuation estimate otherwise.
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_extract import DEFAULT_PDF_BACKEND, PDF_BACKENDS, extract_pdf_text  # noqa: E402
+from skill_extraction import SAMPLE_RESUMES  # noqa: E402
+
+PAGE_COUNTS = (1, 2, 5)
+WORD = re.compile(r"\w+")
+
+
+def pdf_string(text: str) -> bytes:
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return b"(" + escaped.encode("latin-1", "replace") + b")"
+
+
+def show_text(text: str) -> bytes:
+    """
+    A TJ operator drawing ``text`` with the gaps between words as kerning
+    offsets rather than space characters, as LaTeX and most word processors
+    emit justified text. Engines must infer the spaces from the positions.
+    """
+    return b"[" + b" -300 ".join(pdf_string(word) for word in text.split(" ")) + b"] TJ"
+
+
+def build_pdf(pages) -> bytes:
+    """
+    A minimal PDF with one content stream per page.
+
+    ``pages`` is a list of pages, each a list of (font, size, x, y, text)
+    runs; font "F1" is Helvetica and "F2" Helvetica-Bold. Every run is
+    positioned absolutely, as most resume generators emit text.
+    """
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>"]
+    pages_id = 3 + 2 * len(pages)
+    page_ids = []
+    for runs in pages:
+        body = b"".join(
+            b"BT /%s %d Tf 1 0 0 1 %d %d Tm %s ET\n" % (font.encode(), size, x, y, show_text(text))
+            for font, size, x, y, text in runs
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(body), body))
+        objects.append(b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+                       b"/Resources << /Font << /F1 1 0 R /F2 2 0 R >> >> >>" % (pages_id, len(objects)))
+        page_ids.append(len(objects))
+    objects.append(b"<< /Type /Pages /Kids [%s] /Count %d >>"
+                   % (b" ".join(b"%d 0 R" % i for i in page_ids), len(pages)))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref)
+    return out
+
+
+def resume_lines(text: str):
+    """
+    (font, size, content) lines for a sample resume, None for a blank line.
+
+    Short lines after a blank are section headings; the comma list under a
+    skills heading is laid out as two columns (content is a (left, right) pair).
+    """
+    raw = text.strip().splitlines()
+    lines = [("F2", 18, raw[0]), ("F1", 12, raw[1])]
+    heading = ""
+    for i, line in enumerate(raw[2:], 2):
+        if not line:
+            lines.append(None)
+        elif not raw[i - 1] and len(line.split()) <= 3:
+            heading = line.lower()
+            lines.append(("F2", 11, line))
+        elif "," in line and ("skill" in heading or "stack" in heading):
+            items = [item.strip() for item in line.split(",")]
+            half = (len(items) + 1) // 2
+            lines.extend(("F1", 10, pair) for pair in itertools.zip_longest(items[:half], items[half:], fillvalue=""))
+        else:
+            lines.append(("F1", 10, line))
+    return lines
+
+
+def resume_pdf(text: str, page_count: int):
+    """A ``page_count``-page resume PDF and the text laid out in it; later pages repeat the body."""
+    lines = resume_lines(text)
+    flow = itertools.chain(lines, itertools.cycle(lines[2:]))
+    pages, laid_out = [], []
+    for _ in range(page_count):
+        runs, y = [], 750
+        while y > 60:
+            line = next(flow)
+            if line is None:
+                y -= 6
+                continue
+            font, size, content = line
+            if isinstance(content, tuple):
+                left, right = content
+                runs.append((font, size, 60, y, left))
+                if right:
+                    runs.append((font, size, 320, y, right))
+                laid_out.append(f"{left} {right}")
+            else:
+                runs.append((font, size, 50, y, content))
+                laid_out.append(content)
+            y -= size + 4
+        pages.append(runs)
+    return build_pdf(pages), "\n".join(laid_out)
+
+
+def generated_corpus():
+    """(label, pdf bytes, source text) for every sample resume at every page count."""
+    return [
+        (f"{name}-{pages}p", *resume_pdf(text, pages))
+        for name, text in SAMPLE_RESUMES.items()
+        for pages in PAGE_COUNTS
+    ]
+
+
+def run_backend(backend: str, pdfs, repeat: int) -> dict:
+    """Extract every PDF ``repeat`` times in this (fresh) process; returns timings, RSS and texts."""
+    import resource
+
+    PDF_BACKENDS[backend]().page_texts(pdfs[0], 1000)  # import the engine outside the timing
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    seconds = []
+    texts = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        texts = [extract_pdf_text(pdf, max_pages=1000, timeout=120, backend=backend) for pdf in pdfs]
+        seconds.append(time.perf_counter() - started)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"seconds": statistics.median(seconds), "rss_mb": rss_after / 1024,
+            "rss_delta_mb": (rss_after - rss_before) / 1024, "texts": texts}
+
+
+def token_counter():
+    """A token counting function and its label: tiktoken cl100k_base, or an estimate."""
+    try:
+        import tiktoken
+        # Downloads the encoding on first use
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Words, punctuation and whitespace runs each cost about one token
+        pattern = re.compile(r"\w+|[^\w\s]|\s{2,}")
+        return (lambda text: len(pattern.findall(text))), "estimated (tiktoken cl100k_base unavailable)"
+    return (lambda text: len(encoding.encode(text))), "tiktoken cl100k_base"
+
+
+def word_recall(source: str, text: str) -> float:
+    """Share of the source's words (with multiplicity) that appear in the extracted text."""
+    expected = Counter(word.lower() for word in WORD.findall(source))
+    found = Counter(word.lower() for word in WORD.findall(text))
+    return sum((expected & found).values()) / sum(expected.values())
+
+
+def page_count(pdf: bytes) -> int:
+    return len(PDF_BACKENDS[DEFAULT_PDF_BACKEND]().page_texts(pdf, 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="*", help="PDF files to use instead of the generated corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backends", default=",".join(PDF_BACKENDS))
+    args = parser.parse_args()
+
+    if args.paths:
+        corpus = [(os.path.basename(path), open(path, "rb").read(), None) for path in args.paths]
+    else:
+        corpus = generated_corpus()
+    pdfs = [pdf for _, pdf, _ in corpus]
+    total_pages = sum(page_count(pdf) for pdf in pdfs)
+    count_tokens, token_label = token_counter()
+
+    print(f"corpus: {len(pdfs)} PDFs, {total_pages} pages, {sum(map(len, pdfs)) / 1024:.0f} KB; "
+          f"tokens: {token_label}")
+    sources = [source for _, _, source in corpus]
+    if all(sources):
+        print(f"source text: {sum(count_tokens(source) for source in sources)} tokens\n")
+    else:
+        print()
+
+    print(f"{'backend':<10}  {'pages/s':>8}  {'peak RSS MB':>11}  {'+RSS MB':>7}  {'tokens':>7}  {'recall':>6}")
+    spawn = multiprocessing.get_context("spawn")
+    for backend in args.backends.split(","):
+        if backend not in PDF_BACKENDS:
+            print(f"{backend:<10}  unknown backend")
+            continue
+        engine = PDF_BACKENDS[backend]
+        if not engine.available():
+            print(f"{backend:<10}  not installed (pip install {engine.package or engine.module})")
+            continue
+        # A fresh process per engine, so RSS and import state do not carry over
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+            result = pool.submit(run_backend, backend, pdfs, args.repeat).result()
+        tokens = sum(count_tokens(text) for text in result["texts"])
+        recall = (f"{statistics.mean(word_recall(s, t) for s, t in zip(sources, result['texts'])):.3f}"
+                  if all(sources) else "-")
+        print(f"{backend:<10}  {total_pages / result['seconds']:>8.0f}  {result['rss_mb']:>11.1f}  "
+              f"{result['rss_delta_mb']:>7.1f}  {tokens:>7}  {recall:>6}")
+
+
+if __name__ == "__main__":
+    main()
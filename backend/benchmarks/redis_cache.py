@@ -0,0 +1,170 @@
+"""
+Check and benchmark RedisCache against a local stand-in server.
+
+Starts a throwaway Redis-protocol server (redis-server from PATH if there
+is one, else fakeredis's TCP server), then checks that values round-trip
+(including compressed ones), that TTLs and the stale-while-revalidate
+grace window are enforced by the server, and that a server that never
+answers is a counted miss which does not stall the event loop. Finally
+reports aget/aset latency. Run from backend/:
+
+    python benchmarks/redis_cache.py [--url redis://host:port/0] [--ops N]
+
+With --url an existing server is used instead of starting one. Exits
+non-zero if a check fails, so it can gate CI. Needs the redis package, and
+fakeredis when redis-server is not installed.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from cache import COMPRESS_MIN_BYTES, RedisCache  # noqa: E402
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def stand_in_server():
+    """Yield the URL of a throwaway local server, stopping it afterwards."""
+    port = free_port()
+    if shutil.which("redis-server"):
+        process = subprocess.Popen(["redis-server", "--port", str(port), "--save", "", "--appendonly", "no"],
+                                   stdout=subprocess.DEVNULL)
+        try:
+            for _ in range(50):
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            yield f"redis://127.0.0.1:{port}/0", "redis-server"
+        finally:
+            process.terminate()
+            process.wait()
+        return
+    try:
+        from fakeredis import TcpFakeServer
+    except ImportError:
+        sys.exit("Needs redis-server on PATH or the fakeredis package (pip install fakeredis)")
+    server = TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"redis://127.0.0.1:{port}/0", "fakeredis"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def silent_server():
+    """Yield the URL of a server that accepts connections but never replies, like a hung Redis."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(64)
+        yield f"redis://127.0.0.1:{sock.getsockname()[1]}/0"
+
+
+failures = []
+
+
+def check(name: str, ok: bool, detail: str = ""):
+    print(f"{'ok  ' if ok else 'FAIL'} {name}" + (f" ({detail})" if detail else ""))
+    if not ok:
+        failures.append(name)
+
+
+async def max_loop_lag_ms(work) -> float:
+    """Run ``work`` while a 10 ms ticker measures the event loop's worst scheduling delay."""
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append((time.perf_counter() - started - 0.01) * 1000)
+
+    task = asyncio.ensure_future(ticker())
+    await work
+    done.set()
+    await task
+    return max(lags)
+
+
+async def run_checks(url: str, ops: int):
+    cache = RedisCache(url, ttl_seconds=60, name="check")
+    cache.clear()
+    small = {"analysis": "fits", "score": 1}
+    large = {"analysis": "x" * (COMPRESS_MIN_BYTES * 4)}
+    await cache.aset("small", small)
+    await cache.aset("large", large)
+    check("round trip", await cache.aget("small") == small and await cache.aget("large") == large)
+    check("miss", await cache.aget("absent") is None and cache.misses == 1)
+
+    short = RedisCache(url, ttl_seconds=1, name="check-ttl")
+    await short.aset("key", small)
+    grace = RedisCache(url, ttl_seconds=1, name="check-stale", stale_seconds=30)
+    await grace.aset("key", small)
+    check("fresh within TTL", await short.aget("key") == small and await grace.aget_stale("key") == (small, False))
+    await asyncio.sleep(1.2)
+    check("server expires TTL", await short.aget("key") is None)
+    check("stale inside grace window", await grace.aget_stale("key") == (small, True) and await grace.aget("key") is None,
+          f"stale_hits={grace.stale_hits}")
+
+    # Each call waits out the 250 ms socket timeout; the loop must keep running meanwhile
+    logging.getLogger("cache").setLevel(logging.ERROR)
+    with silent_server() as hung_url:
+        down = RedisCache(hung_url, name="check-down", socket_timeout=0.25)
+        lag = await max_loop_lag_ms(asyncio.gather(*[down.aget(f"k{i}") for i in range(8)], down.aset("k", small)))
+    check("hung server is a miss", down.errors == 9 and down.misses == 8, f"errors={down.errors}")
+    check("hung server does not block the loop", lag < 100, f"max loop lag {lag:.0f} ms")
+
+    get_us, set_us = [], []
+    for i in range(ops):
+        started = time.perf_counter()
+        await cache.aset(f"bench{i % 100}", small)
+        set_us.append((time.perf_counter() - started) * 1e6)
+        started = time.perf_counter()
+        await cache.aget(f"bench{i % 100}")
+        get_us.append((time.perf_counter() - started) * 1e6)
+    print(f"\naget: median {statistics.median(get_us):.0f} us, aset: median {statistics.median(set_us):.0f} us "
+          f"over {ops} ops")
+    cache.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--ops", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.url:
+        print(f"server: {args.url}\n")
+        asyncio.run(run_checks(args.url, args.ops))
+    else:
+        with stand_in_server() as (url, kind):
+            print(f"server: {kind} at {url}\n")
+            asyncio.run(run_checks(url, args.ops))
+    if failures:
+        print(f"\nFAIL: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark the local taxonomy skill extractor against the LLM extractor.
+
+Reports local extraction latency and, when GROQ_API_KEY is set, the LLM
+latency and how much the two skill lists overlap. Run from backend/:
+
+    python benchmarks/skill_extraction.py [resume.txt ...]
+
+Without arguments a few built-in sample resumes are used.
+"""
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+from skill_extractor import SkillExtractor  # noqa: E402
+
+SAMPLE_RESUMES = {
+    "backend_engineer": """Alex Kim
+Senior Software Engineer
+
+SUMMARY
+Backend engineer with 7 years of experience building distributed systems and REST APIs.
+
+TECHNICAL SKILLS
+Python, Go, PostgreSQL, Redis, Kafka, Docker, Kubernetes, AWS, Terraform, gRPC
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp
+- Designed microservices in Python and Golang serving 20k requests/second
+- Migrated CI/CD to GitHub Actions and cut deploy time by 60%
+- Led a team of 4 engineers; mentored 2 junior developers
+Software Engineer, Initech
+- Built data pipelines with Airflow and Spark on AWS
+
+EDUCATION
+B.S. Computer Science
+""",
+    "data_scientist": """Priya Nair
+Data Scientist
+
+PROFILE
+Data scientist focused on machine learning and NLP for e-commerce.
+
+SKILLS
+Python, SQL, Pandas, NumPy, scikit-learn, PyTorch, TensorFlow, Tableau, A/B testing, Statistics
+
+PROFESSIONAL EXPERIENCE
+Data Scientist, ShopCo
+- Built recommendation models with PyTorch, lifting CTR by 8%
+- Ran A/B tests and statistical analysis for pricing experiments
+- Deployed models on Databricks with Spark
+Data Analyst, RetailX
+- Built Power BI and Tableau dashboards for executive reporting
+
+EDUCATION
+M.S. Statistics
+""",
+    "frontend_developer": """Sam Lee
+Frontend Developer
+
+About
+Front-end developer who ships accessible, fast web apps.
+
+Tech Stack
+JavaScript, TypeScript, React, Next.js, Redux, Tailwind CSS, HTML, CSS, Figma, Jest
+
+Work Experience
+Frontend Developer, Pixel Labs
+- Rebuilt the marketing site in Next.js, improving Lighthouse scores to 98
+- Built a design system in React and Figma with the UX team
+- Wrote unit tests with Jest; introduced TDD to the team
+
+Projects
+- Personal finance tracker in React Native with Firebase
+""",
+}
+
+
+def time_call(fn, repeat: int):
+    """Median wall time of fn() in milliseconds, and its last result."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def overlap(local, llm):
+    """Jaccard similarity and recall of the LLM skills, case-insensitive."""
+    a = {s.lower() for s in local}
+    b = {s.lower() for s in llm}
+    if not a and not b:
+        return 1.0, 1.0
+    return len(a & b) / len(a | b), (len(a & b) / len(b) if b else 0.0)
+
+
+def main(paths):
+    resumes = SAMPLE_RESUMES
+    if paths:
+        resumes = {}
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                resumes[os.path.basename(path)] = f.read()
+
+    started = time.perf_counter()
+    extractor = SkillExtractor()
+    print(f"Automaton build: {(time.perf_counter() - started) * 1000:.2f} ms\n")
+
+    job_searcher = None
+    if os.getenv("GROQ_API_KEY"):
+        from job_search import JobSearcher
+        job_searcher = JobSearcher(os.environ["GROQ_API_KEY"])
+    else:
+        print("GROQ_API_KEY not set: skipping LLM comparison\n")
+
+    for name, text in resumes.items():
+        local_ms, local_skills = time_call(lambda: extractor.extract(text), repeat=200)
+        print(f"== {name} ({len(text)} chars)")
+        print(f"  local: {local_ms:.3f} ms  {local_skills}")
+
+        if job_searcher is not None:
+            llm_ms, llm_skills = time_call(lambda: job_searcher.extract_skills_from_resume(text), repeat=1)
+            jaccard, recall = overlap(local_skills, llm_skills)
+            print(f"  llm:   {llm_ms:.0f} ms  {llm_skills}")
+            print(f"  overlap: jaccard {jaccard:.2f}, recall of LLM skills {recall:.2f}, "
+                  f"speedup {llm_ms / max(local_ms, 1e-6):.0f}x")
+        print()
+
+    if job_searcher is not None:
+        job_searcher.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+"""
+Benchmark backend cold start: time to import main and resident memory.
+
+Each run imports main in a fresh interpreter and reports the import time,
+peak RSS and whether any deferred module (numpy, pandas, bs4, groq,
+streamlit, PyPDF2) was loaded. The import cost those modules would add is
+measured in the same process afterwards. Run from backend/:
+
+    python benchmarks/startup.py [--runs N] [--budget-ms MS]
+
+With --budget-ms the script exits non-zero if the median import time is
+over budget or a deferred module was imported, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFERRED_MODULES = ("numpy", "pandas", "bs4", "groq", "streamlit", "PyPDF2")
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import main
+import_ms = (time.perf_counter() - started) * 1000
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+loaded = [m for m in DEFERRED if m in sys.modules]
+deferred_ms = {}
+for name in DEFERRED:
+    if name in sys.modules:
+        continue
+    started = time.perf_counter()
+    try:
+        __import__(name)
+    except ImportError:
+        continue
+    deferred_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+print(json.dumps({"import_ms": import_ms, "rss_mb": rss_kb / 1024, "loaded": loaded, "deferred_ms": deferred_ms}))
+"""
+
+
+def run_probe() -> dict:
+    """Import main in a fresh interpreter and return its measurements."""
+    env = dict(os.environ)
+    # main refuses to start without a key; the benchmark never calls the API
+    env.setdefault("GROQ_API_KEY", "benchmark")
+    result = subprocess.run(
+        [sys.executable, "-c", f"DEFERRED = {DEFERRED_MODULES!r}\n{PROBE}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    run_probe()  # warm the bytecode and filesystem caches
+    runs = [run_probe() for _ in range(args.runs)]
+    import_ms = [r["import_ms"] for r in runs]
+    rss_mb = [r["rss_mb"] for r in runs]
+    loaded = sorted({m for r in runs for m in r["loaded"]})
+
+    print(f"import main: median {statistics.median(import_ms):.0f} ms, "
+          f"min {min(import_ms):.0f} ms over {args.runs} runs")
+    print(f"peak RSS:    median {statistics.median(rss_mb):.1f} MB")
+    print(f"deferred modules loaded at startup: {', '.join(loaded) or 'none'}")
+    for name, ms in runs[-1]["deferred_ms"].items():
+        print(f"  {name:<10} {ms:>6.1f} ms deferred to first use")
+
+    if args.budget_ms is not None:
+        over = statistics.median(import_ms) > args.budget_ms
+        if over or loaded:
+            print(f"FAIL: budget {args.budget_ms:.0f} ms" + (f", eagerly loaded {loaded}" if loaded else ""))
+            sys.exit(1)
+        print(f"OK: within {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,574 @@
+"""
+Response caches for the Agragrati API.
+
+LRUCache is the default per-process backend. Set CACHE_BACKEND=redis (with
+REDIS_URL) to share cached LLM results between uvicorn workers and replicas.
+SQLiteResponseStore persists raw completions on disk so they survive restarts.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes."""
+    try:
+        return len(json.dumps(value, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+# Values above this many bytes are zlib-compressed before they go over the wire
+COMPRESS_MIN_BYTES = 1024
+
+
+def encode_value(value: Any) -> bytes:
+    """Serialize a cache value as compact JSON, compressing large payloads."""
+    data = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+    if len(data) >= COMPRESS_MIN_BYTES:
+        return b"z" + zlib.compress(data)
+    return b"j" + data
+
+
+def decode_value(raw: bytes) -> Any:
+    """Inverse of encode_value."""
+    data = raw[1:]
+    if raw[:1] == b"z":
+        data = zlib.decompress(data)
+    return json.loads(data)
+
+
+class CacheBackend:
+    """
+    Interface shared by the response cache backends.
+
+    get returns None on a miss; set stores a JSON-serializable value for the
+    backend's TTL. Backends count their own hits and misses for /metrics.
+    Request handlers use the async variants (aget, aget_stale, aset): the
+    in-process backends answer them directly, network backends must not
+    block the event loop.
+    """
+
+    name: str = "cache"
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any):
+        raise NotImplementedError
+
+    def get_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Stale-while-revalidate lookup: returns (value, is_stale).
+
+        Backends with a grace window return expired entries still inside it
+        with ``is_stale`` set; the default only ever returns fresh entries.
+        """
+        return self.get(key), False
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aget_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        return self.get_stale(key)
+
+    async def aset(self, key: str, value: Any):
+        self.set(key, value)
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _hash_key(self, key: str) -> str:
+        return hashlib.md5(key.encode()).hexdigest()
+
+
+class LRUCache(CacheBackend):
+    """
+    LRU cache with lazy TTL expiry and a memory budget in bytes.
+
+    get and set are O(1): entries live in an OrderedDict in recency order, so
+    eviction pops from the front until the byte budget is met again. Expired
+    entries are dropped when they are next read or when they reach the front.
+    With ``stale_seconds`` set, expired entries are kept for that grace window
+    and returned by get_stale as stale.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, max_bytes: int = 8 * 1024 * 1024, name: str = "cache",
+                 stale_seconds: int = 0):
+        self.name = name
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._lookup(key, allow_stale=False)[0]
+
+    def get_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        return self._lookup(key, allow_stale=True)
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        hashed = self._hash_key(key)
+        stale = False
+        with self._lock:
+            entry = self._entries.get(hashed)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            value, expires_at, size = entry
+            now = time.monotonic()
+            if now >= expires_at:
+                if now >= expires_at + self._stale:
+                    del self._entries[hashed]
+                    self._bytes -= size
+                    self.expirations += 1
+                    self.misses += 1
+                    return None, False
+                if not allow_stale:
+                    self.misses += 1
+                    return None, False
+                stale = True
+            self._entries.move_to_end(hashed)
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+        logger.info(f"Cache {'stale ' if stale else ''}hit for key: {hashed[:8]}...")
+        return value, stale
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """Store ``value``; ``ttl_seconds`` shortens its lifetime below the cache's TTL."""
+        hashed = self._hash_key(key)
+        size = estimate_size(value) + len(hashed)
+        if size > self._max_bytes:
+            logger.info(f"Not caching {size} byte value in {self.name}: larger than budget")
+            return
+        with self._lock:
+            old = self._entries.pop(hashed, None)
+            if old is not None:
+                self._bytes -= old[2]
+            ttl = self._ttl if ttl_seconds is None else min(self._ttl, ttl_seconds)
+            self._entries[hashed] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            # Evict least recently used entries until back under budget
+            while self._bytes > self._max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint."""
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache backend on a Redis-protocol key-value server.
+
+    Values are stored with encode_value and expire through SET ... EX, so TTLs
+    are enforced by the server. With ``stale_seconds`` set, the server keeps
+    each key for ttl + grace and the value is wrapped with its soft expiry
+    time so get_stale can tell fresh from stale. Any server error is logged
+    and treated as a miss so the API keeps working, uncached, if the server
+    goes away. The client is synchronous, so the async variants run each
+    call in a worker thread and a slow or unreachable server never stalls
+    the event loop.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 300, name: str = "cache",
+                 namespace: str = "agragrati", socket_timeout: float = 0.25,
+                 stale_seconds: int = 0):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package (pip install redis)")
+
+        self.name = name
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._prefix = f"{namespace}:{name}:"
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout
+        )
+        self._errors = (redis.RedisError, OSError)
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._lookup(key, allow_stale=False)[0]
+
+    def get_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        return self._lookup(key, allow_stale=True)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aget_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        return await asyncio.to_thread(self.get_stale, key)
+
+    async def aset(self, key: str, value: Any):
+        await asyncio.to_thread(self.set, key, value)
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        hashed = self._hash_key(key)
+        try:
+            raw = self._client.get(self._prefix + hashed)
+        except self._errors as e:
+            self.errors += 1
+            self.misses += 1
+            logger.warning(f"Redis cache get failed for {self.name}: {e}")
+            return None, False
+        if raw is None:
+            self.misses += 1
+            return None, False
+        value = decode_value(raw)
+        stale = False
+        if self._stale:
+            # Entries written before stale mode was enabled are not wrapped; treat them as misses
+            if not (isinstance(value, list) and len(value) == 2 and isinstance(value[0], (int, float))):
+                self.misses += 1
+                return None, False
+            fresh_until, value = value
+            stale = time.time() >= fresh_until
+            if stale and not allow_stale:
+                self.misses += 1
+                return None, False
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        logger.info(f"Cache {'stale ' if stale else ''}hit for key: {hashed[:8]}...")
+        return value, stale
+
+    def set(self, key: str, value: Any):
+        try:
+            if self._stale:
+                payload = encode_value([time.time() + self._ttl, value])
+            else:
+                payload = encode_value(value)
+            self._client.set(self._prefix + self._hash_key(key), payload, ex=self._ttl + self._stale)
+        except self._errors as e:
+            self.errors += 1
+            logger.warning(f"Redis cache set failed for {self.name}: {e}")
+
+    def clear(self):
+        try:
+            keys = list(self._client.scan_iter(match=self._prefix + "*", count=500))
+            if keys:
+                self._client.delete(*keys)
+        except self._errors as e:
+            self.errors += 1
+            logger.warning(f"Redis cache clear failed for {self.name}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint."""
+        return {
+            "backend": "redis",
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "errors": self.errors
+        }
+
+
+class SQLiteResponseStore(CacheBackend):
+    """
+    Persistent response store in a single SQLite file in WAL mode.
+
+    Keys are stored as given (callers pass a fingerprint of model, parameters
+    and prompt). Expired rows are skipped on read. Every ``compact_every``
+    writes the store deletes expired rows and then the least recently used
+    rows until the file holds at most ``max_bytes`` of values.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 86400, max_bytes: int = 256 * 1024 * 1024,
+                 name: str = "responses", compact_every: int = 100):
+        self.name = name
+        self.path = path
+        self._ttl = ttl_seconds
+        self._max_bytes = max_bytes
+        self._compact_every = compact_every
+        self._writes_since_compact = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self.hits = 0
+        self.misses = 0
+        self.compactions = 0
+        self.compact()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_with_ttl(key)[0]
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[Any], float]:
+        """The value for ``key`` and the seconds it has left, or (None, 0) on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None, 0.0
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return decode_value(row[0]), row[1] - now
+
+    def set(self, key: str, value: Any):
+        data = encode_value(value)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), now + self._ttl, now)
+            )
+            self._writes_since_compact += 1
+            due = self._writes_since_compact >= self._compact_every
+        if due:
+            self.compact()
+
+    def compact(self):
+        """Drop expired rows, then least recently used rows over the byte budget."""
+        with self._lock:
+            self._writes_since_compact = 0
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self._max_bytes:
+                # Walk from the oldest access time until enough bytes are freed
+                excess = total - self._max_bytes
+                cutoff = None
+                freed = 0
+                for accessed_at, size in self._conn.execute(
+                    "SELECT accessed_at, size FROM responses ORDER BY accessed_at"
+                ):
+                    freed += size
+                    cutoff = accessed_at
+                    if freed >= excess:
+                        break
+                self._conn.execute("DELETE FROM responses WHERE accessed_at <= ?", (cutoff,))
+            self.compactions += 1
+
+    def recent(self, limit: int) -> List[Tuple[str, Any, float]]:
+        """Most recently used unexpired entries, newest first, with the seconds each has left."""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, expires_at FROM responses WHERE expires_at > ? "
+                "ORDER BY accessed_at DESC LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        return [(key, decode_value(value), expires_at - now) for key, value, expires_at in rows]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint."""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "compactions": self.compactions
+        }
+
+
+class TieredCache(CacheBackend):
+    """
+    In-memory LRU in front of a persistent store.
+
+    Reads fall through to the persistent tier and promote hits into memory
+    for the time they have left on disk; writes go to both. The async
+    variants run the SQLite work in a thread so it stays off the event loop.
+    ``warm`` preloads the memory tier at startup.
+    """
+
+    def __init__(self, memory: LRUCache, persistent: SQLiteResponseStore):
+        self.name = memory.name
+        self.memory = memory
+        self.persistent = persistent
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        return self._promote(key, *self.persistent.get_with_ttl(key))
+
+    def set(self, key: str, value: Any):
+        self.memory.set(key, value)
+        self.persistent.set(key, value)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        return self._promote(key, *await asyncio.to_thread(self.persistent.get_with_ttl, key))
+
+    async def aset(self, key: str, value: Any):
+        self.memory.set(key, value)
+        await asyncio.to_thread(self.persistent.set, key, value)
+
+    def _promote(self, key: str, value: Optional[Any], ttl_seconds: float) -> Optional[Any]:
+        if value is not None:
+            self.memory.set(key, value, ttl_seconds=ttl_seconds)
+        return value
+
+    def warm(self, limit: int) -> int:
+        """Load up to ``limit`` recent entries from disk into memory."""
+        entries = self.persistent.recent(limit)
+        # Insert oldest first so the newest end up most recently used
+        for key, value, ttl_seconds in reversed(entries):
+            self.memory.set(key, value, ttl_seconds=ttl_seconds)
+        logger.info(f"Warmed {self.name} with {len(entries)} entries from {self.persistent.path}")
+        return len(entries)
+
+    def clear(self):
+        self.memory.clear()
+        self.persistent.clear()
+
+    def close(self):
+        self.persistent.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint."""
+        return {
+            "backend": "tiered",
+            "memory": self.memory.stats(),
+            "persistent": self.persistent.stats()
+        }
+
+
+def make_cache(name: str, ttl_seconds: int, max_bytes: int, stale_seconds: int = 0) -> CacheBackend:
+    """Build the cache backend selected by CACHE_BACKEND (memory or redis)."""
+    backend = os.getenv("CACHE_BACKEND", "memory").lower()
+    if backend == "redis":
+        return RedisCache(
+            os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            ttl_seconds=ttl_seconds,
+            name=name,
+            socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.25")),
+            stale_seconds=stale_seconds
+        )
+    if backend != "memory":
+        raise RuntimeError(f"Unknown CACHE_BACKEND: {backend}")
+    return LRUCache(ttl_seconds=ttl_seconds, max_bytes=max_bytes, name=name, stale_seconds=stale_seconds)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent async calls that share a key into a single execution.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it is in flight await the same task instead of starting their own.
+    The task is shielded, so a caller disconnecting does not cancel the work
+    for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.info(f"Joining in-flight request for key: {key[:24]}...")
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def _done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for the /metrics endpoint."""
+        return {
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced
+        }
+
+
+def make_response_cache(name: str, ttl_seconds: int, max_bytes: int, path: Optional[str] = None,
+                        disk_max_bytes: int = 256 * 1024 * 1024) -> CacheBackend:
+    """Build the completion cache: memory only, or memory over SQLite when ``path`` is set."""
+    memory = LRUCache(ttl_seconds=ttl_seconds, max_bytes=max_bytes, name=name)
+    if not path:
+        return memory
+    return TieredCache(memory, SQLiteResponseStore(path, ttl_seconds=ttl_seconds, max_bytes=disk_max_bytes, name=name))
@@ -0,0 +1,160 @@
+"""
+Incremental JSON scanning for streamed LLM completions.
+
+JSONItemStream is fed completion deltas as they arrive and returns each
+element of an outermost JSON array the moment its closing character is
+seen, so a client can render interview questions or missing keywords one
+by one instead of waiting for the full document.
+"""
+import json
+from typing import Any, Dict, List, Optional
+
+
+class _Frame:
+    """An open object or array on the scanner stack."""
+
+    __slots__ = ("kind", "start", "key", "expect_key", "index", "value_start")
+
+    def __init__(self, kind: str, start: int):
+        self.kind = kind
+        self.start = start
+        self.key: Optional[str] = None
+        self.expect_key = kind == "{"
+        self.index = 0
+        # Start offset of a bare scalar (number, true/false/null) inside an array
+        self.value_start: Optional[int] = None
+
+
+class JSONItemStream:
+    """
+    Scan a JSON document in chunks and emit completed array elements.
+
+    Only elements of the outermost arrays are emitted: for a root array that
+    is each of its elements, for an object it is each element of every array
+    reachable through object keys alone (e.g. ``missing_keywords`` or
+    ``skills_breakdown.technical_skills.matched``). Arrays nested inside an
+    array element arrive with their parent element.
+
+    Anything before the first ``{`` or ``[`` (a markdown fence, say) and
+    after the root value closes is ignored. Each emitted item is a dict with
+    ``field`` (dotted key path, or ``root`` for a root array), ``index`` and
+    ``value``.
+    """
+
+    def __init__(self, root: str = "items"):
+        self.root = root
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._done = False
+
+    @property
+    def finished(self) -> bool:
+        """True once the root value has closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of completion text; return items completed by it."""
+        if self._done or not chunk:
+            return []
+        self._text += chunk
+        items: List[Dict[str, Any]] = []
+        text = self._text
+        stack = self._stack
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._close_string(i, items)
+                continue
+
+            if not stack:
+                if ch in "{[":
+                    stack.append(_Frame(ch, i))
+                continue
+
+            top = stack[-1]
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                stack.append(_Frame(ch, i))
+            elif ch in "}]":
+                self._finish_scalar(top, i, items)
+                stack.pop()
+                if not stack:
+                    self._done = True
+                    self._pos = i + 1
+                    return items
+                self._close_value(top.start, i, items)
+            elif ch == ",":
+                self._finish_scalar(top, i, items)
+                if top.kind == "{":
+                    top.expect_key = True
+            elif ch == ":":
+                pass
+            elif not ch.isspace() and top.kind == "[" and top.value_start is None:
+                top.value_start = i
+
+        self._pos = len(text)
+        return items
+
+    def _field(self, depth: int) -> str:
+        """Dotted key path of the array at stack[depth]."""
+        keys = [frame.key for frame in self._stack[:depth] if frame.kind == "{"]
+        return ".".join(k for k in keys if k) or self.root
+
+    def _emittable_array(self) -> Optional[int]:
+        """Stack depth of the innermost open array if it is an outermost one."""
+        arrays = [d for d, frame in enumerate(self._stack) if frame.kind == "["]
+        if len(arrays) == 1 and arrays[0] == len(self._stack) - 1:
+            return arrays[0]
+        return None
+
+    def _emit(self, raw: str, items: List[Dict[str, Any]]) -> None:
+        depth = self._emittable_array()
+        if depth is None:
+            return
+        frame = self._stack[depth]
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        items.append({"field": self._field(depth), "index": frame.index, "value": value})
+        frame.index += 1
+
+    def _close_string(self, end: int, items: List[Dict[str, Any]]) -> None:
+        if not self._stack:
+            return
+        top = self._stack[-1]
+        raw = self._text[self._string_start:end + 1]
+        if top.kind == "{":
+            if top.expect_key:
+                try:
+                    top.key = json.loads(raw)
+                except json.JSONDecodeError:
+                    top.key = None
+                top.expect_key = False
+        else:
+            self._emit(raw, items)
+
+    def _close_value(self, start: int, end: int, items: List[Dict[str, Any]]) -> None:
+        if self._stack[-1].kind == "[":
+            self._emit(self._text[start:end + 1], items)
+
+    def _finish_scalar(self, frame: _Frame, end: int, items: List[Dict[str, Any]]) -> None:
+        if frame.kind == "[" and frame.value_start is not None:
+            raw = self._text[frame.value_start:end].strip()
+            frame.value_start = None
+            if raw:
+                self._emit(raw, items)
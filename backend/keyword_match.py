@@ -0,0 +1,262 @@
+"""
+Local keyword matching between a resume and a job description.
+
+KeywordMatcher scores the lexical half of /job-match without an LLM call:
+taxonomy skills and frequent n-grams are pulled from the job description,
+checked against the resume with vectorized NumPy set membership, and
+weighted by importance into a deterministic match score. The result has the
+same keys as the LLM match for the fields it can fill (match_score,
+match_level, matching_keywords, missing_keywords, skills_breakdown).
+
+KeywordMatcher.rank scores one resume against many job descriptions at once
+with BM25 over a (descriptions x resume terms) matrix. NumPy is imported on
+first use so that importing the app does not pay for it.
+"""
+import re
+import unicodedata
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from skill_extractor import JOB_TITLES, SOFT_SKILLS, SkillExtractor
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Tokens keep inner punctuation used by skill names: c++, c#, node.js, ci/cd, scikit-learn
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./\-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each either etc few for
+from further had has have having he her here hers him his how i if in into is it its itself just
+me more most my no nor not of off on once only or other our ours out over own same she should so
+some such than that the their theirs them then there these they this those through to too under
+until up very was we were what when where which while who whom why will with within would you your
+yours able ability across must may might strong excellent good great well new including include
+includes etc years year experience experienced work working works job role position candidate
+candidates team teams company opportunity responsibilities responsibility requirements required
+requirement preferred plus qualifications skills skill knowledge understanding proficiency
+proficient familiarity familiar looking join help using use used based related relevant environment
+day days week weeks time full part remote hybrid office equal employer benefits salary per
+""".split())
+
+# Importance label -> weight in the match score
+IMPORTANCE_WEIGHTS = {"Critical": 3.0, "Important": 2.0, "Nice to have": 1.0}
+
+MATCH_LEVELS = [
+    (85, "Excellent Match"),
+    (70, "Strong Match"),
+    (55, "Good Match"),
+    (35, "Weak Match"),
+    (0, "Poor Match"),
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with skill punctuation preserved."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def ngrams(tokens: List[str], n: int) -> List[str]:
+    """Space-joined n-grams whose first and last tokens are not stopwords."""
+    return [
+        " ".join(tokens[i:i + n])
+        for i in range(len(tokens) - n + 1)
+        if tokens[i] not in STOPWORDS and tokens[i + n - 1] not in STOPWORDS
+    ]
+
+
+def bm25_scores(query_tokens: List[str], documents: List[List[str]],
+                k1: float = 1.5, b: float = 0.75) -> "np.ndarray":
+    """
+    BM25 score of every tokenized document for one tokenized query.
+    
+    Only query terms can contribute, so the term-frequency matrix is
+    (documents x distinct query terms). Repeated query terms are damped with
+    log1p so a long query such as a resume is not dominated by its most
+    frequent words.
+    """
+    import numpy as np
+    if not documents:
+        return np.zeros(0)
+    query_counts = Counter(query_tokens)
+    vocab = {term: j for j, term in enumerate(query_counts)}
+    if not vocab:
+        return np.zeros(len(documents))
+
+    rows, cols = [], []
+    for i, doc in enumerate(documents):
+        for term in doc:
+            j = vocab.get(term)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+    tf = np.zeros((len(documents), len(vocab)))
+    np.add.at(tf, (rows, cols), 1)
+
+    n_docs = len(documents)
+    lengths = np.array([len(doc) for doc in documents], dtype=float)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+    query_weights = np.log1p(np.array(list(query_counts.values()), dtype=float))
+    norm = k1 * (1 - b + b * lengths / (lengths.mean() or 1.0))
+    return (tf * (k1 + 1) / (tf + norm[:, None])) @ (idf * query_weights)
+
+
+def match_level(score: int) -> str:
+    """Label for a 0-100 match score, on the scale the LLM match uses."""
+    for threshold, label in MATCH_LEVELS:
+        if score >= threshold:
+            return label
+    return MATCH_LEVELS[-1][1]
+
+
+class KeywordMatcher:
+    """Deterministic resume/job-description keyword scoring."""
+
+    def __init__(self, skill_extractor: Optional[SkillExtractor] = None, max_phrases: int = 15):
+        self.skill_extractor = skill_extractor or SkillExtractor()
+        self.max_phrases = max_phrases
+
+    def _phrases(self, tokens: List[str]) -> List[str]:
+        """Repeated job-description unigrams and bigrams that are not taxonomy skills."""
+        counts = Counter(t for t in ngrams(tokens, 1) if len(t) > 2 and not t.isdigit())
+        counts.update(ngrams(tokens, 2))
+        ranked = sorted(
+            ((phrase, count) for phrase, count in counts.items() if count > 1),
+            key=lambda item: (-item[1] * len(item[0].split()), item[0])
+        )
+        phrases = []
+        for phrase, _ in ranked:
+            if len(phrases) == self.max_phrases:
+                break
+            # Skills are already scored through the taxonomy, aliases included
+            if not self.skill_extractor.locate(phrase):
+                phrases.append(phrase)
+        return phrases
+
+    @staticmethod
+    def _context(resume_text: str, offset: int) -> str:
+        """The resume line containing a match, trimmed for display."""
+        start = resume_text.rfind("\n", 0, offset) + 1
+        end = resume_text.find("\n", offset)
+        line = resume_text[start:end if end != -1 else len(resume_text)].strip()
+        return line if len(line) <= 120 else line[:117] + "..."
+
+    def score(self, resume_text: str, job_description: str) -> Dict:
+        """Match keywords of ``job_description`` against ``resume_text``."""
+        import numpy as np
+        jd_skills = self.skill_extractor.locate(job_description)
+        resume_skills = self.skill_extractor.locate(resume_text)
+
+        resume_tokens = tokenize(resume_text)
+        resume_terms = np.array(sorted(set(ngrams(resume_tokens, 1)) | set(ngrams(resume_tokens, 2))), dtype=str)
+        phrases = self._phrases(tokenize(job_description))
+        # Skill offsets refer to the NFKC-normalized text
+        display_text = unicodedata.normalize("NFKC", resume_text)
+
+        keywords = list(jd_skills) + phrases
+        importance = (
+            ["Critical" if count > 1 else "Important" for count, _ in jd_skills.values()]
+            + ["Nice to have"] * len(phrases)
+        )
+        if not keywords:
+            return self._result(0, [], [], {})
+
+        is_skill = np.arange(len(keywords)) < len(jd_skills)
+        present = np.zeros(len(keywords), dtype=bool)
+        present[is_skill] = np.isin(np.array(list(jd_skills), dtype=str), np.array(list(resume_skills), dtype=str))
+        if phrases:
+            present[~is_skill] = np.isin(np.array(phrases, dtype=str), resume_terms)
+        weights = np.array([IMPORTANCE_WEIGHTS[label] for label in importance])
+        match_score = int(round(100 * weights[present].sum() / weights.sum()))
+
+        matching, missing = [], []
+        for keyword, label, found, skill in zip(keywords, importance, present, is_skill):
+            if found:
+                offset = resume_skills[keyword][1] if skill else display_text.lower().find(keyword)
+                matching.append({
+                    "keyword": keyword,
+                    "found_in_resume": True,
+                    "context": self._context(display_text, max(offset, 0))
+                })
+            else:
+                missing.append({
+                    "keyword": keyword,
+                    "importance": label,
+                    "suggestion": (
+                        f"The job description stresses {keyword}; add it to your skills or experience if you have it"
+                        if label == "Critical" else
+                        f"Mention {keyword} if it reflects your experience"
+                    )
+                })
+
+        breakdown = {}
+        for name, members in (
+            ("technical_skills", [k for k in jd_skills if k not in SOFT_SKILLS and k not in JOB_TITLES]),
+            ("soft_skills", [k for k in jd_skills if k in SOFT_SKILLS]),
+        ):
+            names = np.array(members, dtype=str)
+            hit = np.isin(names, np.array(list(resume_skills), dtype=str)) if members else np.zeros(0, dtype=bool)
+            breakdown[name] = {
+                "matched": names[hit].tolist(),
+                "missing": names[~hit].tolist(),
+                # Nothing required in this category counts as fully met
+                "match_percentage": int(round(100 * hit.mean())) if members else 100
+            }
+
+        return self._result(match_score, matching, missing, breakdown)
+
+    def rank(self, resume_text: str, descriptions: List[str]) -> List[Dict]:
+        """
+        Score one resume against many job descriptions in one pass.
+        
+        Returns one dict per description, in input order: ``relevance`` is its
+        BM25 score as a share of the resume's score against itself (0-100),
+        ``skill_coverage`` the share of the description's taxonomy skills found
+        in the resume, and ``match_score`` their mean. The resume is tokenized
+        and scanned once.
+        """
+        import numpy as np
+        all_tokens = tokenize(resume_text)
+        resume_tokens = [t for t in all_tokens if t not in STOPWORDS]
+        resume_skills = set(self.skill_extractor.locate(resume_text))
+        # The resume is scored as one more document so its self-score shares the
+        # IDF and length norm; scores do not depend on the batch's best match
+        scores = bm25_scores(resume_tokens, [tokenize(d) for d in descriptions] + [all_tokens])
+        bm25, self_score = scores[:-1], scores[-1]
+        relevance = (np.rint(np.minimum(100 * bm25 / self_score, 100)) if self_score > 0
+                     else np.zeros(len(descriptions)))
+
+        results = []
+        for description, rel in zip(descriptions, relevance):
+            jd_skills = self.skill_extractor.locate(description)
+            # Most-mentioned skills first
+            ordered = sorted(jd_skills, key=lambda k: (-jd_skills[k][0], jd_skills[k][1]))
+            matched = [k for k in ordered if k in resume_skills]
+            missing = [k for k in ordered if k not in resume_skills]
+            coverage = round(100 * len(matched) / len(ordered)) if ordered else 0
+            match_score = int(round((rel + coverage) / 2))
+            results.append({
+                "match_score": match_score,
+                "match_level": match_level(match_score),
+                "relevance": int(rel),
+                "skill_coverage": coverage,
+                "matched_skills": matched,
+                "missing_skills": missing,
+            })
+        return results
+
+    @staticmethod
+    def _result(match_score: int, matching: List[Dict], missing: List[Dict], breakdown: Dict) -> Dict:
+        empty = {"matched": [], "missing": [], "match_percentage": 100}
+        return {
+            "match_score": match_score,
+            "match_level": match_level(match_score),
+            "matching_keywords": matching,
+            "missing_keywords": missing,
+            "skills_breakdown": {
+                "technical_skills": breakdown.get("technical_skills", empty),
+                "soft_skills": breakdown.get("soft_skills", empty),
+            },
+        }
@@ -1,17 +1,19 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form
+from fastapi import FastAPI, HTTPException, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, List
-import PyPDF2
-import io
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, model_validator
+from typing import Any, Optional, List, Callable, Awaitable, AsyncIterator, Literal, Tuple, ClassVar, get_args
 import os
+import codecs
+import contextvars
 from dotenv import load_dotenv
 import sys
 import asyncio
 import hashlib
+import json
+import re
 import time
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor
 import logging
 
 # Configure logging
@@ -20,57 +22,102 @@ logger = logging.getLogger(__name__)
 
 # Add parent directory to path to import job_search
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from job_search import JobSearcher
-import groq
+from job_search import (JobSearcher, AICallError, LazyClient, call_groq_async, load_groq,
+                        stream_groq_async, resume_fingerprint)
+from cache import SingleFlight, TieredCache, make_cache, make_response_cache
+from json_stream import JSONItemStream
+from skill_extractor import SkillExtractor
+from keyword_match import KeywordMatcher
+from pdf_extract import DEFAULT_PDF_BACKEND, PDF_BACKENDS, PDFExtractionError, PDFExtractionPool, PDFPoolBusy
+from uploads import ReceivedUpload, UploadError, UploadTooLarge, receive_upload
 
 load_dotenv()
 
 app = FastAPI(title="Agragrati API", version="1.0.0")
 
-# Thread pool for running sync operations
-executor = ThreadPoolExecutor(max_workers=4)
-
-# Simple in-memory cache with TTL
-class SimpleCache:
-    def __init__(self, ttl_seconds: int = 300):  # 5 minute default TTL
-        self._cache = {}
-        self._ttl = ttl_seconds
-    
-    def _hash_key(self, key: str) -> str:
-        return hashlib.md5(key.encode()).hexdigest()
-    
-    def get(self, key: str):
-        hashed = self._hash_key(key)
-        if hashed in self._cache:
-            value, timestamp = self._cache[hashed]
-            if time.time() - timestamp < self._ttl:
-                logger.info(f"Cache hit for key: {hashed[:8]}...")
-                return value
-            else:
-                del self._cache[hashed]  # Expired
-        return None
-    
-    def set(self, key: str, value):
-        hashed = self._hash_key(key)
-        self._cache[hashed] = (value, time.time())
-        # Limit cache size to prevent memory issues
-        if len(self._cache) > 100:
-            # Remove oldest entries
-            sorted_items = sorted(self._cache.items(), key=lambda x: x[1][1])
-            for old_key, _ in sorted_items[:20]:
-                del self._cache[old_key]
-    
-    def clear(self):
-        self._cache.clear()
-
-# Initialize caches
-resume_analysis_cache = SimpleCache(ttl_seconds=600)  # 10 min for resume analysis
-career_insights_cache = SimpleCache(ttl_seconds=900)  # 15 min for career insights
-interview_questions_cache = SimpleCache(ttl_seconds=600)  # 10 min for interview questions
+# Initialize caches (in-memory LRU by default, shared Redis with CACHE_BACKEND=redis)
+resume_analysis_cache = make_cache("resume_analysis", ttl_seconds=600, max_bytes=8 * 1024 * 1024)  # 10 min for resume analysis
+# Career insights are served stale for up to CAREER_INSIGHTS_STALE_SECONDS after expiry while
+# a background task refreshes them (0 disables stale-while-revalidate)
+CAREER_INSIGHTS_STALE_SECONDS = int(os.getenv("CAREER_INSIGHTS_STALE_SECONDS", "3600"))
+career_insights_cache = make_cache("career_insights", ttl_seconds=900, max_bytes=8 * 1024 * 1024,
+                                   stale_seconds=CAREER_INSIGHTS_STALE_SECONDS)  # 15 min for career insights
+interview_questions_cache = make_cache("interview_questions", ttl_seconds=600, max_bytes=4 * 1024 * 1024)  # 10 min for interview questions
+# Extracted skills are small and stable per resume, so they outlive the analysis caches
+RESUME_SKILLS_TTL_SECONDS = int(os.getenv("RESUME_SKILLS_TTL_SECONDS", "3600"))
+resume_skills_cache = make_cache("resume_skills", ttl_seconds=RESUME_SKILLS_TTL_SECONDS, max_bytes=1024 * 1024)
+
+# Skill extraction mode: "llm" (Groq), "local" (offline taxonomy match) or "hybrid"
+# (local first, LLM only when fewer than LOCAL_SKILLS_MIN skills are found)
+SKILL_EXTRACTORS = ("llm", "local", "hybrid")
+SKILL_EXTRACTOR = os.getenv("SKILL_EXTRACTOR", "llm")
+if SKILL_EXTRACTOR not in SKILL_EXTRACTORS:
+    logger.warning(f"Unknown SKILL_EXTRACTOR {SKILL_EXTRACTOR!r}, using 'llm'")
+    SKILL_EXTRACTOR = "llm"
+LOCAL_SKILLS_MIN = int(os.getenv("LOCAL_SKILLS_MIN", "5"))
+JOB_MATCH_BATCH_MAX = int(os.getenv("JOB_MATCH_BATCH_MAX", "500"))
+JOB_MATCH_DEEP_DIVE_MAX = int(os.getenv("JOB_MATCH_DEEP_DIVE_MAX", "5"))
+skill_extractor = SkillExtractor()
+keyword_matcher = KeywordMatcher(skill_extractor)
+
+# Identical LLM requests in flight at the same time share one upstream call
+llm_flight = SingleFlight()
+
+# PDF parsing runs in worker processes so large uploads do not block the event loop
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_MAX_PENDING = int(os.getenv("PDF_MAX_PENDING", "8"))  # Queued + parsing; more are rejected with 503
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "20"))
+PDF_TIMEOUT_SECONDS = float(os.getenv("PDF_TIMEOUT_SECONDS", "10"))
+# Text engine: pypdf2 (default), pypdf, pymupdf, pypdfium2 or pdfminer; all but
+# pypdf2 are optional installs. Compare them with benchmarks/pdf_extraction.py
+PDF_BACKEND = os.getenv("PDF_BACKEND") or DEFAULT_PDF_BACKEND
+if PDF_BACKEND not in PDF_BACKENDS or not PDF_BACKENDS[PDF_BACKEND].available():
+    logger.warning(f"PDF_BACKEND {PDF_BACKEND!r} is unknown or not installed, using {DEFAULT_PDF_BACKEND!r}")
+    PDF_BACKEND = DEFAULT_PDF_BACKEND
+pdf_pool = PDFExtractionPool(workers=PDF_WORKERS, max_pending=PDF_MAX_PENDING,
+                             max_pages=PDF_MAX_PAGES, timeout=PDF_TIMEOUT_SECONDS,
+                             backend=PDF_BACKEND)
+
+# Uploads are streamed to a spool: memory up to UPLOAD_SPOOL_BYTES, then a temp
+# file in UPLOAD_TMP_DIR (system default if unset). Larger than UPLOAD_MAX_BYTES is rejected.
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(5 * 1024 * 1024)))
+UPLOAD_SPOOL_BYTES = int(os.getenv("UPLOAD_SPOOL_BYTES", str(1024 * 1024)))
+UPLOAD_TMP_DIR = os.getenv("UPLOAD_TMP_DIR") or None
+
+# Text extracted from uploads, keyed by a hash of the file bytes: re-uploading the
+# same file skips parsing, and clients can send its resume_id instead of the text
+UPLOADED_RESUME_TTL_SECONDS = int(os.getenv("UPLOADED_RESUME_TTL_SECONDS", "86400"))
+UPLOADED_RESUME_CACHE_MB = int(os.getenv("UPLOADED_RESUME_CACHE_MB", "16"))
+uploaded_resume_cache = make_cache("uploaded_resumes", ttl_seconds=UPLOADED_RESUME_TTL_SECONDS,
+                                   max_bytes=UPLOADED_RESUME_CACHE_MB * 1024 * 1024)
+# Identical files uploaded at the same time are parsed once
+upload_flight = SingleFlight()
 
 # Configuration
 AI_TIMEOUT_SECONDS = int(os.getenv("AI_TIMEOUT_SECONDS", "60"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "2"))
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "16"))  # In-flight completions per worker
+GROQ_MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "32"))  # Pooled HTTP connections to Groq
+GROQ_KEEPALIVE_SECONDS = float(os.getenv("GROQ_KEEPALIVE_SECONDS", "30"))
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "")  # SQLite file for persistent responses; unset disables
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+LLM_CACHE_WARM_ENTRIES = int(os.getenv("LLM_CACHE_WARM_ENTRIES", "500"))
+
+# Completion-level cache keyed by model, parameters and prompt, shared by every
+# LLM endpoint. With LLM_CACHE_PATH set it is backed by SQLite and survives restarts.
+llm_response_cache = make_response_cache(
+    "llm_responses",
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+    max_bytes=16 * 1024 * 1024,
+    path=LLM_CACHE_PATH,
+    disk_max_bytes=LLM_CACHE_MAX_MB * 1024 * 1024
+)
+# Set by stale-while-revalidate refreshes: their completions skip the cache
+# lookup, which would otherwise hand back the answer being refreshed
+bypass_completion_cache: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "bypass_completion_cache", default=False
+)
 
 app = FastAPI(title="Agragrati API", version="1.0.0")
 
@@ -106,8 +153,84 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 if not GROQ_API_KEY:
     raise RuntimeError("GROQ_API_KEY not found in environment variables")
 
-job_searcher = JobSearcher(GROQ_API_KEY)
-groq_client = groq.Client(api_key=GROQ_API_KEY)
+
+def make_async_groq_client():
+    """Async Groq client on a pooled HTTP connection. Retries are handled by
+    call_groq_with_timeout so the SDK's own retry loop is disabled."""
+    import httpx
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=GROQ_MAX_CONNECTIONS,
+            max_keepalive_connections=GROQ_MAX_CONNECTIONS,
+            keepalive_expiry=GROQ_KEEPALIVE_SECONDS
+        ),
+        timeout=httpx.Timeout(AI_TIMEOUT_SECONDS, connect=10.0)
+    )
+    return load_groq().AsyncGroq(api_key=GROQ_API_KEY, max_retries=0, http_client=http_client)
+
+
+# Built on the first AI request so startup and health checks skip the SDK import
+async_groq_client = LazyClient(make_async_groq_client)
+groq_semaphore = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+
+
+def completion_key(messages: List[dict], model: str, temperature: float, max_tokens: int) -> str:
+    """Fingerprint of a completion request: model, parameters and prompt"""
+    return hashlib.blake2b(
+        json.dumps([model, temperature, max_tokens, messages], sort_keys=True).encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+
+
+async def cached_completion(
+    messages: List[dict],
+    model: str = "llama-3.3-70b-versatile",
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    timeout: int = None,
+    retries: int = None,
+    validate: Optional[Callable[[str], Any]] = None
+) -> str:
+    """
+    Cache-aside Groq completion shared by every LLM endpoint.
+    
+    Looks the request up in llm_response_cache by a fingerprint of model,
+    parameters and messages; on a miss, identical concurrent requests share
+    one upstream call. The result is written back to the cache only once
+    ``validate`` (the caller's parser) accepts it, so a malformed reply is
+    retried on the next request instead of being served from the cache.
+    Inside a refresh (bypass_completion_cache set) the lookup is skipped.
+    
+    Raises:
+        AICallError on timeout or API errors; whatever ``validate`` raises
+        for a malformed completion
+    """
+    timeout = timeout or AI_TIMEOUT_SECONDS
+    retries = retries or MAX_RETRIES
+    
+    request_key = completion_key(messages, model, temperature, max_tokens)
+    if not bypass_completion_cache.get():
+        cached = await llm_response_cache.aget(request_key)
+        if cached is not None:
+            return cached
+    
+    async def _call():
+        content = await call_groq_async(
+            async_groq_client,
+            messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            retries=retries,
+            semaphore=groq_semaphore
+        )
+        if validate is not None:
+            validate(content)
+        await llm_response_cache.aset(request_key, content)
+        return content
+    
+    return await llm_flight.do(f"groq:{request_key}", _call)
 
 
 # Helper function for AI calls with timeout and retry
@@ -117,7 +240,8 @@ async def call_groq_with_timeout(
     temperature: float = 0.7,
     max_tokens: int = 2000,
     timeout: int = None,
-    retries: int = None
+    retries: int = None,
+    validate: Optional[Callable[[str], Any]] = None
 ) -> str:
     """
     Call Groq API with timeout and retry logic.
@@ -129,6 +253,7 @@ async def call_groq_with_timeout(
         max_tokens: Max tokens to generate
         timeout: Timeout in seconds (default: AI_TIMEOUT_SECONDS)
         retries: Number of retries (default: MAX_RETRIES)
+        validate: Parser the completion must pass before it is cached
     
     Returns:
         Generated text content
@@ -136,103 +261,358 @@ async def call_groq_with_timeout(
     Raises:
         HTTPException on timeout or API errors
     """
-    timeout = timeout or AI_TIMEOUT_SECONDS
-    retries = retries or MAX_RETRIES
-    
-    def _sync_call():
-        return groq_client.chat.completions.create(
+    try:
+        return await cached_completion(
+            messages,
             model=model,
-            messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            timeout=timeout,
+            retries=retries,
+            validate=validate
         )
+    except AICallError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+job_searcher = JobSearcher(
+    GROQ_API_KEY,
+    async_groq_client=async_groq_client,
+    ai_timeout=AI_TIMEOUT_SECONDS,
+    ai_retries=MAX_RETRIES,
+    ai_semaphore=groq_semaphore,
+    ai_completion=cached_completion
+)
+
+
+@app.on_event("startup")
+async def warm_response_cache():
+    if isinstance(llm_response_cache, TieredCache):
+        llm_response_cache.warm(LLM_CACHE_WARM_ENTRIES)
+
+
+@app.on_event("shutdown")
+async def close_clients():
+    if async_groq_client.built:
+        await async_groq_client.close()
+    job_searcher.close()
+    pdf_pool.shutdown()
+    if isinstance(llm_response_cache, TieredCache):
+        llm_response_cache.close()
+
+
+# Shared cap on concurrent section analyses started by /career-insights/all
+CAREER_INSIGHTS_CONCURRENCY = int(os.getenv("CAREER_INSIGHTS_CONCURRENCY", "4"))
+career_insights_semaphore = asyncio.Semaphore(CAREER_INSIGHTS_CONCURRENCY)
+
+def sse_event(event: str, data: dict) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an SSE generator; disables proxy buffering so tokens flush immediately"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def ndjson_response(lines: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap a newline-delimited JSON generator, unbuffered like sse_response"""
+    return StreamingResponse(
+        lines,
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def stream_job_search(
+    search_term: str,
+    location: str,
+    results_wanted: int,
+    job_type: Optional[str],
+    resume_text: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Emit one NDJSON ``batch`` line per provider as soon as it answers, then a
+    ``summary`` line with totals and per-provider timing. With ``resume_text``
+    jobs carry a ``Relevance`` score and each batch is sorted by it.
+    """
+    started = time.perf_counter()
+    providers = {}
+    count = 0
+    first_batch_ms = None
+    async for provider, jobs, status in job_searcher.search_jobs_progressive(
+        search_term, location, results_wanted, job_type, resume_text=resume_text
+    ):
+        providers[provider] = status
+        count += len(jobs)
+        if jobs and first_batch_ms is None:
+            first_batch_ms = round((time.perf_counter() - started) * 1000)
+        yield json.dumps({"event": "batch", "provider": provider, "jobs": jobs, "status": status}) + "\n"
+    
+    yield json.dumps({
+        "event": "summary",
+        "count": count,
+        "duplicates": sum(s.get("duplicates", 0) for s in providers.values()),
+        "first_batch_ms": first_batch_ms,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000),
+        "providers": providers
+    }) + "\n"
+
+
+async def stream_completion_events(
+    completion: dict,
+    build_result: Callable[[str], dict],
+    on_complete: Optional[Callable[[dict], Awaitable[None]]] = None,
+    cached_text: Optional[str] = None,
+    items: Optional[JSONItemStream] = None
+) -> AsyncIterator[str]:
+    """
+    Relay a Groq completion as SSE ``token`` events while it is generated.
     
-    last_error = None
-    for attempt in range(retries + 1):
+    With ``items`` set the completion is expected to be JSON: instead of raw
+    tokens an ``item`` event is sent for each array element as soon as it
+    closes. When generation finishes the assembled text is written to
+    llm_response_cache, ``on_complete`` receives the final result (for the
+    route's own cache) and a ``done`` event carries the same body the
+    non-streaming endpoint returns. Failures, including a result that
+    ``build_result`` cannot parse, are sent as an ``error`` event; such a
+    completion is not cached, so the next request asks the LLM again.
+    """
+    messages = completion["messages"]
+    model = completion.get("model", "llama-3.3-70b-versatile")
+    temperature = completion["temperature"]
+    max_tokens = completion["max_tokens"]
+    
+    request_key = completion_key(messages, model, temperature, max_tokens)
+    if cached_text is None:
+        cached_text = await llm_response_cache.aget(request_key)
+    
+    def relay(delta: str) -> List[str]:
+        if items is None:
+            return [sse_event("token", {"text": delta})]
+        return [sse_event("item", item) for item in items.feed(delta)]
+    
+    if cached_text is not None:
+        for event in relay(cached_text):
+            yield event
+        text = cached_text
+    else:
+        parts = []
         try:
-            logger.info(f"Groq API call attempt {attempt + 1}/{retries + 1}")
-            
-            # Run sync call in thread pool with timeout
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(executor, _sync_call),
-                timeout=timeout
-            )
-            
-            content = response.choices[0].message.content
-            if content:
-                logger.info(f"Groq API call successful, response length: {len(content)}")
-                return content.strip()
-            else:
-                raise ValueError("Empty response from Groq API")
-                
-        except asyncio.TimeoutError:
-            last_error = f"AI request timed out after {timeout} seconds"
-            logger.warning(f"Attempt {attempt + 1} timed out")
-            if attempt < retries:
-                await asyncio.sleep(1)  # Brief pause before retry
-                
-        except groq.RateLimitError as e:
-            last_error = "Rate limit exceeded. Please try again in a moment."
-            logger.warning(f"Rate limit hit: {e}")
-            if attempt < retries:
-                await asyncio.sleep(2)  # Longer pause for rate limits
-                
-        except groq.APIError as e:
-            last_error = f"AI service error: {str(e)}"
-            logger.error(f"Groq API error: {e}")
-            if attempt < retries:
-                await asyncio.sleep(1)
-                
-        except Exception as e:
-            last_error = f"Unexpected error: {str(e)}"
-            logger.error(f"Unexpected error in Groq call: {e}")
-            break  # Don't retry on unexpected errors
-    
-    raise HTTPException(status_code=503, detail=last_error)
+            async for delta in stream_groq_async(
+                async_groq_client,
+                messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=AI_TIMEOUT_SECONDS,
+                retries=MAX_RETRIES,
+                semaphore=groq_semaphore
+            ):
+                parts.append(delta)
+                for event in relay(delta):
+                    yield event
+        except AICallError as e:
+            yield sse_event("error", {"detail": str(e)})
+            return
+        text = "".join(parts).strip()
+    
+    try:
+        result = build_result(text)
+    except ValueError as e:
+        logger.error(f"Failed to parse streamed completion: {e}")
+        yield sse_event("error", {"detail": "Failed to parse response"})
+        return
+    if cached_text is None:
+        await llm_response_cache.aset(request_key, text)
+    if on_complete is not None:
+        await on_complete(result)
+    yield sse_event("done", result)
+
+
+# Background refresh tasks, held so they are not garbage collected mid-run
+_refresh_tasks = set()
+
+
+async def get_career_insight(cache_key: str, loader: Callable[[], Awaitable[dict]]) -> dict:
+    """
+    Serve a career insight from career_insights_cache with stale-while-revalidate.
+    
+    A stale entry inside the grace window is returned immediately and one
+    background refresh per key is started, bypassing llm_response_cache;
+    a miss waits for the loader.
+    Results carrying an ``error`` are returned but never cached.
+    """
+    cached, stale = await career_insights_cache.aget_stale(cache_key)
+    if cached:
+        if stale and not llm_flight.in_flight(cache_key):
+            async def _refresh():
+                # Only this task's context: ask the LLM again rather than the completion cache
+                bypass_completion_cache.set(True)
+                result = await loader()
+                # Keep serving the stale copy rather than replacing it with an error
+                if "error" not in result:
+                    await career_insights_cache.aset(cache_key, result)
+                return result
+            task = asyncio.ensure_future(llm_flight.do(cache_key, _refresh))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return cached
+    
+    result = await llm_flight.do(cache_key, loader)
+    if "error" not in result:
+        await career_insights_cache.aset(cache_key, result)
+    return result
+
+
+async def get_resume_skills(resume_text: str, extractor: Optional[str] = None) -> Tuple[List[str], str]:
+    """
+    Skills extracted from a resume and the extractor that produced them
+    ("local" or "llm"), memoized by extraction mode and resume fingerprint.
+    
+    Concurrent LLM extractions for the same resume share one call; an empty
+    result (extraction failed) is not cached so the next request retries.
+    """
+    mode = extractor or SKILL_EXTRACTOR
+    cache_key = f"resume_skills:{mode}:{resume_fingerprint(resume_text)}"
+    cached = await resume_skills_cache.aget(cache_key)
+    if cached:
+        return cached["skills"], cached["source"]
+    
+    skills, source = [], "local"
+    if mode != "llm":
+        skills = skill_extractor.extract(resume_text)
+        if mode == "hybrid" and len(skills) < LOCAL_SKILLS_MIN:
+            logger.info(f"Local extractor found {len(skills)} skills, falling back to LLM")
+            skills = []
+    if not skills and mode != "local":
+        skills = await llm_flight.do(cache_key, lambda: job_searcher.extract_skills_from_resume_async(resume_text))
+        source = "llm"
+    
+    if skills:
+        await resume_skills_cache.aset(cache_key, {"skills": skills, "source": source})
+    return skills, source
+
+
+def relevance_text(request: "JobSearchRequest") -> Optional[str]:
+    """Resume text to rank manual search results against, validating sort_by"""
+    if request.sort_by == "relevance" and not request.resume_text:
+        raise HTTPException(status_code=400, detail="sort_by 'relevance' requires resume_text")
+    return request.resume_text
+
+
+def uploaded_resume_key(resume_id: str) -> str:
+    # Extracted text depends on the PDF engine, so switching engines starts a fresh cache
+    return f"upload:{PDF_BACKEND}:{resume_id}"
+
+
+async def resolve_resume(request: "ResumeRequest") -> None:
+    """Fill in resume_text from the /upload-resume cache when the request only has a resume_id"""
+    if request.resume_text is None and request.resume_id:
+        cached = await uploaded_resume_cache.aget(uploaded_resume_key(request.resume_id))
+        if cached is None:
+            raise HTTPException(status_code=422, detail="Unknown or expired resume_id; upload the resume again")
+        request.resume_text = cached["resume_text"]
+
+
+async def resolve_search_skills(request: "ResumeJobSearchRequest") -> List[str]:
+    """Skills passed back by the client, else the (cached) extraction from resume_text"""
+    if request.skills:
+        return request.skills
+    if not request.resume_text:
+        raise HTTPException(status_code=400, detail="Provide resume_text or skills")
+    skills, _ = await get_resume_skills(request.resume_text, request.extractor)
+    return skills
 
 
 # Pydantic models
-class JobSearchRequest(BaseModel):
+# Sections of /career-insights/all, one per /career-insights/* route
+CareerInsightSection = Literal["paths", "skill_gaps", "salary", "interview_prep", "learning", "industry"]
+CAREER_INSIGHT_SECTIONS: Tuple[str, ...] = get_args(CareerInsightSection)
+
+
+class ResumeRequest(BaseModel):
+    """
+    Base for requests carrying a resume: the text itself, or the resume_id
+    returned by /upload-resume, which routes swap for the cached text with
+    resolve_resume.
+    """
+    resume_text: Optional[str] = None
+    resume_id: Optional[str] = None
+
+    # Requests that also work without a resume set this to False
+    resume_required: ClassVar[bool] = True
+
+    @model_validator(mode="after")
+    def check_resume(self):
+        if self.resume_required and self.resume_text is None and not self.resume_id:
+            raise ValueError("Provide resume_text or resume_id")
+        return self
+
+
+class JobSearchRequest(ResumeRequest):
+    resume_required: ClassVar[bool] = False
     search_term: str
     location: str = "United States"
     results_wanted: int = 20
     job_type: Optional[str] = None
+    # resume_text (or resume_id) adds a per-job Relevance score
+    sort_by: Literal["date", "relevance"] = "date"  # "relevance" needs resume_text
 
-class ResumeJobSearchRequest(BaseModel):
-    resume_text: str
+class ResumeJobSearchRequest(ResumeRequest):
+    resume_required: ClassVar[bool] = False
     location: str = "United States"
     results_wanted: int = 20
     job_type: Optional[str] = None
+    skills: Optional[List[str]] = None  # From an earlier response; skips extraction
+    extractor: Optional[Literal["llm", "local", "hybrid"]] = None  # Defaults to SKILL_EXTRACTOR
+    sort_by: Literal["date", "relevance"] = "relevance"
+
+class ExtractSkillsRequest(ResumeRequest):
+    extractor: Optional[Literal["llm", "local", "hybrid"]] = None
+
+class CareerInsightsRequest(ResumeRequest):
+    target_role: Optional[str] = None
 
-class CareerInsightsRequest(BaseModel):
-    resume_text: str
+class SalaryInsightsRequest(ResumeRequest):
     target_role: Optional[str] = None
+    location: str = "United States"
 
-class SalaryInsightsRequest(BaseModel):
-    resume_text: str
+class AllCareerInsightsRequest(ResumeRequest):
     target_role: Optional[str] = None
     location: str = "United States"
+    sections: Optional[List[CareerInsightSection]] = None  # Subset of CAREER_INSIGHT_SECTIONS; all when omitted
 
-class JobMatchRequest(BaseModel):
-    resume_text: str
+class JobMatchRequest(ResumeRequest):
     job_description: str
+    enrich: bool = True  # Add LLM narrative fields to the local keyword score
+
+class BatchJobDescription(BaseModel):
+    description: str
+    id: Optional[str] = None
+    title: Optional[str] = None
+    company: Optional[str] = None
+
+class BatchJobMatchRequest(ResumeRequest):
+    jobs: List[BatchJobDescription]
+    deep_dive_top_k: int = 0  # Enriched /job-match analysis for the k best matches
 
-class AnalyzeResumeRequest(BaseModel):
-    resume_text: str
+class AnalyzeResumeRequest(ResumeRequest):
     target_role: Optional[str] = None
 
 # New Feature Models
-class CoverLetterRequest(BaseModel):
-    resume_text: str
+class CoverLetterRequest(ResumeRequest):
     job_title: str
     company_name: str
     job_description: Optional[str] = None
     tone: str = "professional"
     additional_info: Optional[str] = None
 
-class InterviewQuestionsRequest(BaseModel):
-    resume_text: str
+class InterviewQuestionsRequest(ResumeRequest):
     target_role: Optional[str] = None
 
 class EvaluateAnswerRequest(BaseModel):
@@ -247,73 +627,24 @@ class EnhanceResumeSectionRequest(BaseModel):
 
 
 # Helper functions
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF bytes"""
+async def extract_text_from_pdf(upload: ReceivedUpload) -> str:
+    """Extract text from an uploaded PDF in the PDF worker pool"""
+    # Small uploads are still in memory; spooled ones are memory-mapped by the worker
+    source = upload.getvalue() if upload.in_memory else upload.path
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error reading PDF: {str(e)}")
-
-
-# API Routes
-@app.get("/")
-async def root():
-    return {
-        "message": "Agragrati API - AI Resume & Job Search",
-        "version": "1.0.0",
-        "endpoints": [
-            "/analyze-resume",
-            "/search-jobs",
-            "/search-jobs-by-resume",
-            "/career-insights/*",
-            "/job-match"
-        ]
-    }
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "groq_api": "connected" if GROQ_API_KEY else "missing"}
+        return await pdf_pool.extract(source)
+    except PDFPoolBusy as e:
+        raise HTTPException(status_code=503, detail=f"Too many uploads in progress, please retry: {str(e)}",
+                            headers={"Retry-After": "2"})
+    except PDFExtractionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.post("/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
-    """Upload and extract text from resume"""
-    if not file:
-        raise HTTPException(status_code=400, detail="No file uploaded")
-    
-    file_content = await file.read()
+def build_analyze_resume_request(request: AnalyzeResumeRequest) -> dict:
+    """Completion request for /analyze-resume and its streaming variant"""
+    job_role = request.target_role if request.target_role else "general job applications"
     
-    if file.filename.endswith('.pdf'):
-        resume_text = extract_text_from_pdf(file_content)
-    elif file.filename.endswith('.txt'):
-        resume_text = file_content.decode('utf-8')
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported file type. Please upload PDF or TXT")
-    
-    if not resume_text.strip():
-        raise HTTPException(status_code=400, detail="File is empty or contains no text")
-    
-    return {"resume_text": resume_text, "filename": file.filename}
-
-
-@app.post("/analyze-resume")
-async def analyze_resume(request: AnalyzeResumeRequest):
-    """Analyze resume and provide feedback with caching and timeout handling"""
-    try:
-        job_role = request.target_role if request.target_role else "general job applications"
-        
-        # Check cache first
-        cache_key = f"analyze:{job_role}:{request.resume_text[:500]}"
-        cached_result = resume_analysis_cache.get(cache_key)
-        if cached_result:
-            logger.info("Returning cached resume analysis")
-            return cached_result
-        
-        prompt = f"""
+    prompt = f"""
 You are an expert resume reviewer and career consultant with 15+ years of experience in talent acquisition and HR. 
 Analyze the following resume and provide comprehensive, actionable feedback for {job_role}.
 
@@ -355,16 +686,311 @@ Please structure your response with the following sections:
 - Suggest specific metrics, action verbs, and formatting improvements
 - Keep feedback actionable and prioritized
 """
+    
+    return {
+        "messages": [
+            {"role": "system", "content": "You are an expert resume reviewer with years of experience in HR and recruitment."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 2000
+    }
+
+
+def build_cover_letter_request(request: CoverLetterRequest) -> dict:
+    """Completion request for /generate-cover-letter and its streaming variant"""
+    tone_descriptions = {
+        "professional": "formal and professional",
+        "enthusiastic": "enthusiastic and energetic",
+        "confident": "confident and assertive",
+        "creative": "creative and unique",
+        "formal": "very formal and traditional"
+    }
+    tone_desc = tone_descriptions.get(request.tone, "professional")
+    
+    job_desc_section = ""
+    if request.job_description:
+        job_desc_section = f"\n\n**JOB DESCRIPTION:**\n{request.job_description}"
+    
+    additional_section = ""
+    if request.additional_info:
+        additional_section = f"\n\n**ADDITIONAL POINTS TO MENTION:**\n{request.additional_info}"
+    
+    prompt = f"""Generate a compelling cover letter for the following position.
+
+**TARGET POSITION:** {request.job_title} at {request.company_name}
+**TONE:** {tone_desc}{job_desc_section}{additional_section}
+
+**RESUME:**
+{request.resume_text}
+
+**INSTRUCTIONS:**
+1. Write a personalized cover letter (3-4 paragraphs)
+2. Highlight relevant experience from the resume
+3. Show enthusiasm for the specific company and role
+4. Include specific achievements with metrics when possible
+5. Make it {tone_desc}
+6. Keep it concise but impactful
+7. Do NOT include placeholder brackets - write complete sentences
+
+Output ONLY the cover letter text, ready to use."""
+
+    return {
+        "messages": [
+            {"role": "system", "content": "You are an expert career coach and professional writer specializing in compelling cover letters."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 1500
+    }
+
+
+def build_enhance_section_request(request: EnhanceResumeSectionRequest) -> dict:
+    """Completion request for /enhance-resume-section and its streaming variant"""
+    role_context = f"for a {request.target_role} position" if request.target_role else ""
+    
+    section_guidance = {
+        "summary": "Create a compelling 2-3 sentence professional summary highlighting key achievements and career goals",
+        "experience": "Enhance with action verbs, specific metrics, and quantifiable achievements. Use bullet points.",
+        "skills": "Organize skills by category, prioritize relevant skills, add proficiency levels if appropriate",
+        "education": "Highlight relevant coursework, honors, GPA if strong, relevant projects",
+        "projects": "Emphasize technologies used, your specific role, and measurable impact",
+        "achievements": "Focus on quantifiable results and recognition",
+        "certifications": "List with dates, issuing organizations, and relevance"
+    }
+    
+    guidance = section_guidance.get(request.section_type, "Enhance for clarity, impact, and professionalism")
+    
+    prompt = f"""Enhance this resume {request.section_type} section {role_context}.
+
+**ORIGINAL CONTENT:**
+{request.content}
+
+**GUIDELINES:**
+{guidance}
+
+**INSTRUCTIONS:**
+1. Improve the wording and structure
+2. Add metrics and specifics where possible
+3. Use strong action verbs
+4. Make it ATS-friendly
+5. Keep the same general information but make it more impactful
+
+Output ONLY the enhanced content, ready to paste into a resume. No explanations or labels."""
+
+    return {
+        "messages": [
+            {"role": "system", "content": "You are an expert resume writer. Enhance content to be more impactful and professional."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 1500
+    }
+
+
+def build_interview_questions_request(request: InterviewQuestionsRequest) -> dict:
+    """Completion request for /interview-questions"""
+    role = request.target_role or "general"
+    
+    prompt = f"""Based on this resume, generate 10 realistic interview questions that this candidate is likely to face.
+
+**RESUME:**
+{request.resume_text}
+
+**TARGET ROLE:** {role}
+
+For each question, provide:
+1. The question itself
+2. Category (Technical, Behavioral, Situational, Experience, Culture Fit)
+3. Difficulty (Easy, Medium, Hard)
+4. 2-3 tips for answering well
+
+Return as JSON array:
+[
+  {{
+    "question": "...",
+    "category": "...",
+    "difficulty": "...",
+    "tips": ["...", "..."]
+  }}
+]
+
+Include a mix of:
+- Behavioral questions (STAR method applicable)
+- Technical questions based on their skills
+- Role-specific questions
+- Common questions about their experience
+
+Output ONLY valid JSON, no markdown."""
+
+    return {
+        "messages": [
+            {"role": "system", "content": "You are an experienced hiring manager and interview coach. Output only valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 2000
+    }
+
+
+def parse_interview_questions(response_text: str) -> list:
+    """Parse the questions array, falling back to the first [...] span in the text"""
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        match = re.search(r'\[[\s\S]*\]', response_text)
+        if match:
+            return json.loads(match.group())
+        raise
+
+
+def parse_evaluation(response_text: str) -> dict:
+    """Parse the answer evaluation, falling back to the first {...} span in the text"""
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        match = re.search(r'\{[\s\S]*\}', response_text)
+        if match:
+            return json.loads(match.group())
+        raise
+
+
+# API Routes
+@app.get("/")
+async def root():
+    return {
+        "message": "Agragrati API - AI Resume & Job Search",
+        "version": "1.0.0",
+        "endpoints": [
+            "/analyze-resume",
+            "/search-jobs",
+            "/search-jobs-by-resume",
+            "/career-insights/*",
+            "/job-match"
+        ]
+    }
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "groq_api": "connected" if GROQ_API_KEY else "missing"}
+
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime counters for caches and connection pools"""
+    return {
+        "caches": {
+            cache.name: cache.stats()
+            for cache in (resume_analysis_cache, career_insights_cache, interview_questions_cache,
+                          resume_skills_cache, uploaded_resume_cache, llm_response_cache)
+        },
+        "llm_single_flight": llm_flight.stats(),
+        "pdf_extraction": pdf_pool.stats(),
+        "upload_single_flight": upload_flight.stats(),
+        "job_provider_http": job_searcher.http_pool_stats()
+    }
+
+
+# The body is parsed by receive_upload, so describe the form for the OpenAPI docs by hand
+UPLOAD_RESUME_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"]
+                }
+            }
+        }
+    }
+}
+
+
+async def read_resume_upload(upload: ReceivedUpload) -> str:
+    """Text of an uploaded PDF or UTF-8 TXT resume"""
+    if upload.filename.lower().endswith('.pdf'):
+        resume_text = await extract_text_from_pdf(upload)
+    else:
+        with upload.mapped() as view:
+            try:
+                resume_text = codecs.decode(view, 'utf-8')
+            except UnicodeDecodeError:
+                raise HTTPException(status_code=400, detail="TXT files must be UTF-8 encoded")
+    if not resume_text.strip():
+        raise HTTPException(status_code=400, detail="File is empty or contains no text")
+    return resume_text
+
+
+@app.post("/upload-resume", openapi_extra=UPLOAD_RESUME_OPENAPI)
+async def upload_resume(request: Request):
+    """Upload and extract text from resume (PDF or TXT, up to UPLOAD_MAX_BYTES)"""
+    try:
+        upload = await receive_upload(
+            request,
+            max_bytes=UPLOAD_MAX_BYTES,
+            spool_bytes=UPLOAD_SPOOL_BYTES,
+            extensions=(".pdf", ".txt"),
+            directory=UPLOAD_TMP_DIR
+        )
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    resume_id = upload.digest
+    cache_key = uploaded_resume_key(resume_id)
+    owns_spool = False
+    
+    async def read_and_close():
+        try:
+            return await read_resume_upload(upload)
+        finally:
+            upload.close()
+    
+    def start_read():
+        nonlocal owns_spool
+        owns_spool = True
+        return read_and_close()
+    
+    try:
+        cached = await uploaded_resume_cache.aget(cache_key)
+        if cached is None:
+            resume_text = await upload_flight.do(cache_key, start_read)
+            await uploaded_resume_cache.aset(cache_key, {"resume_text": resume_text})
+        else:
+            resume_text = cached["resume_text"]
+    finally:
+        # A flight started here may outlive this handler (its client can go
+        # away while identical uploads wait on it), so it closes the spool itself
+        if not owns_spool:
+            upload.close()
+    
+    return {
+        "resume_text": resume_text,
+        "filename": upload.filename,
+        "resume_id": resume_id,  # Send instead of resume_text on later requests
+        "cached": cached is not None
+    }
+
+
+@app.post("/analyze-resume")
+async def analyze_resume(request: AnalyzeResumeRequest):
+    """Analyze resume and provide feedback with caching and timeout handling"""
+    await resolve_resume(request)
+    try:
+        job_role = request.target_role if request.target_role else "general job applications"
+        
+        # Check cache first
+        cache_key = f"analyze:{job_role}:{resume_fingerprint(request.resume_text)}"
+        cached_result = await resume_analysis_cache.aget(cache_key)
+        if cached_result:
+            logger.info("Returning cached resume analysis")
+            return cached_result
         
         # Use helper with timeout and retry
-        analysis = await call_groq_with_timeout(
-            messages=[
-                {"role": "system", "content": "You are an expert resume reviewer with years of experience in HR and recruitment."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
+        analysis = await call_groq_with_timeout(**build_analyze_resume_request(request))
         
         result = {
             "analysis": analysis,
@@ -372,7 +998,7 @@ Please structure your response with the following sections:
         }
         
         # Cache the result
-        resume_analysis_cache.set(cache_key, result)
+        await resume_analysis_cache.aset(cache_key, result)
         
         return result
     except HTTPException:
@@ -382,23 +1008,43 @@ Please structure your response with the following sections:
         raise HTTPException(status_code=500, detail=f"Error analyzing resume: {str(e)}")
 
 
+@app.post("/analyze-resume/stream")
+async def analyze_resume_stream(request: AnalyzeResumeRequest):
+    """Stream resume analysis tokens as server-sent events"""
+    await resolve_resume(request)
+    job_role = request.target_role if request.target_role else "general job applications"
+    cache_key = f"analyze:{job_role}:{resume_fingerprint(request.resume_text)}"
+    cached_result = await resume_analysis_cache.aget(cache_key)
+    
+    return sse_response(stream_completion_events(
+        build_analyze_resume_request(request),
+        build_result=lambda text: {"analysis": text, "target_role": request.target_role},
+        on_complete=lambda result: resume_analysis_cache.aset(cache_key, result),
+        cached_text=cached_result["analysis"] if cached_result else None
+    ))
+
+
 @app.post("/search-jobs")
 async def search_jobs(request: JobSearchRequest):
     """Search for jobs based on search term"""
+    await resolve_resume(request)
+    resume_text = relevance_text(request)
     try:
-        jobs_df = job_searcher.search_jobs(
+        # Providers run on JobSearcher's pool; the deadline is awaited on the loop
+        jobs, provider_status, duplicates = await job_searcher.search_jobs_with_status_async(
             request.search_term,
             request.location,
             request.results_wanted,
-            request.job_type
+            request.job_type,
+            resume_text,
+            request.sort_by
         )
         
-        if jobs_df.empty:
-            return {"jobs": [], "count": 0}
-        
         return {
-            "jobs": jobs_df.to_dict('records'),
-            "count": len(jobs_df)
+            "jobs": [job.to_dict() for job in jobs],
+            "count": len(jobs),
+            "duplicates": duplicates,
+            "providers": provider_status
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching jobs: {str(e)}")
@@ -407,44 +1053,89 @@ async def search_jobs(request: JobSearchRequest):
 @app.post("/search-jobs-by-resume")
 async def search_jobs_by_resume(request: ResumeJobSearchRequest):
     """Search for jobs based on resume content"""
+    await resolve_resume(request)
+    skills = await resolve_search_skills(request)
     try:
-        jobs_df = job_searcher.search_jobs_by_resume(
-            request.resume_text,
+        if not skills:
+            return {"jobs": [], "count": 0, "skills": []}
+        
+        jobs, provider_status, duplicates = await job_searcher.search_jobs_with_status_async(
+            job_searcher.skills_search_term(skills),
             request.location,
             request.results_wanted,
-            request.job_type
+            request.job_type,
+            # Without the resume, rank against the skills the client passed back
+            request.resume_text or " ".join(skills),
+            request.sort_by
         )
         
-        if jobs_df.empty:
-            return {"jobs": [], "count": 0}
-        
         return {
-            "jobs": jobs_df.to_dict('records'),
-            "count": len(jobs_df)
+            "jobs": [job.to_dict() for job in jobs],
+            "count": len(jobs),
+            "duplicates": duplicates,
+            "skills": skills,
+            "providers": provider_status
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching jobs by resume: {str(e)}")
 
 
+@app.post("/extract-skills")
+async def extract_skills(request: ExtractSkillsRequest):
+    """Extract job search skills from a resume; pass them back to /search-jobs-by-resume to skip extraction"""
+    await resolve_resume(request)
+    skills, source = await get_resume_skills(request.resume_text, request.extractor)
+    return {"skills": skills, "source": source, "fingerprint": resume_fingerprint(request.resume_text)}
+
+
+@app.post("/search-jobs/stream")
+async def search_jobs_stream(request: JobSearchRequest):
+    """Stream job search results as NDJSON, one batch per provider"""
+    await resolve_resume(request)
+    return ndjson_response(stream_job_search(
+        request.search_term,
+        request.location,
+        request.results_wanted,
+        request.job_type,
+        relevance_text(request)
+    ))
+
+
+@app.post("/search-jobs-by-resume/stream")
+async def search_jobs_by_resume_stream(request: ResumeJobSearchRequest):
+    """Stream resume-based job search results as NDJSON, one batch per provider"""
+    await resolve_resume(request)
+    skills = await resolve_search_skills(request)
+    
+    async def lines():
+        yield json.dumps({"event": "query", "skills": skills}) + "\n"
+        if not skills:
+            yield json.dumps({"event": "summary", "count": 0, "duplicates": 0, "first_batch_ms": None,
+                              "elapsed_ms": 0, "providers": {}}) + "\n"
+            return
+        async for line in stream_job_search(
+            job_searcher.skills_search_term(skills),
+            request.location,
+            request.results_wanted,
+            request.job_type,
+            request.resume_text or " ".join(skills)
+        ):
+            yield line
+    
+    return ndjson_response(lines())
+
+
 @app.post("/career-insights/paths")
 async def get_career_paths(request: CareerInsightsRequest):
     """Get career path analysis with caching"""
+    await resolve_resume(request)
     try:
         # Check cache
-        cache_key = f"paths:{request.target_role}:{request.resume_text[:300]}"
-        cached = career_insights_cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached career paths")
-            return cached
-        
-        result = job_searcher.get_career_path_analysis(
+        cache_key = f"paths:{request.target_role}:{resume_fingerprint(request.resume_text)}"
+        return await get_career_insight(cache_key, lambda: job_searcher.get_career_path_analysis_async(
             request.resume_text,
             request.target_role
-        )
-        
-        # Cache result
-        career_insights_cache.set(cache_key, result)
-        return result
+        ))
     except Exception as e:
         logger.error(f"Error getting career paths: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting career paths: {str(e)}")
@@ -453,20 +1144,13 @@ async def get_career_paths(request: CareerInsightsRequest):
 @app.post("/career-insights/skill-gaps")
 async def get_skill_gaps(request: CareerInsightsRequest):
     """Get skill gap analysis with caching"""
+    await resolve_resume(request)
     try:
-        cache_key = f"skills:{request.target_role}:{request.resume_text[:300]}"
-        cached = career_insights_cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached skill gaps")
-            return cached
-        
-        result = job_searcher.get_skill_gap_analysis(
+        cache_key = f"skills:{request.target_role}:{resume_fingerprint(request.resume_text)}"
+        return await get_career_insight(cache_key, lambda: job_searcher.get_skill_gap_analysis_async(
             request.resume_text,
             request.target_role
-        )
-        
-        career_insights_cache.set(cache_key, result)
-        return result
+        ))
     except Exception as e:
         logger.error(f"Error analyzing skill gaps: {e}")
         raise HTTPException(status_code=500, detail=f"Error analyzing skill gaps: {str(e)}")
@@ -475,21 +1159,14 @@ async def get_skill_gaps(request: CareerInsightsRequest):
 @app.post("/career-insights/salary")
 async def get_salary_insights(request: SalaryInsightsRequest):
     """Get salary insights with caching"""
+    await resolve_resume(request)
     try:
-        cache_key = f"salary:{request.target_role}:{request.location}:{request.resume_text[:300]}"
-        cached = career_insights_cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached salary insights")
-            return cached
-        
-        result = job_searcher.get_salary_insights(
+        cache_key = f"salary:{request.target_role}:{request.location}:{resume_fingerprint(request.resume_text)}"
+        return await get_career_insight(cache_key, lambda: job_searcher.get_salary_insights_async(
             request.resume_text,
             request.target_role,
             request.location
-        )
-        
-        career_insights_cache.set(cache_key, result)
-        return result
+        ))
     except Exception as e:
         logger.error(f"Error getting salary insights: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting salary insights: {str(e)}")
@@ -498,20 +1175,13 @@ async def get_salary_insights(request: SalaryInsightsRequest):
 @app.post("/career-insights/interview-prep")
 async def get_interview_prep(request: CareerInsightsRequest):
     """Get interview preparation guidance with caching"""
+    await resolve_resume(request)
     try:
-        cache_key = f"interview:{request.target_role}:{request.resume_text[:300]}"
-        cached = career_insights_cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached interview prep")
-            return cached
-        
-        result = job_searcher.get_interview_preparation(
+        cache_key = f"interview:{request.target_role}:{resume_fingerprint(request.resume_text)}"
+        return await get_career_insight(cache_key, lambda: job_searcher.get_interview_preparation_async(
             request.resume_text,
             request.target_role
-        )
-        
-        career_insights_cache.set(cache_key, result)
-        return result
+        ))
     except Exception as e:
         logger.error(f"Error getting interview prep: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting interview prep: {str(e)}")
@@ -520,20 +1190,13 @@ async def get_interview_prep(request: CareerInsightsRequest):
 @app.post("/career-insights/learning")
 async def get_learning_recommendations(request: CareerInsightsRequest):
     """Get learning recommendations with caching"""
+    await resolve_resume(request)
     try:
-        cache_key = f"learning:{request.target_role}:{request.resume_text[:300]}"
-        cached = career_insights_cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached learning recommendations")
-            return cached
-        
-        result = job_searcher.get_learning_recommendations(
+        cache_key = f"learning:{request.target_role}:{resume_fingerprint(request.resume_text)}"
+        return await get_career_insight(cache_key, lambda: job_searcher.get_learning_recommendations_async(
             request.resume_text,
             request.target_role
-        )
-        
-        career_insights_cache.set(cache_key, result)
-        return result
+        ))
     except Exception as e:
         logger.error(f"Error getting learning recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting learning recommendations: {str(e)}")
@@ -542,36 +1205,175 @@ async def get_learning_recommendations(request: CareerInsightsRequest):
 @app.post("/career-insights/industry")
 async def get_industry_insights(request: CareerInsightsRequest):
     """Get industry insights and trends with caching"""
+    await resolve_resume(request)
     try:
-        cache_key = f"industry:{request.target_role}:{request.resume_text[:300]}"
-        cached = career_insights_cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached industry insights")
-            return cached
-        
-        result = job_searcher.get_industry_insights(
+        cache_key = f"industry:{request.target_role}:{resume_fingerprint(request.resume_text)}"
+        return await get_career_insight(cache_key, lambda: job_searcher.get_industry_insights_async(
             request.resume_text,
             request.target_role
-        )
-        
-        career_insights_cache.set(cache_key, result)
-        return result
+        ))
     except Exception as e:
         logger.error(f"Error getting industry insights: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting industry insights: {str(e)}")
 
 
+@app.post("/career-insights/all")
+async def get_all_career_insights(request: AllCareerInsightsRequest):
+    """Get every career insight section in one request, run concurrently"""
+    await resolve_resume(request)
+    fingerprint = resume_fingerprint(request.resume_text)
+    role = request.target_role
+    # Cache keys match the per-section routes so both share cached results
+    sections = {
+        "paths": (f"paths:{role}:{fingerprint}",
+                  lambda: job_searcher.get_career_path_analysis_async(request.resume_text, role)),
+        "skill_gaps": (f"skills:{role}:{fingerprint}",
+                       lambda: job_searcher.get_skill_gap_analysis_async(request.resume_text, role)),
+        "salary": (f"salary:{role}:{request.location}:{fingerprint}",
+                   lambda: job_searcher.get_salary_insights_async(request.resume_text, role, request.location)),
+        "interview_prep": (f"interview:{role}:{fingerprint}",
+                           lambda: job_searcher.get_interview_preparation_async(request.resume_text, role)),
+        "learning": (f"learning:{role}:{fingerprint}",
+                     lambda: job_searcher.get_learning_recommendations_async(request.resume_text, role)),
+        "industry": (f"industry:{role}:{fingerprint}",
+                     lambda: job_searcher.get_industry_insights_async(request.resume_text, role)),
+    }
+    
+    requested = request.sections or list(CAREER_INSIGHT_SECTIONS)
+    
+    async def _run(name: str):
+        cache_key, loader = sections[name]
+        async with career_insights_semaphore:
+            return await get_career_insight(cache_key, loader)
+    
+    outcomes = await asyncio.gather(*(_run(name) for name in requested), return_exceptions=True)
+    
+    results = {}
+    errors = {}
+    for name, outcome in zip(requested, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error getting {name} insights: {outcome}")
+            errors[name] = str(outcome)
+        elif "error" in outcome:
+            errors[name] = outcome["error"]
+        else:
+            results[name] = outcome
+    
+    return {"results": results, "errors": errors}
+
+
+async def enrich_job_match(resume_text: str, job_description: str, match: dict) -> dict:
+    """
+    Merge LLM narrative fields (summary, strengths, weaknesses, ...) into a
+    local keyword match. Scores and keyword lists stay local; if the LLM call
+    fails the local match is returned with ``enrichment_error`` set.
+    """
+    match_key = f"match_narrative:{resume_fingerprint(resume_text)}:{resume_fingerprint(job_description)}"
+    narrative = await llm_flight.do(match_key, lambda: job_searcher.match_narrative_async(
+        resume_text,
+        job_description,
+        [k["keyword"] for k in match["matching_keywords"]],
+        [k["keyword"] for k in match["missing_keywords"]]
+    ))
+    if "error" in narrative:
+        return {**match, "enrichment_error": narrative["error"]}
+    return {**narrative, **match}
+
+
 @app.post("/job-match")
 async def match_resume_to_job(request: JobMatchRequest):
-    """Match resume against job description"""
+    """
+    Match resume against job description.
+    
+    Keyword matching and the score are computed locally; with ``enrich`` the
+    LLM adds the narrative fields. ``enrich: false`` returns in milliseconds.
+    """
+    await resolve_resume(request)
     try:
-        result = job_searcher.match_resume_to_job(
+        match = keyword_matcher.score(request.resume_text, request.job_description)
+        if not request.enrich:
+            return match
+        return await enrich_job_match(request.resume_text, request.job_description, match)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error matching resume to job: {str(e)}")
+
+
+@app.post("/job-match/batch")
+async def match_resume_to_jobs(request: BatchJobMatchRequest):
+    """
+    Rank many job descriptions against one resume.
+    
+    All descriptions are scored locally in one pass (BM25 relevance plus
+    taxonomy skill coverage); only the top ``deep_dive_top_k`` get an LLM
+    analysis, attached as ``details``.
+    """
+    await resolve_resume(request)
+    if len(request.jobs) > JOB_MATCH_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {JOB_MATCH_BATCH_MAX} jobs per batch")
+    if not 0 <= request.deep_dive_top_k <= JOB_MATCH_DEEP_DIVE_MAX:
+        raise HTTPException(status_code=400, detail=f"deep_dive_top_k must be between 0 and {JOB_MATCH_DEEP_DIVE_MAX}")
+    try:
+        started = time.perf_counter()
+        # Scoring hundreds of descriptions is CPU work; keep it off the event loop
+        scores = await asyncio.to_thread(
+            keyword_matcher.rank,
             request.resume_text,
-            request.job_description
+            [job.description for job in request.jobs]
         )
-        return result
+        results = sorted(
+            (
+                {"index": i, "id": job.id, "title": job.title, "company": job.company, **score}
+                for i, (job, score) in enumerate(zip(request.jobs, scores))
+            ),
+            key=lambda result: -result["match_score"]
+        )
+        scoring_ms = round((time.perf_counter() - started) * 1000)
+        
+        top = results[:request.deep_dive_top_k]
+        details = await asyncio.gather(*(
+            enrich_job_match(
+                request.resume_text,
+                request.jobs[result["index"]].description,
+                keyword_matcher.score(request.resume_text, request.jobs[result["index"]].description)
+            )
+            for result in top
+        ))
+        for result, detail in zip(top, details):
+            result["details"] = detail
+        
+        return {"results": results, "count": len(results), "scoring_ms": scoring_ms}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error matching resume to job: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error matching resume to jobs: {str(e)}")
+
+
+@app.post("/job-match/stream")
+async def match_resume_to_job_stream(request: JobMatchRequest):
+    """
+    Stream a resume/job match as server-sent events.
+    
+    The local keyword match is sent first as a ``score`` event; its score is
+    final. The LLM narrative then streams each element of its arrays
+    (strengths, weaknesses, tips, ...) as an ``item`` event tagged with its
+    field as soon as the model closes it, and ``done`` carries the same
+    document as an enriched /job-match.
+    """
+    await resolve_resume(request)
+    async def events():
+        match = keyword_matcher.score(request.resume_text, request.job_description)
+        yield sse_event("score", match)
+        async for event in stream_completion_events(
+            job_searcher.match_narrative_request(
+                request.resume_text,
+                request.job_description,
+                [k["keyword"] for k in match["matching_keywords"]],
+                [k["keyword"] for k in match["missing_keywords"]]
+            ),
+            build_result=lambda text: {**job_searcher.parse_json_response(text), **match},
+            items=JSONItemStream()
+        ):
+            yield event
+    
+    return sse_response(events())
 
 
 # ==========================================
@@ -581,51 +1383,9 @@ async def match_resume_to_job(request: JobMatchRequest):
 @app.post("/generate-cover-letter")
 async def generate_cover_letter(request: CoverLetterRequest):
     """Generate a personalized cover letter with timeout handling"""
+    await resolve_resume(request)
     try:
-        tone_descriptions = {
-            "professional": "formal and professional",
-            "enthusiastic": "enthusiastic and energetic",
-            "confident": "confident and assertive",
-            "creative": "creative and unique",
-            "formal": "very formal and traditional"
-        }
-        tone_desc = tone_descriptions.get(request.tone, "professional")
-        
-        job_desc_section = ""
-        if request.job_description:
-            job_desc_section = f"\n\n**JOB DESCRIPTION:**\n{request.job_description}"
-        
-        additional_section = ""
-        if request.additional_info:
-            additional_section = f"\n\n**ADDITIONAL POINTS TO MENTION:**\n{request.additional_info}"
-        
-        prompt = f"""Generate a compelling cover letter for the following position.
-
-**TARGET POSITION:** {request.job_title} at {request.company_name}
-**TONE:** {tone_desc}{job_desc_section}{additional_section}
-
-**RESUME:**
-{request.resume_text}
-
-**INSTRUCTIONS:**
-1. Write a personalized cover letter (3-4 paragraphs)
-2. Highlight relevant experience from the resume
-3. Show enthusiasm for the specific company and role
-4. Include specific achievements with metrics when possible
-5. Make it {tone_desc}
-6. Keep it concise but impactful
-7. Do NOT include placeholder brackets - write complete sentences
-
-Output ONLY the cover letter text, ready to use."""
-
-        cover_letter = await call_groq_with_timeout(
-            messages=[
-                {"role": "system", "content": "You are an expert career coach and professional writer specializing in compelling cover letters."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1500
-        )
+        cover_letter = await call_groq_with_timeout(**build_cover_letter_request(request))
         
         return {"cover_letter": cover_letter}
     except HTTPException:
@@ -635,76 +1395,37 @@ Output ONLY the cover letter text, ready to use."""
         raise HTTPException(status_code=500, detail=f"Error generating cover letter: {str(e)}")
 
 
+@app.post("/generate-cover-letter/stream")
+async def generate_cover_letter_stream(request: CoverLetterRequest):
+    """Stream cover letter tokens as server-sent events"""
+    await resolve_resume(request)
+    return sse_response(stream_completion_events(
+        build_cover_letter_request(request),
+        build_result=lambda text: {"cover_letter": text}
+    ))
+
+
 @app.post("/interview-questions")
 async def get_interview_questions(request: InterviewQuestionsRequest):
     """Generate personalized interview questions with caching and timeout handling"""
+    await resolve_resume(request)
     try:
         role = request.target_role or "general"
         
-        # Create cache key from role + resume hash (first 500 chars for efficiency)
-        resume_snippet = request.resume_text[:500] if request.resume_text else ""
-        cache_key = f"interview_questions:{role}:{resume_snippet}"
+        # Create cache key from role + fingerprint of the full resume
+        cache_key = f"interview_questions:{role}:{resume_fingerprint(request.resume_text or '')}"
         
         # Check cache first
-        cached_result = interview_questions_cache.get(cache_key)
+        cached_result = await interview_questions_cache.aget(cache_key)
         if cached_result:
             return cached_result
         
-        prompt = f"""Based on this resume, generate 10 realistic interview questions that this candidate is likely to face.
-
-**RESUME:**
-{request.resume_text}
-
-**TARGET ROLE:** {role}
-
-For each question, provide:
-1. The question itself
-2. Category (Technical, Behavioral, Situational, Experience, Culture Fit)
-3. Difficulty (Easy, Medium, Hard)
-4. 2-3 tips for answering well
-
-Return as JSON array:
-[
-  {{
-    "question": "...",
-    "category": "...",
-    "difficulty": "...",
-    "tips": ["...", "..."]
-  }}
-]
-
-Include a mix of:
-- Behavioral questions (STAR method applicable)
-- Technical questions based on their skills
-- Role-specific questions
-- Common questions about their experience
-
-Output ONLY valid JSON, no markdown."""
-
-        response_text = await call_groq_with_timeout(
-            messages=[
-                {"role": "system", "content": "You are an experienced hiring manager and interview coach. Output only valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        
-        import json
-        # Try to extract JSON from response
-        try:
-            questions = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to find JSON array in response
-            import re
-            match = re.search(r'\[[\s\S]*\]', response_text)
-            if match:
-                questions = json.loads(match.group())
-            else:
-                raise
+        response_text = await call_groq_with_timeout(**build_interview_questions_request(request),
+                                                     validate=parse_interview_questions)
+        questions = parse_interview_questions(response_text)
         
         result = {"questions": questions}
-        interview_questions_cache.set(cache_key, result)
+        await interview_questions_cache.aset(cache_key, result)
         return result
     except json.JSONDecodeError:
         logger.error("Failed to parse interview questions JSON")
@@ -716,6 +1437,23 @@ Output ONLY valid JSON, no markdown."""
         raise HTTPException(status_code=500, detail=f"Error generating interview questions: {str(e)}")
 
 
+@app.post("/interview-questions/stream")
+async def get_interview_questions_stream(request: InterviewQuestionsRequest):
+    """Stream interview questions as server-sent events, one ``item`` per question"""
+    await resolve_resume(request)
+    role = request.target_role or "general"
+    cache_key = f"interview_questions:{role}:{resume_fingerprint(request.resume_text or '')}"
+    cached_result = await interview_questions_cache.aget(cache_key)
+    
+    return sse_response(stream_completion_events(
+        build_interview_questions_request(request),
+        build_result=lambda text: {"questions": parse_interview_questions(text)},
+        on_complete=lambda result: interview_questions_cache.aset(cache_key, result),
+        cached_text=json.dumps(cached_result["questions"]) if cached_result else None,
+        items=JSONItemStream(root="questions")
+    ))
+
+
 @app.post("/evaluate-answer")
 async def evaluate_answer(request: EvaluateAnswerRequest):
     """Evaluate an interview answer with timeout handling"""
@@ -744,22 +1482,11 @@ Be constructive and specific. Output ONLY valid JSON."""
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=1000
+            max_tokens=1000,
+            validate=parse_evaluation
         )
         
-        import json
-        try:
-            evaluation = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to find JSON object in response
-            import re
-            match = re.search(r'\{[\s\S]*\}', response_text)
-            if match:
-                evaluation = json.loads(match.group())
-            else:
-                raise
-        
-        return evaluation
+        return parse_evaluation(response_text)
     except json.JSONDecodeError:
         logger.error("Failed to parse evaluation JSON")
         raise HTTPException(status_code=500, detail="Failed to parse evaluation")
@@ -774,45 +1501,7 @@ Be constructive and specific. Output ONLY valid JSON."""
 async def enhance_resume_section(request: EnhanceResumeSectionRequest):
     """Enhance a resume section with AI and timeout handling"""
     try:
-        role_context = f"for a {request.target_role} position" if request.target_role else ""
-        
-        section_guidance = {
-            "summary": "Create a compelling 2-3 sentence professional summary highlighting key achievements and career goals",
-            "experience": "Enhance with action verbs, specific metrics, and quantifiable achievements. Use bullet points.",
-            "skills": "Organize skills by category, prioritize relevant skills, add proficiency levels if appropriate",
-            "education": "Highlight relevant coursework, honors, GPA if strong, relevant projects",
-            "projects": "Emphasize technologies used, your specific role, and measurable impact",
-            "achievements": "Focus on quantifiable results and recognition",
-            "certifications": "List with dates, issuing organizations, and relevance"
-        }
-        
-        guidance = section_guidance.get(request.section_type, "Enhance for clarity, impact, and professionalism")
-        
-        prompt = f"""Enhance this resume {request.section_type} section {role_context}.
-
-**ORIGINAL CONTENT:**
-{request.content}
-
-**GUIDELINES:**
-{guidance}
-
-**INSTRUCTIONS:**
-1. Improve the wording and structure
-2. Add metrics and specifics where possible
-3. Use strong action verbs
-4. Make it ATS-friendly
-5. Keep the same general information but make it more impactful
-
-Output ONLY the enhanced content, ready to paste into a resume. No explanations or labels."""
-
-        response_text = await call_groq_with_timeout(
-            messages=[
-                {"role": "system", "content": "You are an expert resume writer. Enhance content to be more impactful and professional."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1500
-        )
+        response_text = await call_groq_with_timeout(**build_enhance_section_request(request))
         
         return {"enhanced_content": response_text}
     except HTTPException:
@@ -822,6 +1511,15 @@ Output ONLY the enhanced content, ready to paste into a resume. No explanations
         raise HTTPException(status_code=500, detail=f"Error enhancing resume section: {str(e)}")
 
 
+@app.post("/enhance-resume-section/stream")
+async def enhance_resume_section_stream(request: EnhanceResumeSectionRequest):
+    """Stream enhanced resume section tokens as server-sent events"""
+    return sse_response(stream_completion_events(
+        build_enhance_section_request(request),
+        build_result=lambda text: {"enhanced_content": text}
+    ))
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
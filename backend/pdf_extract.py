@@ -0,0 +1,338 @@
+"""
+PDF text extraction in a bounded process pool.
+
+PyPDF2 is pure Python and CPU-bound, so parsing a large or scanned PDF on
+the event loop (or in a thread, under the GIL) stalls every other request
+on the worker. PDFExtractionPool runs extraction in separate processes,
+caps how many uploads may wait for a worker, and enforces page-count and
+time limits inside the worker so a pathological file cannot hold a process.
+
+The text engine is pluggable: PDFBackend wraps one library, PDF_BACKENDS
+registers them by name and PyPDF2 stays the default. Compare the installed
+engines with benchmarks/pdf_extraction.py.
+"""
+import asyncio
+import importlib.util
+import io
+import logging
+import mmap
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Type, Union
+
+logger = logging.getLogger(__name__)
+
+
+class PDFExtractionError(Exception):
+    """The PDF could not be read, was over the page limit or took too long."""
+
+
+class PDFExtractionTimeout(PDFExtractionError):
+    """Parsing the PDF exceeded the pool's time limit."""
+
+
+class PDFPoolBusy(Exception):
+    """Too many uploads are already waiting for a PDF worker."""
+
+
+def _on_timeout(signum, frame):
+    raise TimeoutError
+
+
+def _check_page_count(page_count: int, max_pages: int) -> None:
+    if page_count > max_pages:
+        raise PDFExtractionError(f"PDF has {page_count} pages; the limit is {max_pages}")
+
+
+class PDFBackend:
+    """
+    Interface for a PDF text extraction engine.
+
+    page_texts opens ``source`` (PDF bytes or the path of a file holding
+    them), checks the page count against ``max_pages`` before extracting
+    anything and returns the text of each page. ``module`` is the engine's
+    import name; it is only imported inside a pool worker, on first use.
+    ``package`` is the name to pip install, when it differs from ``module``.
+    """
+
+    name: str = "pdf"
+    module: str = ""
+    package: Optional[str] = None
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the engine is installed, without importing it."""
+        return importlib.util.find_spec(cls.module) is not None
+
+    def page_texts(self, source: Union[bytes, str], max_pages: int) -> List[str]:
+        raise NotImplementedError
+
+
+class PyPDF2Backend(PDFBackend):
+    """PyPDF2, pure Python; the default. A file source is memory-mapped rather than read."""
+
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    def _reader(self, stream):
+        import PyPDF2
+        return PyPDF2.PdfReader(stream)
+
+    def page_texts(self, source: Union[bytes, str], max_pages: int) -> List[str]:
+        with ExitStack() as stack:
+            if isinstance(source, str):
+                f = stack.enter_context(open(source, "rb"))
+                stream = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                stream = io.BytesIO(source)
+            reader = self._reader(stream)
+            _check_page_count(len(reader.pages), max_pages)
+            return [page.extract_text() or "" for page in reader.pages]
+
+
+class PypdfBackend(PyPDF2Backend):
+    """pypdf, the maintained successor of PyPDF2 (same API, faster text extraction)."""
+
+    name = "pypdf"
+    module = "pypdf"
+
+    def _reader(self, stream):
+        import pypdf
+        return pypdf.PdfReader(stream)
+
+
+class PyMuPDFBackend(PDFBackend):
+    """PyMuPDF (MuPDF bindings). Opens a file source itself."""
+
+    name = "pymupdf"
+    module = "pymupdf"
+
+    def page_texts(self, source: Union[bytes, str], max_pages: int) -> List[str]:
+        import pymupdf
+        if isinstance(source, str):
+            doc = pymupdf.open(source, filetype="pdf")
+        else:
+            doc = pymupdf.open(stream=source, filetype="pdf")
+        with doc:
+            _check_page_count(doc.page_count, max_pages)
+            return [page.get_text() for page in doc]
+
+
+class PdfiumBackend(PDFBackend):
+    """pypdfium2 (PDFium bindings). Opens a file source itself."""
+
+    name = "pypdfium2"
+    module = "pypdfium2"
+
+    def page_texts(self, source: Union[bytes, str], max_pages: int) -> List[str]:
+        import pypdfium2
+        doc = pypdfium2.PdfDocument(source)
+        try:
+            _check_page_count(len(doc), max_pages)
+            texts = []
+            for page in doc:
+                textpage = page.get_textpage()
+                # PDFium ends lines with CRLF
+                texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+                textpage.close()
+                page.close()
+            return texts
+        finally:
+            doc.close()
+
+
+class PdfminerBackend(PDFBackend):
+    """pdfminer.six, pure Python with full layout analysis; the slowest, but groups columns."""
+
+    name = "pdfminer"
+    module = "pdfminer"
+    package = "pdfminer.six"
+
+    def page_texts(self, source: Union[bytes, str], max_pages: int) -> List[str]:
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+        from pdfminer.pdfpage import PDFPage
+
+        with ExitStack() as stack:
+            stream = stack.enter_context(open(source, "rb")) if isinstance(source, str) else io.BytesIO(source)
+            # Walking the page tree is cheap; layout analysis only runs within the limit
+            _check_page_count(sum(1 for _ in PDFPage.get_pages(stream)), max_pages)
+            stream.seek(0)
+            return [
+                "".join([element.get_text() for element in page if isinstance(element, LTTextContainer)])
+                for page in extract_pages(stream)
+            ]
+
+
+PDF_BACKENDS: Dict[str, Type[PDFBackend]] = {
+    backend.name: backend
+    for backend in (PyPDF2Backend, PypdfBackend, PyMuPDFBackend, PdfiumBackend, PdfminerBackend)
+}
+DEFAULT_PDF_BACKEND = PyPDF2Backend.name
+
+
+def available_pdf_backends() -> List[str]:
+    """Names of the registered engines that are installed."""
+    return [name for name, backend in PDF_BACKENDS.items() if backend.available()]
+
+
+def extract_pdf_text(source: Union[bytes, str], max_pages: int, timeout: float,
+                     backend: str = DEFAULT_PDF_BACKEND) -> str:
+    """
+    Text of every page of a PDF, one page per line block.
+
+    ``source`` is the PDF bytes or the path of a file holding them, read by
+    the ``backend`` engine from PDF_BACKENDS. Runs in a pool worker: the time
+    limit is a real-time interval timer in the worker process, which
+    interrupts the pure-Python engines mid-parse and the native ones
+    (pymupdf, pypdfium2) between pages. Where there is no SIGALRM (Windows)
+    or this is not the main thread, only the pool's own deadline applies.
+    """
+    timer = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+    previous = None
+    try:
+        if timer:
+            previous = signal.signal(signal.SIGALRM, _on_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        texts = PDF_BACKENDS[backend]().page_texts(source, max_pages)
+        # Collect pages and join once rather than growing one string per page
+        return "".join([text + "\n" for text in texts])
+    except TimeoutError:
+        raise PDFExtractionTimeout(f"PDF took longer than {timeout:g}s to parse")
+    except PDFExtractionError:
+        raise
+    except Exception as e:
+        raise PDFExtractionError(f"Error reading PDF: {str(e)}")
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            if previous is not None:
+                signal.signal(signal.SIGALRM, previous)
+
+
+class PDFExtractionPool:
+    """
+    Bounded process pool for extract_pdf_text with the ``backend`` engine.
+
+    At most ``workers`` PDFs parse at once and at most ``max_pending`` are
+    queued or parsing; further uploads raise PDFPoolBusy instead of piling
+    up. Worker processes are started on first use and replaced after
+    ``max_tasks_per_child`` files to return memory from large PDFs. A job
+    that outlives the time limit retires its executor: new jobs go to a
+    fresh one and the old workers are killed once its other jobs finish.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 8, max_pages: int = 20,
+                 timeout: float = 10.0, max_tasks_per_child: int = 50,
+                 backend: str = DEFAULT_PDF_BACKEND):
+        if backend not in PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend}")
+        self.backend = backend
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(workers)
+        # Jobs in flight per executor, and executors retired after a stuck job
+        self._running: Dict[ProcessPoolExecutor, int] = {}
+        self._stalled = set()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs the event loop and thread pools is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=self.max_tasks_per_child
+            )
+        return self._executor
+
+    async def extract(self, source: Union[bytes, str]) -> str:
+        """Extract text from PDF bytes, or the PDF file at a path, in a worker process."""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PDFPoolBusy(f"{self.pending} PDFs are already being processed")
+        self.pending += 1
+        try:
+            # Jobs reach the executor only when a worker is free, so the
+            # deadline in _run measures parsing rather than time in the queue
+            async with self._slots:
+                text = await self._run(source)
+        except PDFExtractionError:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return text
+
+    async def _run(self, source: Union[bytes, str]) -> str:
+        executor = self._pool()
+        self._running[executor] = self._running.get(executor, 0) + 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                executor, extract_pdf_text, source, self.max_pages, self.timeout, self.backend
+            )
+            # The worker enforces the limit itself where it can; this catches a stuck process
+            return await asyncio.wait_for(future, timeout=self.timeout + 5)
+        except asyncio.TimeoutError:
+            # Send new jobs to a fresh pool; this one is killed once its other jobs finish
+            logger.error("PDF worker did not finish in time; replacing the pool")
+            self.timeouts += 1
+            self._stalled.add(executor)
+            if executor is self._executor:
+                self._executor = None
+            raise PDFExtractionTimeout(f"PDF took longer than {self.timeout:g}s to parse")
+        except PDFExtractionTimeout:
+            self.timeouts += 1
+            raise
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool next time
+            logger.error("PDF worker process died; restarting the pool")
+            self._drop(executor)
+            raise PDFExtractionError("Error reading PDF: the parser crashed")
+        finally:
+            self._running[executor] -= 1
+            if not self._running[executor]:
+                del self._running[executor]
+                if executor in self._stalled:
+                    self._stalled.discard(executor)
+                    self._drop(executor, kill=True)
+
+    def _drop(self, executor: ProcessPoolExecutor, kill: bool = False) -> None:
+        """Shut ``executor`` down; with ``kill`` its workers are killed instead of left to finish."""
+        if executor is self._executor:
+            self._executor = None
+        # ProcessPoolExecutor has no public way to stop a running task
+        workers = list((executor._processes or {}).values()) if kill else []
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in workers:
+            process.kill()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._drop(self._executor)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint; ``queue_depth`` counts queued and parsing PDFs."""
+        return {
+            "backend": self.backend,
+            "workers": self.workers,
+            "queue_depth": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts
+        }
@@ -0,0 +1,376 @@
+"""
+Local skill extraction for resume-based job search.
+
+SkillExtractor matches a built-in taxonomy of skills and job titles against
+the resume with an Aho-Corasick automaton (one pass over the text for every
+alias at once) and ranks the hits by how often they occur, weighted by the
+resume section they occur in. It runs offline in a few milliseconds and is
+used instead of, or before, the LLM extraction in JobSearcher.
+"""
+import re
+import unicodedata
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Canonical name -> aliases (matched case-insensitively on word boundaries).
+# The canonical name is matched as well, except as noted for ALIAS_ONLY_NAMES
+# and AMBIGUOUS_NAMES.
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    # Programming languages
+    "Python": ["python3"],
+    "Java": [],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6"],
+    "TypeScript": ["ts"],
+    "C++": ["cpp"],
+    "C#": ["c sharp", "csharp"],
+    "Go": ["golang"],
+    "Rust": [],
+    "Ruby": [],
+    "PHP": [],
+    "Swift": [],
+    "Kotlin": [],
+    "Scala": [],
+    "R": ["r programming", "rstudio"],
+    "MATLAB": [],
+    "Perl": [],
+    "Dart": [],
+    "Bash": ["shell scripting", "shell script"],
+    "PowerShell": [],
+    "SQL": ["t-sql", "pl/sql", "plsql"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    # Frameworks and libraries
+    "React": ["react.js", "reactjs"],
+    "React Native": [],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Next.js": ["nextjs"],
+    "Node.js": ["node", "nodejs"],
+    "Express": ["express.js", "expressjs"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Spring Boot": ["spring framework"],
+    ".NET": ["dotnet", "asp.net", ".net core"],
+    "Ruby on Rails": ["rails"],
+    "Laravel": [],
+    "Flutter": [],
+    "Redux": [],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "Bootstrap": [],
+    "jQuery": [],
+    "GraphQL": [],
+    "REST APIs": ["restful", "rest api", "restful apis", "rest apis"],
+    "gRPC": [],
+    # Data and machine learning
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": [],
+    "Generative AI": ["genai", "llm", "llms", "large language models"],
+    "TensorFlow": [],
+    "PyTorch": [],
+    "Keras": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "Pandas": [],
+    "NumPy": [],
+    "SciPy": [],
+    "Spark": ["apache spark", "pyspark"],
+    "Hadoop": [],
+    "Kafka": ["apache kafka"],
+    "Airflow": ["apache airflow"],
+    "dbt": [],
+    "Snowflake": [],
+    "Databricks": [],
+    "Tableau": [],
+    "Power BI": ["powerbi"],
+    "Looker": [],
+    "Excel": ["microsoft excel", "ms excel"],
+    "Data Analysis": ["data analytics"],
+    "Data Visualization": [],
+    "Statistics": ["statistical analysis"],
+    "ETL": ["data pipelines", "data pipeline"],
+    "A/B Testing": ["ab testing", "a/b tests"],
+    # Databases
+    "PostgreSQL": ["postgres"],
+    "MySQL": [],
+    "SQLite": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Elasticsearch": ["elastic search", "opensearch"],
+    "Cassandra": [],
+    "DynamoDB": [],
+    "Oracle": ["oracle db"],
+    "SQL Server": ["mssql", "microsoft sql server"],
+    "Supabase": [],
+    "Firebase": [],
+    # Cloud and DevOps
+    "AWS": ["amazon web services", "ec2", "aws lambda"],
+    "Azure": ["microsoft azure"],
+    "Google Cloud": ["gcp", "google cloud platform"],
+    "Docker": ["containerization"],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "Ansible": [],
+    "Jenkins": [],
+    "GitHub Actions": [],
+    "GitLab CI": [],
+    "CI/CD": ["ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "Linux": ["unix", "ubuntu"],
+    "Git": ["github", "gitlab", "version control"],
+    "Microservices": ["microservice"],
+    "Serverless": [],
+    "Prometheus": [],
+    "Grafana": [],
+    "Nginx": [],
+    # Practices and tools
+    "Agile": ["scrum", "kanban"],
+    "Jira": [],
+    "Test-Driven Development": ["tdd"],
+    "Unit Testing": ["pytest", "jest", "junit"],
+    "System Design": ["distributed systems"],
+    "Object-Oriented Programming": ["oop", "object oriented programming"],
+    "Data Structures": ["algorithms", "data structures and algorithms"],
+    "Cybersecurity": ["information security", "infosec"],
+    "Figma": [],
+    "UI/UX Design": ["ux design", "ui design", "user experience", "user interface design"],
+    "SEO": ["search engine optimization"],
+    "Salesforce": [],
+    "SAP": [],
+    # Professional skills
+    "Project Management": ["pmp"],
+    "Product Management": [],
+    "Stakeholder Management": [],
+    "Leadership": ["team lead", "led a team", "mentoring", "mentored"],
+    "Communication": ["communication skills"],
+    "Problem Solving": ["problem-solving"],
+    "Financial Analysis": ["financial modeling", "financial modelling"],
+    "Digital Marketing": [],
+    "Content Writing": ["copywriting"],
+    "Customer Success": [],
+    "Sales": ["business development"],
+}
+
+# Entries reported as soft rather than technical skills
+SOFT_SKILLS = {
+    "Agile", "Project Management", "Product Management", "Stakeholder Management",
+    "Leadership", "Communication", "Problem Solving", "Customer Success", "Sales",
+}
+
+# Single letters and the most common words; only their aliases match
+ALIAS_ONLY_NAMES = {"Go", "R"}
+
+# Names that are also everyday words ("Express interest by email"). The name
+# itself matches only in its own capitalization (or all caps), and as the
+# first word of a sentence only when followed by punctuation, a line break,
+# a capitalized word or one of SKILL_CONTEXT_WORDS; aliases match as usual
+AMBIGUOUS_NAMES = {"Express", "React", "Swift", "Spark", "Excel", "Agile", "Oracle", "Rust", "Flask"}
+SKILL_CONTEXT_WORDS = {"and", "or", "developer", "developers", "engineer", "engineers", "experience", "skills"}
+
+# Job titles are extracted like skills; the LLM prompt asks for both
+JOB_TITLES: Dict[str, List[str]] = {
+    "Software Engineer": ["software developer", "swe"],
+    "Backend Developer": ["backend engineer", "back-end developer", "back end developer"],
+    "Frontend Developer": ["frontend engineer", "front-end developer", "front end developer"],
+    "Full Stack Developer": ["full-stack developer", "fullstack developer", "full stack engineer"],
+    "Mobile Developer": ["ios developer", "android developer"],
+    "Data Scientist": [],
+    "Data Analyst": [],
+    "Data Engineer": [],
+    "Machine Learning Engineer": ["ml engineer"],
+    "DevOps Engineer": ["site reliability engineer", "sre"],
+    "Cloud Engineer": ["cloud architect"],
+    "Solutions Architect": ["software architect"],
+    "QA Engineer": ["test engineer", "sdet", "quality assurance"],
+    "Security Engineer": ["security analyst"],
+    "Product Manager": [],
+    "Project Manager": [],
+    "Engineering Manager": [],
+    "Business Analyst": [],
+    "UX Designer": ["ui/ux designer", "product designer"],
+    "Marketing Manager": [],
+}
+
+# Section header -> weight of a mention inside that section
+SECTION_WEIGHTS: Dict[str, float] = {
+    "skills": 3.0,
+    "experience": 2.0,
+    "projects": 2.0,
+    "summary": 1.5,
+    "certifications": 1.5,
+    "education": 1.0,
+}
+DEFAULT_SECTION_WEIGHT = 1.0
+
+_SECTION_HEADERS = {
+    "skills": ["skills", "technical skills", "core skills", "key skills", "core competencies",
+               "competencies", "technologies", "tech stack", "tools"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history"],
+    "projects": ["projects", "personal projects", "key projects"],
+    "summary": ["summary", "professional summary", "profile", "objective", "about me", "about"],
+    "certifications": ["certifications", "certificates", "licenses", "courses"],
+    "education": ["education", "academic background", "qualifications"],
+}
+_HEADER_LOOKUP = {alias: section for section, aliases in _SECTION_HEADERS.items() for alias in aliases}
+_WORD_RE = re.compile(r"\w*")
+_HEADER_STRIP_RE = re.compile(r"^[\s#*\-•:|]+|[\s#*\-•:|]+$")
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _fold(text: str) -> Tuple[str, str]:
+    """(NFKC text, its lowercase form) of equal length, so offsets in one index the other."""
+    cased = unicodedata.normalize("NFKC", text)
+    lower = cased.lower()
+    if len(lower) != len(cased):
+        # A few characters lowercase to several ("İ"); keep those as they are
+        lower = "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in cased)
+    return cased, lower
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher: finds every pattern occurrence in one pass."""
+
+    def __init__(self, patterns: Dict[str, str]):
+        """``patterns`` maps each (already normalized) pattern to its label."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, int]]] = [[]]
+
+        for pattern, label in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((label, len(pattern)))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (label, start, end) for every pattern occurrence in ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for label, length in out[node]:
+                yield label, i - length + 1, i + 1
+
+
+class SkillExtractor:
+    """Rank taxonomy skills and job titles found in a resume."""
+
+    def __init__(self, taxonomy: Optional[Dict[str, List[str]]] = None,
+                 titles: Optional[Dict[str, List[str]]] = None):
+        patterns: Dict[str, str] = {}
+        for entries in (taxonomy if taxonomy is not None else SKILL_TAXONOMY,
+                        titles if titles is not None else JOB_TITLES):
+            for canonical, aliases in entries.items():
+                names = aliases if canonical in ALIAS_ONLY_NAMES else [canonical, *aliases]
+                for alias in names:
+                    patterns.setdefault(_normalize(alias), canonical)
+        self._matcher = AhoCorasick(patterns)
+        # Normalized ambiguous name -> its canonical spelling
+        self._ambiguous = {_normalize(name): name for name in AMBIGUOUS_NAMES}
+
+    @staticmethod
+    def _names_skill(cased: str, start: int, end: int, name: str) -> bool:
+        """Whether an ambiguous ``name`` at cased[start:end] is the skill rather than the word."""
+        word = cased[start:end]
+        if word != name and word != name.upper():
+            return False
+        before = cased[:start].rstrip(" \t")
+        if before and before[-1] not in ".!?\n":
+            return True
+        # Sentence start, where every word is capitalized: "Express interest" is not a skill
+        after = cased[end:].lstrip(" \t")
+        if not after or not after[0].isalnum() or after[0].isupper():
+            return True
+        return _WORD_RE.match(after).group() in SKILL_CONTEXT_WORDS
+
+    @staticmethod
+    def _sections(text: str) -> Iterator[Tuple[int, int, float]]:
+        """Yield (start, end, weight) spans of ``text`` split at section headers."""
+        start, weight = 0, DEFAULT_SECTION_WEIGHT
+        offset = 0
+        for line in text.splitlines(keepends=True):
+            header = _HEADER_STRIP_RE.sub("", line)
+            section = _HEADER_LOOKUP.get(header) if len(header) <= 40 else None
+            if section is not None:
+                if offset > start:
+                    yield start, offset, weight
+                start, weight = offset, SECTION_WEIGHTS[section]
+            offset += len(line)
+        if offset > start:
+            yield start, offset, weight
+
+    def _matches(self, cased: str, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Whole-word, leftmost-longest matches in ``text`` (the lowercase form of
+        ``cased``): "react native" is not also "react".
+        """
+        candidates = sorted(
+            (
+                (start, -end, label)
+                for label, start, end in self._matcher.finditer(text)
+                # Only whole words: "java" must not match inside "javascript"
+                if not (start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]))
+                and not (end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]))
+                and (text[start:end] not in self._ambiguous
+                     or self._names_skill(cased, start, end, self._ambiguous[text[start:end]]))
+            )
+        )
+        covered = 0
+        for start, neg_end, label in candidates:
+            if start >= covered:
+                covered = -neg_end
+                yield label, start, covered
+
+    def score(self, resume_text: str) -> List[Tuple[str, float]]:
+        """(skill, score) for every taxonomy entry found, best first."""
+        cased, text = _fold(resume_text)
+        weights = list(self._sections(text))
+        scores: Dict[str, float] = {}
+        first_seen: Dict[str, int] = {}
+        section = 0
+        for label, start, _ in self._matches(cased, text):
+            while weights[section][1] <= start:
+                section += 1
+            scores[label] = scores.get(label, 0.0) + weights[section][2]
+            first_seen.setdefault(label, start)
+        return sorted(scores.items(), key=lambda item: (-item[1], first_seen[item[0]]))
+
+    def locate(self, text: str) -> Dict[str, Tuple[int, int]]:
+        """{entry: (occurrences, offset of the first one)} for every entry found in ``text``."""
+        found: Dict[str, Tuple[int, int]] = {}
+        for label, start, _ in self._matches(*_fold(text)):
+            count, first = found.get(label, (0, start))
+            found[label] = (count + 1, first)
+        return found
+
+    def extract(self, resume_text: str, limit: int = 15) -> List[str]:
+        """Top ``limit`` skills and titles, in the shape extract_skills_from_resume returns."""
+        return [skill for skill, _ in self.score(resume_text)[:limit]]
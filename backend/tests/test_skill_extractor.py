@@ -0,0 +1,41 @@
+"""
+Regression tests for taxonomy names that are also everyday words.
+
+Run from backend/:
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from keyword_match import KeywordMatcher  # noqa: E402
+from skill_extractor import SkillExtractor  # noqa: E402
+
+extractor = SkillExtractor()
+
+
+def test_everyday_word_at_sentence_start_is_not_a_skill():
+    assert "Express" not in extractor.locate("Express interest by email to jobs@example.com.")
+
+
+def test_job_match_does_not_report_everyday_words_as_missing():
+    match = KeywordMatcher(extractor).score(
+        "Backend developer with Python and PostgreSQL.",
+        "We need Python and PostgreSQL. Express interest by email.",
+    )
+    keywords = [k["keyword"] for k in match["matching_keywords"] + match["missing_keywords"]]
+    assert "Express" not in keywords
+
+
+def test_ambiguous_names_still_match_as_skills():
+    found = extractor.locate("We use React, Express and Node.js. Excel and Tableau daily.")
+    assert {"React", "Express", "Excel"} <= set(found)
+    assert "Express" in extractor.locate("Built APIs with express.js")
+    assert "React" in extractor.locate("React developer wanted")
+
+
+def test_lowercase_everyday_words_are_not_skills():
+    found = extractor.locate("You will excel in an agile team and react quickly to a swift spark.")
+    assert not {"Excel", "Agile", "React", "Swift", "Spark"} & set(found)
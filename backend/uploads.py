@@ -0,0 +1,224 @@
+"""
+Streaming, size-capped file uploads.
+
+receive_upload parses a multipart request body chunk by chunk as it
+arrives and writes the file part into an UploadSpool, so an upload never
+sits in memory whole. The byte cap is checked against Content-Length before
+the body is read and again on every chunk, and the file extension is checked
+as soon as the part headers arrive, so oversized or unsupported uploads are
+rejected without reading them to the end. The file is hashed as it is
+written, so the caller gets a content address without a second pass.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Iterator, Optional, Sequence, Union
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+# Allowance for multipart boundaries and part headers on top of the file cap
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+
+class UploadError(Exception):
+    """The request is not a usable single-file multipart upload."""
+
+
+class UploadTooLarge(UploadError):
+    """The upload is over the byte cap."""
+
+
+class UploadSpool:
+    """
+    Write-once buffer for an upload: memory up to ``spool_bytes``, then a
+    named temporary file.
+
+    Like tempfile.SpooledTemporaryFile, except the rolled-over file has a
+    path, so another process (the PDF worker pool) can open and mmap it.
+    Use as a context manager, or call close(), to delete the file.
+    ``digest`` is the content hash of everything written.
+    """
+
+    def __init__(self, spool_bytes: int, directory: Optional[str] = None):
+        self.spool_bytes = spool_bytes
+        self.directory = directory
+        self.size = 0
+        self.path: Optional[str] = None
+        self._buffer: Optional[BytesIO] = BytesIO()
+        self._file = None
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    def write(self, data: bytes) -> None:
+        if self._buffer is not None and self.size + len(data) > self.spool_bytes:
+            self._rollover()
+        (self._file or self._buffer).write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def _rollover(self) -> None:
+        fd, self.path = tempfile.mkstemp(prefix="upload-", dir=self.directory)
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(self._buffer.getbuffer())
+        self._buffer = None
+
+    def finish(self) -> None:
+        """Flush the rolled-over file so other readers see all of it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def digest(self) -> str:
+        """Hex content hash (BLAKE2b, 128-bit) of the bytes written so far."""
+        return self._hash.hexdigest()
+
+    @property
+    def in_memory(self) -> bool:
+        return self._buffer is not None
+
+    def getvalue(self) -> bytes:
+        """The whole upload as bytes; only for uploads still held in memory."""
+        if self._buffer is None:
+            raise ValueError("Upload was spooled to disk; use path or mapped()")
+        return self._buffer.getvalue()
+
+    @contextmanager
+    def mapped(self) -> Iterator[Union[memoryview, mmap.mmap]]:
+        """Read-only view of the upload without copying it: a memoryview or an mmap."""
+        if self._buffer is not None:
+            with self._buffer.getbuffer() as view:
+                yield view
+            return
+        if self.size == 0:
+            # mmap cannot map an empty file
+            yield memoryview(b"")
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+    def close(self) -> None:
+        self.finish()
+        self._buffer = None
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+    def __enter__(self) -> "UploadSpool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ReceivedUpload(UploadSpool):
+    """An UploadSpool with the client's filename."""
+
+    def __init__(self, filename: str, spool_bytes: int, directory: Optional[str] = None):
+        super().__init__(spool_bytes, directory)
+        self.filename = filename
+
+
+async def receive_upload(request, field: str = "file", max_bytes: int = 5 * 1024 * 1024,
+                         spool_bytes: int = 1024 * 1024,
+                         extensions: Optional[Sequence[str]] = None,
+                         directory: Optional[str] = None) -> ReceivedUpload:
+    """
+    Stream the ``field`` file part of a multipart request into a spool.
+
+    Raises UploadTooLarge once more than ``max_bytes`` of file data (or a
+    Content-Length that could not fit) is seen, and UploadError for a
+    malformed body, a missing file or an extension not in ``extensions``.
+    The caller owns the returned upload and must close it.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise UploadError("Expected a multipart/form-data upload")
+
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise UploadTooLarge(f"Upload is larger than the {max_bytes}-byte limit")
+
+    state = {"headers": {}, "field": b"", "value": b"", "target": None, "done": False}
+    upload: Optional[ReceivedUpload] = None
+
+    def on_part_begin():
+        state["headers"] = {}
+
+    def on_header_field(data, start, end):
+        state["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["value"] += data[start:end]
+
+    def on_header_end():
+        state["headers"][state["field"].lower()] = state["value"]
+        state["field"], state["value"] = b"", b""
+
+    def on_headers_finished():
+        nonlocal upload
+        _, disposition = parse_options_header(state["headers"].get(b"content-disposition", b""))
+        if disposition.get(b"name") != field.encode() or b"filename" not in disposition or state["done"]:
+            state["target"] = None
+            return
+        filename = os.path.basename(disposition[b"filename"].decode("utf-8", "replace"))
+        if extensions and not filename.lower().endswith(tuple(extensions)):
+            raise UploadError(f"Unsupported file type. Please upload {' or '.join(e.lstrip('.').upper() for e in extensions)}")
+        upload = ReceivedUpload(filename, spool_bytes, directory)
+        state["target"] = upload
+
+    def on_part_data(data, start, end):
+        target = state["target"]
+        if target is None:
+            return
+        if target.size + (end - start) > max_bytes:
+            raise UploadTooLarge(f"Upload is larger than the {max_bytes}-byte limit")
+        target.write(data[start:end])
+
+    def on_part_end():
+        if state["target"] is not None:
+            state["target"] = None
+            state["done"] = True
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            # Bounds non-file parts too, which are otherwise ignored
+            if received > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                raise UploadTooLarge(f"Upload is larger than the {max_bytes}-byte limit")
+            parser.write(chunk)
+        parser.finalize()
+    except UploadError:
+        if upload is not None:
+            upload.close()
+        raise
+    except Exception as e:
+        if upload is not None:
+            upload.close()
+        raise UploadError(f"Malformed upload: {str(e)}")
+
+    if upload is None or not state["done"]:
+        if upload is not None:
+            upload.close()
+        raise UploadError(f"No '{field}' file in the upload")
+    upload.finish()
+    return upload
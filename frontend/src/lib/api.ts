@@ -11,11 +11,34 @@ export interface Job {
   "Date Posted": string;
   "Apply Link": string;
   Source: string;
+  // Similarity to the resume (0-100), present when a resume was supplied
+  Relevance?: number;
+}
+
+export type JobSortOrder = 'date' | 'relevance';
+
+export interface ProviderStatus {
+  status: 'ok' | 'error' | 'timeout';
+  count: number;
+  duplicates?: number;
+  elapsed_ms: number;
+  error?: string;
 }
 
 export interface JobSearchResponse {
   jobs: Job[];
   count: number;
+  duplicates?: number;
+  providers?: Record<string, ProviderStatus>;
+  skills?: string[];
+}
+
+export type SkillExtractor = 'llm' | 'local' | 'hybrid';
+
+export interface ExtractSkillsResponse {
+  skills: string[];
+  source: 'llm' | 'local';
+  fingerprint: string;
 }
 
 export interface ResumeAnalysisResponse {
@@ -26,6 +49,10 @@ export interface ResumeAnalysisResponse {
 export interface UploadResumeResponse {
   resume_text: string;
   filename: string;
+  // Content hash of the file; any request taking resume_text also accepts resume_id
+  resume_id: string;
+  // True when the same file was uploaded before and parsing was skipped
+  cached: boolean;
 }
 
 export interface CareerPath {
@@ -217,6 +244,7 @@ export interface JobMatchResponse {
   ats_optimization_tips: string[];
   cover_letter_points: string[];
   error?: string;
+  enrichment_error?: string;
 }
 
 // Helper function for API calls
@@ -237,6 +265,57 @@ async function apiCall<T>(endpoint: string, options?: RequestInit): Promise<T> {
   return response.json();
 }
 
+// Helper for server-sent event endpoints: calls onEvent for each event and
+// resolves with the payload of the final "done" event
+async function streamEvents<T>(
+  endpoint: string,
+  body: unknown,
+  onEvent: (event: string, data: any) => void
+): Promise<T> {
+  const response = await fetch(`${API_URL}${endpoint}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
+    throw new Error(error.detail || `HTTP error! status: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result: T | undefined;
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const raw = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = 'message';
+      let data = '';
+      for (const line of raw.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : null;
+
+      if (event === 'error') throw new Error(payload?.detail || 'Stream failed');
+      if (event === 'done') result = payload as T;
+      onEvent(event, payload);
+    }
+  }
+
+  if (result === undefined) throw new Error('Stream ended before completion');
+  return result;
+}
+
 // API Functions
 
 // Health Check
@@ -276,12 +355,27 @@ export async function analyzeResume(
   });
 }
 
+export async function analyzeResumeStream(
+  resumeText: string,
+  targetRole: string | undefined,
+  onToken: (text: string) => void
+): Promise<ResumeAnalysisResponse> {
+  return streamEvents(
+    '/analyze-resume/stream',
+    { resume_text: resumeText, target_role: targetRole || null },
+    (event, data) => event === 'token' && onToken(data.text)
+  );
+}
+
 // Job Search - Manual
+// Pass resumeText to score jobs by relevance; sortBy 'relevance' requires it
 export async function searchJobs(
   searchTerm: string,
   location: string = 'United States',
   resultsWanted: number = 20,
-  jobType?: string
+  jobType?: string,
+  resumeText?: string,
+  sortBy: JobSortOrder = 'date'
 ): Promise<JobSearchResponse> {
   return apiCall('/search-jobs', {
     method: 'POST',
@@ -290,16 +384,31 @@ export async function searchJobs(
       location,
       results_wanted: resultsWanted,
       job_type: jobType || null,
+      resume_text: resumeText || null,
+      sort_by: sortBy,
     }),
   });
 }
 
 // Job Search - By Resume
+export async function extractSkills(
+  resumeText: string,
+  extractor?: SkillExtractor
+): Promise<ExtractSkillsResponse> {
+  return apiCall('/extract-skills', {
+    method: 'POST',
+    body: JSON.stringify({ resume_text: resumeText, extractor: extractor || null }),
+  });
+}
+
+// Pass skills from an earlier response to skip re-extracting them
 export async function searchJobsByResume(
   resumeText: string,
   location: string = 'United States',
   resultsWanted: number = 20,
-  jobType?: string
+  jobType?: string,
+  skills?: string[],
+  sortBy: JobSortOrder = 'relevance'
 ): Promise<JobSearchResponse> {
   return apiCall('/search-jobs-by-resume', {
     method: 'POST',
@@ -308,10 +417,111 @@ export async function searchJobsByResume(
       location,
       results_wanted: resultsWanted,
       job_type: jobType || null,
+      skills: skills || null,
+      sort_by: sortBy,
     }),
   });
 }
 
+// Progressive Job Search (NDJSON, one batch per provider)
+export interface JobSearchBatch {
+  event: 'batch';
+  provider: string;
+  jobs: Job[];
+  status: ProviderStatus;
+}
+
+export interface JobSearchSummary {
+  event: 'summary';
+  count: number;
+  duplicates: number;
+  first_batch_ms: number | null;
+  elapsed_ms: number;
+  providers: Record<string, ProviderStatus>;
+}
+
+async function streamJobSearch(
+  endpoint: string,
+  body: unknown,
+  onBatch: (batch: JobSearchBatch) => void
+): Promise<JobSearchSummary> {
+  const response = await fetch(`${API_URL}${endpoint}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
+    throw new Error(error.detail || `HTTP error! status: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let newline;
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (!line) continue;
+
+      const message = JSON.parse(line);
+      if (message.event === 'batch') onBatch(message);
+      if (message.event === 'summary') return message;
+    }
+  }
+
+  throw new Error('Job search stream ended before the summary');
+}
+
+export async function searchJobsStream(
+  searchTerm: string,
+  onBatch: (batch: JobSearchBatch) => void,
+  location: string = 'United States',
+  resultsWanted: number = 20,
+  jobType?: string,
+  resumeText?: string
+): Promise<JobSearchSummary> {
+  return streamJobSearch(
+    '/search-jobs/stream',
+    {
+      search_term: searchTerm,
+      location,
+      results_wanted: resultsWanted,
+      job_type: jobType || null,
+      resume_text: resumeText || null,
+    },
+    onBatch
+  );
+}
+
+export async function searchJobsByResumeStream(
+  resumeText: string,
+  onBatch: (batch: JobSearchBatch) => void,
+  location: string = 'United States',
+  resultsWanted: number = 20,
+  jobType?: string,
+  skills?: string[]
+): Promise<JobSearchSummary> {
+  return streamJobSearch(
+    '/search-jobs-by-resume/stream',
+    {
+      resume_text: resumeText,
+      location,
+      results_wanted: resultsWanted,
+      job_type: jobType || null,
+      skills: skills || null,
+    },
+    onBatch
+  );
+}
+
 // Career Insights - Paths
 export async function getCareerPaths(
   resumeText: string,
@@ -398,20 +608,127 @@ export async function getIndustryInsights(
   });
 }
 
+// Career Insights - All sections in one request
+export type CareerInsightSection =
+  | 'paths'
+  | 'skill_gaps'
+  | 'salary'
+  | 'interview_prep'
+  | 'learning'
+  | 'industry';
+
+export interface AllCareerInsightsResponse {
+  results: {
+    paths?: CareerPathsResponse;
+    skill_gaps?: SkillGapsResponse;
+    salary?: SalaryInsightsResponse;
+    interview_prep?: InterviewPrepResponse;
+    learning?: LearningResponse;
+    industry?: IndustryInsightsResponse;
+  };
+  errors: Partial<Record<CareerInsightSection, string>>;
+}
+
+export async function getAllCareerInsights(
+  resumeText: string,
+  targetRole?: string,
+  location: string = 'United States',
+  sections?: CareerInsightSection[]
+): Promise<AllCareerInsightsResponse> {
+  return apiCall('/career-insights/all', {
+    method: 'POST',
+    body: JSON.stringify({
+      resume_text: resumeText,
+      target_role: targetRole || null,
+      location,
+      sections: sections || null,
+    }),
+  });
+}
+
 // Job Match
+// enrich=false returns only the local keyword score, without the AI narrative
 export async function matchResumeToJob(
   resumeText: string,
-  jobDescription: string
+  jobDescription: string,
+  enrich: boolean = true
 ): Promise<JobMatchResponse> {
   return apiCall('/job-match', {
     method: 'POST',
     body: JSON.stringify({
       resume_text: resumeText,
       job_description: jobDescription,
+      enrich,
+    }),
+  });
+}
+
+// Batch Job Match - rank saved jobs against one resume
+export interface BatchJobDescription {
+  description: string;
+  id?: string;
+  title?: string;
+  company?: string;
+}
+
+export interface BatchJobMatchResult {
+  index: number;
+  id: string | null;
+  title: string | null;
+  company: string | null;
+  match_score: number;
+  match_level: string;
+  relevance: number;
+  skill_coverage: number;
+  matched_skills: string[];
+  missing_skills: string[];
+  details?: JobMatchResponse;
+}
+
+export interface BatchJobMatchResponse {
+  results: BatchJobMatchResult[];
+  count: number;
+  scoring_ms: number;
+}
+
+export async function matchResumeToJobs(
+  resumeText: string,
+  jobs: BatchJobDescription[],
+  deepDiveTopK: number = 0
+): Promise<BatchJobMatchResponse> {
+  return apiCall('/job-match/batch', {
+    method: 'POST',
+    body: JSON.stringify({
+      resume_text: resumeText,
+      jobs,
+      deep_dive_top_k: deepDiveTopK,
     }),
   });
 }
 
+// A completed array element from a streamed JSON response
+export interface StreamItem<T = unknown> {
+  field: string;
+  index: number;
+  value: T;
+}
+
+export async function matchResumeToJobStream(
+  resumeText: string,
+  jobDescription: string,
+  onItem: (item: StreamItem) => void,
+  onScore?: (score: Partial<JobMatchResponse>) => void
+): Promise<JobMatchResponse> {
+  return streamEvents(
+    '/job-match/stream',
+    { resume_text: resumeText, job_description: jobDescription },
+    (event, data) => {
+      if (event === 'item') onItem(data);
+      if (event === 'score') onScore?.(data);
+    }
+  );
+}
+
 // ==========================================
 // NEW FEATURES
 // ==========================================
@@ -439,6 +756,17 @@ export async function generateCoverLetter(
   });
 }
 
+export async function generateCoverLetterStream(
+  request: CoverLetterRequest,
+  onToken: (text: string) => void
+): Promise<CoverLetterResponse> {
+  return streamEvents(
+    '/generate-cover-letter/stream',
+    request,
+    (event, data) => event === 'token' && onToken(data.text)
+  );
+}
+
 // Interview Questions
 export interface InterviewQuestion {
   question: string;
@@ -464,6 +792,18 @@ export async function getInterviewQuestions(
   });
 }
 
+export async function getInterviewQuestionsStream(
+  resumeText: string,
+  targetRole: string | undefined,
+  onQuestion: (question: InterviewQuestion) => void
+): Promise<InterviewQuestionsResponse> {
+  return streamEvents(
+    '/interview-questions/stream',
+    { resume_text: resumeText, target_role: targetRole || null },
+    (event, data) => event === 'item' && onQuestion(data.value)
+  );
+}
+
 // Evaluate Interview Answer
 export interface AnswerEvaluation {
   score: number;
@@ -507,3 +847,15 @@ export async function enhanceResumeSection(
   });
 }
 
+export async function enhanceResumeSectionStream(
+  sectionType: string,
+  content: string,
+  targetRole: string | undefined,
+  onToken: (text: string) => void
+): Promise<EnhanceSectionResponse> {
+  return streamEvents(
+    '/enhance-resume-section/stream',
+    { section_type: sectionType, content, target_role: targetRole || null },
+    (event, data) => event === 'token' && onToken(data.text)
+  );
+}
@@ -1,31 +1,51 @@
 import re
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-import groq
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+import socket
 import os
-from typing import List, Dict, Optional
-from contextlib import contextmanager
+import sys
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Tuple, Callable, Awaitable, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
 import urllib.parse
 import time
 import random
 import json
+import asyncio
+import hashlib
+import unicodedata
+import logging
+import zlib
 
-# Safe import of streamlit - only used if running in Streamlit context
-try:
-    import streamlit as st
-    _STREAMLIT_AVAILABLE = True
-except ImportError:
-    _STREAMLIT_AVAILABLE = False
+if TYPE_CHECKING:
+    import groq
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
+def _streamlit_ui():
+    """The Streamlit UI shim, or None outside a Streamlit app.
+    
+    Streamlit is never imported here: only a running Streamlit app has it in
+    ``sys.modules``, so the backend never pays for loading it.
+    """
+    if "streamlit" not in sys.modules:
+        return None
+    try:
+        import streamlit_ui
+    except ImportError:
+        return None
+    return streamlit_ui
 
 @contextmanager
 def safe_spinner(message: str):
     """Safe spinner context manager that works with or without Streamlit."""
-    if _STREAMLIT_AVAILABLE:
-        try:
-            with st.spinner(message):
-                yield
-        except:
+    ui = _streamlit_ui()
+    if ui is not None:
+        with ui.spinner(message):
             yield
     else:
         print(f"[INFO] {message}")
@@ -33,36 +53,395 @@ def safe_spinner(message: str):
 
 def safe_warning(message: str):
     """Safe warning that works with or without Streamlit."""
-    if _STREAMLIT_AVAILABLE:
-        try:
-            st.warning(message)
-        except:
-            print(f"[WARNING] {message}")
+    ui = _streamlit_ui()
+    if ui is not None:
+        ui.warning(message)
     else:
         print(f"[WARNING] {message}")
 
 def safe_error(message: str):
     """Safe error that works with or without Streamlit."""
-    if _STREAMLIT_AVAILABLE:
-        try:
-            st.error(message)
-        except:
-            print(f"[ERROR] {message}")
+    ui = _streamlit_ui()
+    if ui is not None:
+        ui.error(message)
     else:
         print(f"[ERROR] {message}")
 
+
+def load_groq():
+    """Import the Groq SDK on first use; it is slow to import and only needed for AI calls."""
+    import groq
+    return groq
+
+
+class LazyClient:
+    """Proxy that builds a client on first attribute access.
+    
+    Lets module-level clients be declared at import time without importing
+    their SDK or opening connection pools until a request needs them.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._client = None
+
+    @property
+    def built(self) -> bool:
+        """True once the underlying client exists."""
+        return self._client is not None
+
+    def __getattr__(self, name: str):
+        if self._client is None:
+            self._client = self._factory()
+        return getattr(self._client, name)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_resume_text(resume_text: str) -> str:
+    """Canonical form of a resume: NFKC-normalized with whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", resume_text)).strip()
+
+
+def resume_fingerprint(resume_text: str) -> str:
+    """Stable hash of the full normalized resume, used as a cache key.
+    
+    Resumes that differ only in whitespace share a fingerprint; any change to
+    the content, not just the header, produces a different one.
+    """
+    normalized = normalize_resume_text(resume_text)
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+_TERM_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./\-][a-z0-9+#]+)*")
+_RELEVANCE_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our the to we will with you your "
+    "this that who what job role team work experience years".split()
+)
+# Size of the hashed term space; collisions at this size are negligible for resume-length texts
+RELEVANCE_DIMENSIONS = 1 << 18
+
+
+def _hashed_terms(text: str) -> "np.ndarray":
+    """Hashed term indices of ``text`` (lowercased, stopwords dropped)."""
+    import numpy as np
+    terms = [t for t in _TERM_RE.findall(text.lower()) if t not in _RELEVANCE_STOPWORDS]
+    hashes = np.fromiter((zlib.crc32(t.encode("utf-8")) for t in terms), dtype=np.int64, count=len(terms))
+    return hashes % RELEVANCE_DIMENSIONS
+
+
+def relevance_scores(resume_text: str, documents: List[str]) -> "np.ndarray":
+    """Cosine similarity (0-100) between a resume and each document.
+    
+    Texts become hashed term vectors with sublinear (1 + log tf) weights.
+    All documents are scored in one vectorized pass, and each score depends
+    only on its own document, so batches can be scored as they arrive.
+    """
+    import numpy as np
+    scores = np.zeros(len(documents))
+    query_idx, query_counts = np.unique(_hashed_terms(resume_text), return_counts=True)
+    if not documents or not len(query_idx):
+        return scores
+    query = np.zeros(RELEVANCE_DIMENSIONS)
+    query[query_idx] = 1 + np.log(query_counts)
+    query_norm = np.linalg.norm(query[query_idx])
+
+    hashed = [_hashed_terms(doc) for doc in documents]
+    doc_ids = np.repeat(np.arange(len(documents)), [len(h) for h in hashed])
+    # (document, term) pairs packed into one key so np.unique counts term frequencies per document
+    keys, counts = np.unique(doc_ids * RELEVANCE_DIMENSIONS + np.concatenate(hashed), return_counts=True)
+    ids, terms = np.divmod(keys, RELEVANCE_DIMENSIONS)
+    weights = 1 + np.log(counts)
+    dots = np.bincount(ids, weights=weights * query[terms], minlength=len(documents))
+    norms = np.sqrt(np.bincount(ids, weights=weights * weights, minlength=len(documents)))
+    np.divide(100 * dots, norms * query_norm, out=scores, where=norms > 0)
+    return scores
+
+
+class JobRecord:
+    """One normalized job posting.
+    
+    Providers build these directly, so a search never round-trips through a
+    DataFrame. ``description`` is kept for relevance ranking only and is not
+    part of ``to_dict``; ``relevance`` is set once a resume has been scored.
+    """
+
+    __slots__ = ("title", "company", "location", "job_type", "salary", "date_posted",
+                 "apply_link", "source", "description", "relevance")
+
+    # (attribute, display column) in output order
+    COLUMNS = (
+        ("title", "Job Title"),
+        ("company", "Company"),
+        ("location", "Location"),
+        ("job_type", "Job Type"),
+        ("salary", "Salary"),
+        ("date_posted", "Date Posted"),
+        ("apply_link", "Apply Link"),
+        ("source", "Source"),
+    )
+
+    def __init__(self, title: str, company: str, location: str, job_type: str, salary: str,
+                 date_posted: str, apply_link: str, source: str, description: str = "",
+                 relevance: Optional[float] = None):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.job_type = job_type
+        self.salary = salary
+        self.date_posted = date_posted
+        self.apply_link = apply_link
+        self.source = source
+        self.description = description
+        self.relevance = relevance
+
+    def to_dict(self) -> Dict:
+        """The job as returned by the API, keyed by display column."""
+        record = {column: getattr(self, attr) for attr, column in self.COLUMNS}
+        if self.relevance is not None:
+            record["Relevance"] = self.relevance
+        return record
+
+
+def job_text(job: JobRecord) -> str:
+    """Text a job is ranked on: title (counted twice), company and description."""
+    return f"{job.title} {job.title} {job.company} {job.description}"
+
+
+class AICallError(Exception):
+    """Raised when an async Groq completion fails after all retries."""
+
+
+def _groq_error_policy(error: Exception, timeout: float, attempt: int) -> Tuple[str, Optional[float]]:
+    """Map a failed Groq attempt to (user-facing message, pause before retrying or None to stop)."""
+    if isinstance(error, asyncio.TimeoutError):
+        logger.warning(f"Attempt {attempt + 1} timed out")
+        return f"AI request timed out after {timeout} seconds", 1  # Brief pause before retry
+    groq = load_groq()
+    if isinstance(error, groq.RateLimitError):
+        logger.warning(f"Rate limit hit: {error}")
+        return "Rate limit exceeded. Please try again in a moment.", 2  # Longer pause for rate limits
+    if isinstance(error, groq.APIError):
+        logger.error(f"Groq API error: {error}")
+        return f"AI service error: {str(error)}", 1
+    logger.error(f"Unexpected error in Groq call: {error}")
+    return f"Unexpected error: {str(error)}", None
+
+
+async def call_groq_async(
+    client: "groq.AsyncGroq",
+    messages: List[dict],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    timeout: float = 60,
+    retries: int = 2,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
+    """
+    Call Groq through the async client with timeout and retry logic.
+    
+    The request is awaited directly, so when the timeout fires the in-flight
+    HTTP request is cancelled rather than left running in a worker thread.
+    
+    Raises:
+        AICallError with a user-facing message once all attempts have failed
+    """
+    last_error = None
+    for attempt in range(retries + 1):
+        try:
+            logger.info(f"Groq API call attempt {attempt + 1}/{retries + 1}")
+            
+            async with semaphore if semaphore is not None else nullcontext():
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    ),
+                    timeout=timeout
+                )
+            
+            content = response.choices[0].message.content
+            if content:
+                logger.info(f"Groq API call successful, response length: {len(content)}")
+                return content.strip()
+            else:
+                raise ValueError("Empty response from Groq API")
+                
+        except Exception as e:
+            last_error, pause = _groq_error_policy(e, timeout, attempt)
+            if pause is None:
+                break  # Don't retry on unexpected errors
+            if attempt < retries:
+                await asyncio.sleep(pause)
+    
+    raise AICallError(last_error)
+
+
+async def stream_groq_async(
+    client: "groq.AsyncGroq",
+    messages: List[dict],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    timeout: float = 60,
+    retries: int = 2,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> AsyncIterator[str]:
+    """
+    Stream a Groq completion, yielding text deltas as they are generated.
+    
+    ``timeout`` bounds the whole generation. Failures before the first token
+    are retried like call_groq_async; once text has been yielded a failure
+    raises AICallError, since the caller has already relayed partial output.
+    """
+    loop = asyncio.get_running_loop()
+    last_error = None
+    for attempt in range(retries + 1):
+        emitted = False
+        try:
+            logger.info(f"Groq streaming call attempt {attempt + 1}/{retries + 1}")
+            
+            async with semaphore if semaphore is not None else nullcontext():
+                deadline = loop.time() + timeout
+                stream = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=True
+                    ),
+                    timeout=timeout
+                )
+                try:
+                    chunks = stream.__aiter__()
+                    while True:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            raise asyncio.TimeoutError()
+                        try:
+                            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=remaining)
+                        except StopAsyncIteration:
+                            break
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            emitted = True
+                            yield delta
+                finally:
+                    await stream.close()
+            
+            if not emitted:
+                raise ValueError("Empty response from Groq API")
+            return
+                
+        except Exception as e:
+            last_error, pause = _groq_error_policy(e, timeout, attempt)
+            if pause is None or emitted:
+                break
+            if attempt < retries:
+                await asyncio.sleep(pause)
+    
+    raise AICallError(last_error)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that turns on TCP keep-alive for pooled provider connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
 class JobSearcher:
-    def __init__(self, groq_api_key: str):
-        """Initialize the JobSearcher with Groq API key for skill extraction."""
-        self.groq_client = groq.Client(api_key=groq_api_key)
+    def __init__(self, groq_api_key: str, async_groq_client: Optional["groq.AsyncGroq"] = None,
+                 ai_timeout: float = 60, ai_retries: int = 2,
+                 ai_semaphore: Optional[asyncio.Semaphore] = None,
+                 ai_completion: Optional[Callable[..., Awaitable[str]]] = None):
+        """Initialize the JobSearcher with Groq API key for skill extraction.
+        
+        The async client, timeout, retries and semaphore are used by the
+        ``*_async`` methods; pass the backend's shared client so they draw
+        from the same connection pool and concurrency limit. ``ai_completion``
+        replaces the direct call entirely, e.g. with a cached completion
+        function taking ``messages``, ``temperature``, ``max_tokens`` and
+        ``validate``, the parser a completion must pass before it is cached.
+        """
+        # The SDK is imported when a client is first used, not at startup
+        self.groq_client = LazyClient(lambda: load_groq().Client(api_key=groq_api_key))
+        self.async_groq_client = async_groq_client or LazyClient(
+            lambda: load_groq().AsyncGroq(api_key=groq_api_key, max_retries=0)
+        )
+        self.ai_timeout = ai_timeout
+        self.ai_retries = ai_retries
+        self.ai_semaphore = ai_semaphore
+        self.ai_completion = ai_completion
 
         # API configurations
         self.rapidapi_key = os.getenv("RAPIDAPI_KEY")  # For JSearch API
         self.adzuna_app_id = os.getenv("ADZUNA_APP_ID")  # For Adzuna API
         self.adzuna_app_key = os.getenv("ADZUNA_APP_KEY")  # For Adzuna API
+
+        # Providers are queried concurrently; results arriving after the
+        # deadline are dropped and the provider is reported as timed out
+        self.search_deadline = float(os.getenv("JOB_SEARCH_DEADLINE_SECONDS", "12"))
+        self._provider_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("JOB_PROVIDER_WORKERS", "8")),
+            thread_name_prefix="job-provider"
+        )
+
+        # Long-lived pooled session so provider calls reuse TCP/TLS connections
+        self.http_timeout = (
+            float(os.getenv("JOB_HTTP_CONNECT_TIMEOUT", "3.05")),
+            float(os.getenv("JOB_HTTP_READ_TIMEOUT", "10"))
+        )
+        adapter = _KeepAliveAdapter(
+            pool_connections=int(os.getenv("JOB_HTTP_POOL_CONNECTIONS", "4")),  # Host pools kept
+            pool_maxsize=int(os.getenv("JOB_HTTP_POOL_MAXSIZE", "10"))  # Connections per host
+        )
+        self.http_session = requests.Session()
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
         
-    def extract_skills_from_resume(self, resume_text: str) -> List[str]:
-        """Extract relevant skills and keywords from resume text using AI."""
+    def http_pool_stats(self) -> Dict[str, Dict]:
+        """Report per-host request and connection counts for the provider session.
+        
+        ``reused`` is the number of requests served on an already-open
+        connection, i.e. requests that skipped the TCP/TLS handshake.
+        """
+        stats = {}
+        seen = set()
+        for adapter in self.http_session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_made = pool.num_requests
+                connections_opened = pool.num_connections
+                stats[f"{pool.scheme}://{pool.host}"] = {
+                    "requests": requests_made,
+                    "connections_opened": connections_opened,
+                    "reused": max(requests_made - connections_opened, 0)
+                }
+        return stats
+
+    def close(self):
+        """Release pooled HTTP connections and the provider thread pool."""
+        self.http_session.close()
+        self._provider_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_skills_request(self, resume_text: str) -> Dict:
+        """Build the completion request for extract_skills_from_resume."""
         prompt = f"""
         Analyze the following resume and extract the most relevant skills, technologies, and keywords that would be useful for job searching. 
         Focus on:
@@ -78,203 +457,404 @@ class JobSearcher:
         {resume_text}
         """
         
+        return {
+            "messages": [
+                {"role": "system", "content": "You are an expert at extracting relevant job search keywords from resumes."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 200
+        }
+
+    @staticmethod
+    def _parse_skills(skills_text: Optional[str]) -> List[str]:
+        """Split a comma-separated skills completion into at most 15 skills."""
+        if skills_text:
+            skills_text = skills_text.strip()
+            # Split by comma and clean up
+            skills = [skill.strip() for skill in skills_text.split(',') if skill.strip()]
+            return skills[:15]  # Limit to 15 skills
+        return []
+
+    @classmethod
+    def _validate_skills(cls, skills_text: Optional[str]):
+        if not cls._parse_skills(skills_text):
+            raise ValueError("No skills in completion")
+
+    def extract_skills_from_resume(self, resume_text: str) -> List[str]:
+        """Extract relevant skills and keywords from resume text using AI."""
         try:
             response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are an expert at extracting relevant job search keywords from resumes."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=200
+                model=DEFAULT_MODEL,
+                **self._extract_skills_request(resume_text)
             )
+            return self._parse_skills(response.choices[0].message.content)
             
-            skills_text = response.choices[0].message.content
-            if skills_text:
-                skills_text = skills_text.strip()
-                # Split by comma and clean up
-                skills = [skill.strip() for skill in skills_text.split(',') if skill.strip()]
-                return skills[:15]  # Limit to 15 skills
+        except Exception as e:
+            safe_error(f"Error extracting skills: {str(e)}")
             return []
-            
+
+    async def extract_skills_from_resume_async(self, resume_text: str) -> List[str]:
+        """Async extract_skills_from_resume with timeout and retries."""
+        try:
+            return self._parse_skills(await self._acomplete(
+                **self._extract_skills_request(resume_text), validate=self._validate_skills
+            ))
         except Exception as e:
             safe_error(f"Error extracting skills: {str(e)}")
             return []
     
     def search_jobs_by_resume(self, resume_text: str, location: str = "United States",
-                             results_wanted: int = 20, job_type: Optional[str] = None) -> pd.DataFrame:
-        """Search for jobs based on resume content."""
+                             results_wanted: int = 20, job_type: Optional[str] = None,
+                             skills: Optional[List[str]] = None, sort_by: str = "relevance") -> List[JobRecord]:
+        """Search for jobs based on resume content.
+        
+        Pass ``skills`` from an earlier extraction to skip the AI call. Jobs
+        carry a ``Relevance`` score against the resume and are sorted by it
+        unless ``sort_by`` is ``"date"``.
+        """
         # Extract skills from resume
-        skills = self.extract_skills_from_resume(resume_text)
+        if not skills:
+            skills = self.extract_skills_from_resume(resume_text)
         
         if not skills:
             safe_warning("Could not extract skills from resume. Please try manual search.")
-            return pd.DataFrame()
-        
-        # Create search term from top skills
-        search_term = " OR ".join(skills[:5])  # Use top 5 skills
+            return []
         
-        return self.search_jobs(search_term, location, results_wanted, job_type)
+        jobs, _, _ = self.search_jobs_with_status(
+            self.skills_search_term(skills), location, results_wanted, job_type,
+            resume_text=resume_text, sort_by=sort_by
+        )
+        return jobs
+
+    @staticmethod
+    def skills_search_term(skills: List[str]) -> str:
+        """Build a provider search term from the top 5 extracted skills."""
+        return " OR ".join(skills[:5])
     
     def search_jobs(self, search_term: str, location: str = "United States",
-                   results_wanted: int = 20, job_type: Optional[str] = None) -> pd.DataFrame:
+                   results_wanted: int = 20, job_type: Optional[str] = None) -> List[JobRecord]:
         """Search for jobs using real APIs (JSearch and Adzuna)."""
+        jobs, _, _ = self.search_jobs_with_status(search_term, location, results_wanted, job_type)
+        return jobs
+
+    def search_jobs_with_status(self, search_term: str, location: str = "United States",
+                                results_wanted: int = 20, job_type: Optional[str] = None,
+                                resume_text: Optional[str] = None,
+                                sort_by: str = "date") -> Tuple[List[JobRecord], Dict[str, Dict], int]:
+        """Search all configured providers concurrently under one overall deadline.
+        
+        Returns the cleaned jobs, a per-provider status dict and the number of
+        duplicate (title, company) jobs that were dropped. Providers that
+        have not answered when ``search_deadline`` expires are reported as
+        ``timeout`` and whatever already arrived is returned.
+        
+        With ``resume_text`` every job gets a ``Relevance`` score (0-100);
+        ``sort_by="relevance"`` then keeps the most relevant ``results_wanted``
+        jobs, best first, instead of sorting by date.
+        """
         try:
             with safe_spinner("Searching for real job opportunities..."):
-                all_jobs = []
+                providers = self._configured_providers(search_term, location, results_wanted, job_type)
+                started = time.perf_counter()
+                futures = {
+                    self._provider_executor.submit(self._timed_call, fn, *args): name
+                    for name, fn, args in providers
+                }
+                _, not_done = wait(futures, timeout=self.search_deadline)
+                return self._collect_search(futures, not_done, started, search_term, location,
+                                            results_wanted, job_type, resume_text, sort_by)
+        except Exception as e:
+            safe_error(f"Error searching for jobs: {str(e)}")
+            return [], {}, 0
+
+    async def search_jobs_with_status_async(self, search_term: str, location: str = "United States",
+                                            results_wanted: int = 20, job_type: Optional[str] = None,
+                                            resume_text: Optional[str] = None, sort_by: str = "date"
+                                            ) -> Tuple[List[JobRecord], Dict[str, Dict], int]:
+        """Async version of search_jobs_with_status.
+
+        The providers still run on the provider pool, but the deadline is
+        awaited on the event loop, so no other thread is held while waiting.
+        """
+        try:
+            providers = self._configured_providers(search_term, location, results_wanted, job_type)
+            started = time.perf_counter()
+            futures = {
+                self._provider_executor.submit(self._timed_call, fn, *args): name
+                for name, fn, args in providers
+            }
+            not_done = set()
+            if futures:
+                waiting = {asyncio.wrap_future(future): future for future in futures}
+                _, pending = await asyncio.wait(waiting, timeout=self.search_deadline)
+                not_done = {waiting[future] for future in pending}
+            return self._collect_search(futures, not_done, started, search_term, location,
+                                        results_wanted, job_type, resume_text, sort_by)
+        except Exception as e:
+            safe_error(f"Error searching for jobs: {str(e)}")
+            return [], {}, 0
 
-                # Try JSearch API first (via RapidAPI)
-                if self.rapidapi_key:
-                    jsearch_jobs = self._search_jsearch_api(search_term, location, min(results_wanted, 10), job_type)
-                    all_jobs.extend(jsearch_jobs)
+    def _collect_search(self, futures: Dict, not_done: set, started: float, search_term: str,
+                        location: str, results_wanted: int, job_type: Optional[str],
+                        resume_text: Optional[str], sort_by: str
+                        ) -> Tuple[List[JobRecord], Dict[str, Dict], int]:
+        """Turn finished provider futures into the (jobs, provider_status, duplicates) result."""
+        provider_status = {}
+        all_jobs = []
+        # Collect in provider order so JSearch results still come first
+        for future, name in futures.items():
+            if future in not_done:
+                future.cancel()
+                provider_status[name] = {
+                    "status": "timeout",
+                    "count": 0,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000)
+                }
+                safe_warning(f"{name} did not respond within {self.search_deadline}s")
+                continue
+            jobs, elapsed_ms, error = future.result()
+            if error is not None:
+                provider_status[name] = {"status": "error", "count": 0, "elapsed_ms": elapsed_ms, "error": error}
+                safe_warning(f"{name} error: {error}")
+            else:
+                provider_status[name] = {"status": "ok", "count": len(jobs), "elapsed_ms": elapsed_ms}
+                all_jobs.extend(jobs)
 
-                # Try Adzuna API as backup/additional source
-                if self.adzuna_app_id and self.adzuna_app_key and len(all_jobs) < results_wanted:
-                    remaining_results = results_wanted - len(all_jobs)
-                    adzuna_jobs = self._search_adzuna_api(search_term, location, min(remaining_results, 10), job_type)
-                    all_jobs.extend(adzuna_jobs)
+        if resume_text:
+            self._score_relevance(all_jobs, resume_text)
 
-                if not all_jobs:
-                    if not self.rapidapi_key and not (self.adzuna_app_id and self.adzuna_app_key):
-                        safe_warning("⚠️ No API keys configured. Showing sample data. Please add RAPIDAPI_KEY or ADZUNA_APP_ID/ADZUNA_APP_KEY to .env file for real job data.")
-                    sample_jobs = self._generate_sample_jobs(search_term, location, results_wanted, job_type)
-                    all_jobs.extend(sample_jobs)
+        if not all_jobs:
+            if not futures:
+                safe_warning("⚠️ No API keys configured. Showing sample data. Please add RAPIDAPI_KEY or ADZUNA_APP_ID/ADZUNA_APP_KEY to .env file for real job data.")
+            sample_jobs = self._generate_sample_jobs(search_term, location, results_wanted, job_type)
+            if resume_text:
+                self._score_relevance(sample_jobs, resume_text)
+            provider_status["Sample Data"] = {"status": "ok", "count": len(sample_jobs), "elapsed_ms": 0}
+            all_jobs.extend(sample_jobs)
 
-                if not all_jobs:
-                    safe_warning("No jobs found for the given criteria.")
-                    return pd.DataFrame()
+        if not all_jobs:
+            safe_warning("No jobs found for the given criteria.")
+            return [], provider_status, 0
 
-                # Convert to DataFrame and clean
-                jobs_df = pd.DataFrame(all_jobs)
-                jobs_df = self._clean_job_data(jobs_df)
+        jobs, duplicates = self._clean_jobs(all_jobs, sort_by=sort_by)
+        # Cap after dedupe and sorting so duplicates never take the place of unique jobs
+        return jobs[:results_wanted], provider_status, duplicates
 
-                return jobs_df
+    async def search_jobs_progressive(self, search_term: str, location: str = "United States",
+                                      results_wanted: int = 20, job_type: Optional[str] = None,
+                                      resume_text: Optional[str] = None
+                                      ) -> AsyncIterator[Tuple[str, List[Dict], Dict]]:
+        """Yield (provider, new jobs, status) as each provider answers.
 
-        except Exception as e:
-            safe_error(f"Error searching for jobs: {str(e)}")
-            return pd.DataFrame()
+        Jobs already yielded (same title and company) are dropped from later
+        batches, counted in the status as ``duplicates``, and the total is
+        capped at ``results_wanted``. Providers still
+        pending at ``search_deadline`` are yielded last with a ``timeout``
+        status; sample data is yielded only if no provider returned anything.
+        With ``resume_text`` each batch is scored (``Relevance``) and sorted.
+        """
+        providers = self._configured_providers(search_term, location, results_wanted, job_type)
+        started = time.perf_counter()
+        pending = {
+            asyncio.wrap_future(self._provider_executor.submit(self._timed_call, fn, *args)): name
+            for name, fn, args in providers
+        }
+        seen = set()
+        sent = 0
 
-    def _search_jsearch_api(self, search_term: str, location: str, results_wanted: int, job_type: Optional[str]) -> List[Dict]:
-        """Search jobs using JSearch API via RapidAPI."""
-        try:
-            url = "https://jsearch.p.rapidapi.com/search"
-
-            querystring = {
-                "query": f"{search_term} {location}",
-                "page": "1",
-                "country": f"{location}",
-                "num_pages": "1",
-                "date_posted": "all"
+        while pending:
+            remaining = self.search_deadline - (time.perf_counter() - started)
+            if remaining <= 0:
+                break
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                jobs, elapsed_ms, error = future.result()
+                if error is not None:
+                    safe_warning(f"{name} error: {error}")
+                    yield name, [], {"status": "error", "count": 0, "elapsed_ms": elapsed_ms, "error": error}
+                    continue
+                batch = self._unseen_jobs(jobs, seen)
+                duplicates = len(jobs) - len(batch)
+                if resume_text:
+                    self._score_relevance(batch, resume_text)
+                    batch.sort(key=lambda job: -job.relevance)
+                batch = [job.to_dict() for job in batch[:max(results_wanted - sent, 0)]]
+                sent += len(batch)
+                yield name, batch, {"status": "ok", "count": len(jobs), "duplicates": duplicates,
+                                    "elapsed_ms": elapsed_ms}
+
+        for future, name in pending.items():
+            future.cancel()
+            safe_warning(f"{name} did not respond within {self.search_deadline}s")
+            yield name, [], {
+                "status": "timeout",
+                "count": 0,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000)
             }
 
-            # Add job type filter if specified
-            if job_type and job_type.lower() != "any":
-                employment_types = {
-                    "full-time": "FULLTIME",
-                    "part-time": "PARTTIME",
-                    "contract": "CONTRACTOR",
-                    "internship": "INTERN"
-                }
-                if job_type.lower() in employment_types:
-                    querystring["employment_types"] = employment_types[job_type.lower()]
+        if sent == 0:
+            if not providers:
+                safe_warning("⚠️ No API keys configured. Showing sample data. Please add RAPIDAPI_KEY or ADZUNA_APP_ID/ADZUNA_APP_KEY to .env file for real job data.")
+            sample_jobs = self._unseen_jobs(
+                self._generate_sample_jobs(search_term, location, results_wanted, job_type), seen
+            )
+            if resume_text:
+                self._score_relevance(sample_jobs, resume_text)
+            yield "Sample Data", [job.to_dict() for job in sample_jobs], {
+                "status": "ok", "count": len(sample_jobs), "elapsed_ms": 0
+            }
+
+    @staticmethod
+    def _score_relevance(jobs: List[JobRecord], resume_text: str) -> None:
+        """Set each job's ``relevance`` to its similarity with the resume, in one pass."""
+        scores = relevance_scores(resume_text, [job_text(job) for job in jobs])
+        for job, score in zip(jobs, scores):
+            job.relevance = round(float(score), 1)
 
-            headers = {
-                "x-rapidapi-key": self.rapidapi_key,
-                "x-rapidapi-host": "jsearch.p.rapidapi.com"
+    @staticmethod
+    def _unseen_jobs(jobs: List[JobRecord], seen: set) -> List[JobRecord]:
+        """Drop jobs whose (title, company) is in ``seen``, recording the rest."""
+        fresh = []
+        for job in jobs:
+            key = (job.title, job.company)
+            if key not in seen:
+                seen.add(key)
+                fresh.append(job)
+        return fresh
+
+    def _configured_providers(self, search_term: str, location: str, results_wanted: int,
+                              job_type: Optional[str]) -> List[Tuple[str, Callable, tuple]]:
+        """Return (name, search function, args) for every provider with API keys set."""
+        providers = []
+        if self.rapidapi_key:
+            providers.append(("JSearch API", self._search_jsearch_api,
+                              (search_term, location, min(results_wanted, 10), job_type)))
+        if self.adzuna_app_id and self.adzuna_app_key:
+            providers.append(("Adzuna API", self._search_adzuna_api,
+                              (search_term, location, min(results_wanted, 10), job_type)))
+        return providers
+
+    @staticmethod
+    def _timed_call(fn: Callable, *args) -> Tuple[List[JobRecord], int, Optional[str]]:
+        """Run a provider search, returning (jobs, elapsed_ms, error)."""
+        started = time.perf_counter()
+        try:
+            jobs = fn(*args)
+            return jobs, round((time.perf_counter() - started) * 1000), None
+        except Exception as e:
+            return [], round((time.perf_counter() - started) * 1000), str(e)
+
+    def _search_jsearch_api(self, search_term: str, location: str, results_wanted: int, job_type: Optional[str]) -> List[JobRecord]:
+        """Search jobs using JSearch API via RapidAPI. Raises on request failure."""
+        url = "https://jsearch.p.rapidapi.com/search"
+
+        querystring = {
+            "query": f"{search_term} {location}",
+            "page": "1",
+            "country": f"{location}",
+            "num_pages": "1",
+            "date_posted": "all"
+        }
+
+        # Add job type filter if specified
+        if job_type and job_type.lower() != "any":
+            employment_types = {
+                "full-time": "FULLTIME",
+                "part-time": "PARTTIME",
+                "contract": "CONTRACTOR",
+                "internship": "INTERN"
             }
+            if job_type.lower() in employment_types:
+                querystring["employment_types"] = employment_types[job_type.lower()]
 
-            response = requests.get(url, headers=headers, params=querystring, timeout=10)
+        headers = {
+            "x-rapidapi-key": self.rapidapi_key,
+            "x-rapidapi-host": "jsearch.p.rapidapi.com"
+        }
 
+        response = self.http_session.get(url, headers=headers, params=querystring, timeout=self.http_timeout)
 
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
 
-                if "data" in data and data["data"]:
-                    for job in data["data"][:results_wanted]:
-                        job_data = {
-                            "Job Title": job.get("job_title", "N/A"),
-                            "Company": job.get("employer_name", "N/A"),
-                            "Location": f"{job.get('job_city', '')}, {job.get('job_state', '')}".strip(", "),
-                            "Job Type": job.get("job_employment_type", "N/A"),
-                            "Salary": self._format_salary_jsearch(job),
-                            "Date Posted": job.get("job_posted_at_datetime_utc", "N/A"),
-                            "Apply Link": job.get("job_apply_link", "N/A"),
-                            "Source": "JSearch API"
-                        }
-                        jobs.append(job_data)
+        if response.status_code == 200:
+            data = response.json()
+            jobs = []
 
-                return jobs
-            else:
-                safe_warning(f"JSearch API returned status code: {response.status_code}")
-                return []
+            if "data" in data and data["data"]:
+                for job in data["data"][:results_wanted]:
+                    jobs.append(JobRecord(
+                        title=job.get("job_title", "N/A"),
+                        company=job.get("employer_name", "N/A"),
+                        location=f"{job.get('job_city', '')}, {job.get('job_state', '')}".strip(", "),
+                        job_type=job.get("job_employment_type", "N/A"),
+                        salary=self._format_salary_jsearch(job),
+                        date_posted=job.get("job_posted_at_datetime_utc", "N/A"),
+                        apply_link=job.get("job_apply_link", "N/A"),
+                        source="JSearch API",
+                        description=job.get("job_description") or ""
+                    ))
 
-        except Exception as e:
-            safe_warning(f"JSearch API error: {str(e)}")
-            return []
+            return jobs
+        else:
+            raise RuntimeError(f"JSearch API returned status code: {response.status_code}")
 
-    def _search_adzuna_api(self, search_term: str, location: str, results_wanted: int, job_type: Optional[str]) -> List[Dict]:
-        """Search jobs using Adzuna API."""
-        try:
-            # Convert location to country code (simplified)
-            country = "us"  # Default to US
-            if "uk" in location.lower() or "united kingdom" in location.lower():
-                country = "gb"
-            elif "canada" in location.lower():
-                country = "ca"
-            elif "australia" in location.lower():
-                country = "au"
-
-            url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
-
-            params = {
-                "app_id": self.adzuna_app_id,
-                "app_key": self.adzuna_app_key,
-                "results_per_page": min(results_wanted, 20),
-                "what": search_term,
-                "where": location,
-                "sort_by": "date"
+    def _search_adzuna_api(self, search_term: str, location: str, results_wanted: int, job_type: Optional[str]) -> List[JobRecord]:
+        """Search jobs using Adzuna API. Raises on request failure."""
+        # Convert location to country code (simplified)
+        country = "us"  # Default to US
+        if "uk" in location.lower() or "united kingdom" in location.lower():
+            country = "gb"
+        elif "canada" in location.lower():
+            country = "ca"
+        elif "australia" in location.lower():
+            country = "au"
+
+        url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
+
+        params = {
+            "app_id": self.adzuna_app_id,
+            "app_key": self.adzuna_app_key,
+            "results_per_page": min(results_wanted, 20),
+            "what": search_term,
+            "where": location,
+            "sort_by": "date"
+        }
+
+        # Add job type filter if specified
+        if job_type and job_type.lower() != "any":
+            job_type_mapping = {
+                "full-time": "permanent",
+                "part-time": "part_time",
+                "contract": "contract",
+                "internship": "graduate"
             }
+            if job_type.lower() in job_type_mapping:
+                params["category"] = job_type_mapping[job_type.lower()]
 
-            # Add job type filter if specified
-            if job_type and job_type.lower() != "any":
-                job_type_mapping = {
-                    "full-time": "permanent",
-                    "part-time": "part_time",
-                    "contract": "contract",
-                    "internship": "graduate"
-                }
-                if job_type.lower() in job_type_mapping:
-                    params["category"] = job_type_mapping[job_type.lower()]
-
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-
-                if "results" in data:
-                    for job in data["results"]:
-                        job_data = {
-                            "Job Title": job.get("title", "N/A"),
-                            "Company": job.get("company", {}).get("display_name", "N/A"),
-                            "Location": f"{job.get('location', {}).get('display_name', 'N/A')}",
-                            "Job Type": job.get("contract_type", "N/A"),
-                            "Salary": self._format_salary_adzuna(job),
-                            "Date Posted": job.get("created", "N/A"),
-                            "Apply Link": job.get("redirect_url", "N/A"),
-                            "Source": "Adzuna API"
-                        }
-                        jobs.append(job_data)
-
-                return jobs
-            else:
-                safe_warning(f"Adzuna API returned status code: {response.status_code}")
-                return []
+        response = self.http_session.get(url, params=params, timeout=self.http_timeout)
 
-        except Exception as e:
-            safe_warning(f"Adzuna API error: {str(e)}")
-            return []
+        if response.status_code == 200:
+            data = response.json()
+            jobs = []
+
+            if "results" in data:
+                for job in data["results"]:
+                    jobs.append(JobRecord(
+                        title=job.get("title", "N/A"),
+                        company=job.get("company", {}).get("display_name", "N/A"),
+                        location=f"{job.get('location', {}).get('display_name', 'N/A')}",
+                        job_type=job.get("contract_type", "N/A"),
+                        salary=self._format_salary_adzuna(job),
+                        date_posted=job.get("created", "N/A"),
+                        apply_link=job.get("redirect_url", "N/A"),
+                        source="Adzuna API",
+                        description=job.get("description") or ""
+                    ))
+
+            return jobs
+        else:
+            raise RuntimeError(f"Adzuna API returned status code: {response.status_code}")
 
     def _format_salary_jsearch(self, job: Dict) -> str:
         """Format salary from JSearch API response."""
@@ -311,7 +891,7 @@ class JobSearcher:
         except:
             return "Salary not specified"
 
-    def _generate_sample_jobs(self, search_term: str, location: str, results_wanted: int, job_type: Optional[str]) -> List[Dict]:
+    def _generate_sample_jobs(self, search_term: str, location: str, results_wanted: int, job_type: Optional[str]) -> List[JobRecord]:
         """Generate sample job data for demonstration."""
         companies = [
             "Google", "Microsoft", "Amazon", "Apple", "Meta", "Netflix", "Tesla",
@@ -351,103 +931,91 @@ class JobSearcher:
             base_salary = random.randint(60000, 150000)
             salary_range = f"${base_salary:,} - ${base_salary + 20000:,} yearly"
 
-            job = {
-                "Job Title": title,
-                "Company": company,
-                "Location": location,
-                "Job Type": selected_job_type,
-                "Salary": salary_range,
-                "Date Posted": f"{random.randint(1, 7)} days ago",
-                "Apply Link": f"https://example.com/jobs/{company.lower()}-{i}",
-                "Source": random.choice(sources)
-            }
-
-            sample_jobs.append(job)
+            sample_jobs.append(JobRecord(
+                title=title,
+                company=company,
+                location=location,
+                job_type=selected_job_type,
+                salary=salary_range,
+                date_posted=f"{random.randint(1, 7)} days ago",
+                apply_link=f"https://example.com/jobs/{company.lower()}-{i}",
+                source=random.choice(sources)
+            ))
 
         return sample_jobs
     
-    def _clean_job_data(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and format job data for display."""
+    @staticmethod
+    def _clean_jobs(jobs: List[JobRecord], sort_by: str = "date") -> Tuple[List[JobRecord], int]:
+        """Drop duplicate (title, company) jobs and sort for display.
+        
+        Returns the jobs and how many duplicates were dropped. Sorts by resume
+        relevance when requested and scored, else by date posted, newest
+        first. Both sorts are stable, so ties keep provider order.
+        """
+        unique = JobSearcher._unseen_jobs(jobs, set())
+        if sort_by == "relevance" and unique and unique[0].relevance is not None:
+            unique.sort(key=lambda job: job.relevance, reverse=True)
+        else:
+            unique.sort(key=lambda job: job.date_posted, reverse=True)
+        return unique, len(jobs) - len(unique)
+    
+    def parse_json_response(self, content: str) -> Dict:
+        """Parse a JSON completion, stripping any markdown code fence."""
+        result = content.strip()
+        # Clean up potential markdown formatting
+        if result.startswith("```"):
+            result = result.split("```")[1]
+            if result.startswith("json"):
+                result = result[4:]
+        result = result.strip()
+        
+        return json.loads(result)
+
+    def _run_json_analysis(self, messages: List[dict], temperature: float, max_tokens: int) -> Dict:
+        """Run a JSON-returning completion on the sync client."""
         try:
-            # Select and rename columns for better display
-            display_columns = {
-                'title': 'Job Title',
-                'company': 'Company',
-                'location': 'Location',
-                'job_type': 'Job Type',
-                'salary': 'Salary',
-                'date_posted': 'Date Posted',
-                'job_url': 'Apply Link',
-                'site': 'Source'
-            }
-            
-            # Create salary column from min/max amounts or use existing salary
-            if 'Salary' not in jobs_df.columns:
-                if 'min_amount' in jobs_df.columns and 'max_amount' in jobs_df.columns:
-                    jobs_df['salary'] = jobs_df.apply(self._format_salary, axis=1)
-                else:
-                    jobs_df['salary'] = 'Not specified'
-            
-            # Handle location column
-            if 'city' in jobs_df.columns and 'state' in jobs_df.columns:
-                jobs_df['location'] = jobs_df.apply(
-                    lambda row: f"{row.get('city', '')}, {row.get('state', '')}".strip(', '), 
-                    axis=1
-                )
-            
-            # Select available columns
-            available_columns = {}
-            for old_col, new_col in display_columns.items():
-                if old_col in jobs_df.columns:
-                    available_columns[old_col] = new_col
-            
-            # Rename columns
-            jobs_df = jobs_df.rename(columns=available_columns)
-            
-            # Select only the renamed columns that exist
-            final_columns = [col for col in display_columns.values() if col in jobs_df.columns]
-            jobs_df = jobs_df[final_columns]
-            
-            # Remove duplicates based on job title and company
-            if 'Job Title' in jobs_df.columns and 'Company' in jobs_df.columns:
-                jobs_df = jobs_df.drop_duplicates(subset=['Job Title', 'Company'])
-            
-            # Sort by date if available
-            if 'Date Posted' in jobs_df.columns:
-                jobs_df = jobs_df.sort_values('Date Posted', ascending=False)
-            
-            return jobs_df.reset_index(drop=True)
+            response = self.groq_client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            return self.parse_json_response(response.choices[0].message.content)
             
         except Exception as e:
-            safe_error(f"Error cleaning job data: {str(e)}")
-            return jobs_df
-    
-    def _format_salary(self, row) -> str:
-        """Format salary information from min/max amounts."""
+            return {"error": str(e)}
+
+    async def _acomplete(self, messages: List[dict], temperature: float, max_tokens: int,
+                         validate: Optional[Callable[[str], Any]] = None) -> str:
+        """
+        Run a completion through ai_completion if set, else the async client.
+
+        ``validate`` is passed on to ai_completion, which only caches a
+        completion it accepts; the direct client does not cache.
+        """
+        if self.ai_completion is not None:
+            return await self.ai_completion(messages=messages, temperature=temperature, max_tokens=max_tokens,
+                                            validate=validate)
+        return await call_groq_async(
+            self.async_groq_client,
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=self.ai_timeout,
+            retries=self.ai_retries,
+            semaphore=self.ai_semaphore
+        )
+
+    async def _arun_json_analysis(self, messages: List[dict], temperature: float, max_tokens: int) -> Dict:
+        """Run a JSON-returning completion on the async client with timeout and retries."""
         try:
-            min_amount = row.get('min_amount')
-            max_amount = row.get('max_amount')
-            interval = row.get('interval', 'yearly')
+            content = await self._acomplete(messages, temperature=temperature, max_tokens=max_tokens,
+                                            validate=self.parse_json_response)
+            return self.parse_json_response(content)
             
-            if pd.isna(min_amount) and pd.isna(max_amount):
-                return 'Not specified'
-            
-            # Format amounts
-            if not pd.isna(min_amount) and not pd.isna(max_amount):
-                if min_amount == max_amount:
-                    return f"${int(min_amount):,} {interval}"
-                else:
-                    return f"${int(min_amount):,} - ${int(max_amount):,} {interval}"
-            elif not pd.isna(min_amount):
-                return f"${int(min_amount):,}+ {interval}"
-            elif not pd.isna(max_amount):
-                return f"Up to ${int(max_amount):,} {interval}"
-            
-            return 'Not specified'
-            
-        except Exception:
-            return 'Not specified'
-    
+        except Exception as e:
+            return {"error": str(e)}
+
     def get_job_recommendations(self, resume_text: str, target_role: Optional[str] = None) -> List[str]:
         """Get job search recommendations based on resume analysis."""
         prompt = f"""
@@ -489,8 +1057,8 @@ class JobSearcher:
             safe_error(f"Error generating recommendations: {str(e)}")
             return []
 
-    def get_career_path_analysis(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
-        """Analyze potential career paths based on resume."""
+    def _career_path_analysis_request(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Build the completion request for get_career_path_analysis."""
         prompt = f"""
         Based on the following resume, analyze potential career paths.
         {f"The user is targeting: {target_role}" if target_role else ""}
@@ -517,32 +1085,25 @@ class JobSearcher:
         Provide 3 distinct career paths. Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are a career advisor. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=800
-            )
-            
-            result = response.choices[0].message.content.strip()
-            # Clean up potential markdown formatting
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are a career advisor. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.5,
+            "max_tokens": 800
+        }
 
-    def get_skill_gap_analysis(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
-        """Analyze skill gaps for target role."""
+    def get_career_path_analysis(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Analyze potential career paths based on resume."""
+        return self._run_json_analysis(**self._career_path_analysis_request(resume_text, target_role))
+
+    async def get_career_path_analysis_async(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Async version of get_career_path_analysis that does not block the event loop."""
+        return await self._arun_json_analysis(**self._career_path_analysis_request(resume_text, target_role))
+
+    def _skill_gap_analysis_request(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Build the completion request for get_skill_gap_analysis."""
         role_context = target_role if target_role else "a senior position in their field"
         
         prompt = f"""
@@ -577,31 +1138,25 @@ class JobSearcher:
         Identify top 5 skill gaps. Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are a skills analyst. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=800
-            )
-            
-            result = response.choices[0].message.content.strip()
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are a skills analyst. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.5,
+            "max_tokens": 800
+        }
 
-    def get_salary_insights(self, resume_text: str, target_role: Optional[str] = None, location: str = "United States") -> Dict:
-        """Get salary insights based on resume and target role."""
+    def get_skill_gap_analysis(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Analyze skill gaps for target role."""
+        return self._run_json_analysis(**self._skill_gap_analysis_request(resume_text, target_role))
+
+    async def get_skill_gap_analysis_async(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Async version of get_skill_gap_analysis that does not block the event loop."""
+        return await self._arun_json_analysis(**self._skill_gap_analysis_request(resume_text, target_role))
+
+    def _salary_insights_request(self, resume_text: str, target_role: Optional[str] = None, location: str = "United States") -> Dict:
+        """Build the completion request for get_salary_insights."""
         role_context = target_role if target_role else "positions matching this resume"
         
         prompt = f"""
@@ -634,31 +1189,25 @@ class JobSearcher:
         Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are a compensation analyst. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=800
-            )
-            
-            result = response.choices[0].message.content.strip()
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are a compensation analyst. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.5,
+            "max_tokens": 800
+        }
 
-    def get_interview_preparation(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
-        """Get interview preparation tips based on resume."""
+    def get_salary_insights(self, resume_text: str, target_role: Optional[str] = None, location: str = "United States") -> Dict:
+        """Get salary insights based on resume and target role."""
+        return self._run_json_analysis(**self._salary_insights_request(resume_text, target_role, location))
+
+    async def get_salary_insights_async(self, resume_text: str, target_role: Optional[str] = None, location: str = "United States") -> Dict:
+        """Async version of get_salary_insights that does not block the event loop."""
+        return await self._arun_json_analysis(**self._salary_insights_request(resume_text, target_role, location))
+
+    def _interview_preparation_request(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Build the completion request for get_interview_preparation."""
         role_context = target_role if target_role else "relevant positions"
         
         prompt = f"""
@@ -696,31 +1245,25 @@ class JobSearcher:
         Provide 5 likely questions and 3 STAR stories. Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are an interview coach. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=1000
-            )
-            
-            result = response.choices[0].message.content.strip()
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are an interview coach. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.6,
+            "max_tokens": 1000
+        }
 
-    def get_learning_recommendations(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
-        """Get personalized learning recommendations."""
+    def get_interview_preparation(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Get interview preparation tips based on resume."""
+        return self._run_json_analysis(**self._interview_preparation_request(resume_text, target_role))
+
+    async def get_interview_preparation_async(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Async version of get_interview_preparation that does not block the event loop."""
+        return await self._arun_json_analysis(**self._interview_preparation_request(resume_text, target_role))
+
+    def _learning_recommendations_request(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Build the completion request for get_learning_recommendations."""
         role_context = target_role if target_role else "career advancement"
         
         prompt = f"""
@@ -769,31 +1312,25 @@ class JobSearcher:
         Provide 4 courses, 3 certifications, 3 books, and 3 projects. Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are a learning advisor. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=1000
-            )
-            
-            result = response.choices[0].message.content.strip()
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are a learning advisor. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.6,
+            "max_tokens": 1000
+        }
 
-    def match_resume_to_job(self, resume_text: str, job_description: str) -> Dict:
-        """Match resume against a job description and provide detailed analysis."""
+    def get_learning_recommendations(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Get personalized learning recommendations."""
+        return self._run_json_analysis(**self._learning_recommendations_request(resume_text, target_role))
+
+    async def get_learning_recommendations_async(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Async version of get_learning_recommendations that does not block the event loop."""
+        return await self._arun_json_analysis(**self._learning_recommendations_request(resume_text, target_role))
+
+    def _match_resume_to_job_request(self, resume_text: str, job_description: str) -> Dict:
+        """Build the completion request for match_resume_to_job."""
         prompt = f"""
         Analyze how well this resume matches the job description. Provide a detailed compatibility analysis.
         
@@ -879,32 +1416,102 @@ class JobSearcher:
         Be thorough in identifying ALL keywords from the job description. Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are an expert ATS (Applicant Tracking System) analyst and resume optimization specialist. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.4,
-                max_tokens=2000
-            )
-            
-            result = response.choices[0].message.content.strip()
-            # Clean up potential markdown formatting
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are an expert ATS (Applicant Tracking System) analyst and resume optimization specialist. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.4,
+            "max_tokens": 2000
+        }
 
-    def get_industry_insights(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
-        """Get industry insights and trends based on resume analysis."""
+    def match_resume_to_job(self, resume_text: str, job_description: str) -> Dict:
+        """Match resume against a job description and provide detailed analysis."""
+        return self._run_json_analysis(**self._match_resume_to_job_request(resume_text, job_description))
+
+    async def match_resume_to_job_async(self, resume_text: str, job_description: str) -> Dict:
+        """Async version of match_resume_to_job that does not block the event loop."""
+        return await self._arun_json_analysis(**self._match_resume_to_job_request(resume_text, job_description))
+
+    def match_narrative_request(self, resume_text: str, job_description: str,
+                                matched: List[str], missing: List[str]) -> Dict:
+        """Build the completion request for match_narrative_async."""
+        prompt = f"""
+        A keyword scan has already compared this resume with the job description.
+        Matched keywords: {", ".join(matched) or "none"}
+        Missing keywords: {", ".join(missing) or "none"}
+
+        Write the qualitative part of the match analysis. Do not list keywords again.
+
+        RESUME:
+        {resume_text}
+
+        JOB DESCRIPTION:
+        {job_description}
+
+        Provide a JSON response with the following structure (no markdown, just pure JSON):
+        {{
+            "summary": "Brief 2-3 sentence summary of the match",
+            "strengths": [
+                {{
+                    "area": "Area of strength",
+                    "details": "Why this is a strong match"
+                }}
+            ],
+            "weaknesses": [
+                {{
+                    "area": "Area of weakness",
+                    "details": "Why this is a gap",
+                    "how_to_improve": "Specific improvement suggestion"
+                }}
+            ],
+            "experience_match": {{
+                "required_years": "X years",
+                "candidate_years": "Y years",
+                "assessment": "Meets/Exceeds/Below requirements"
+            }},
+            "education_match": {{
+                "required": "Required education",
+                "candidate_has": "Candidate's education",
+                "assessment": "Meets/Exceeds/Below requirements"
+            }},
+            "ats_optimization_tips": [
+                "Tip 1 for better ATS compatibility"
+            ],
+            "resume_improvements": [
+                {{
+                    "section": "Section to improve",
+                    "current": "Current state",
+                    "suggested": "Suggested improvement",
+                    "priority": "High/Medium/Low"
+                }}
+            ],
+            "cover_letter_points": [
+                "Key point to mention in cover letter"
+            ]
+        }}
+
+        Return ONLY valid JSON, no explanation text.
+        """
+
+        return {
+            "messages": [
+                {"role": "system", "content": "You are an expert ATS (Applicant Tracking System) analyst and resume optimization specialist. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.4,
+            "max_tokens": 1200
+        }
+
+    async def match_narrative_async(self, resume_text: str, job_description: str,
+                                    matched: List[str], missing: List[str]) -> Dict:
+        """Narrative fields of a job match (summary, strengths, ...) for a locally scored match."""
+        return await self._arun_json_analysis(
+            **self.match_narrative_request(resume_text, job_description, matched, missing)
+        )
+
+    def _industry_insights_request(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Build the completion request for get_industry_insights."""
         prompt = f"""
         Based on this resume, provide industry insights and trends.
         {f"The user is targeting: {target_role}" if target_role else ""}
@@ -946,25 +1553,19 @@ class JobSearcher:
         Return ONLY valid JSON, no explanation text.
         """
         
-        try:
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are an industry analyst. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=800
-            )
-            
-            result = response.choices[0].message.content.strip()
-            if result.startswith("```"):
-                result = result.split("```")[1]
-                if result.startswith("json"):
-                    result = result[4:]
-            result = result.strip()
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            return {"error": str(e)}
+        return {
+            "messages": [
+                {"role": "system", "content": "You are an industry analyst. Always respond with valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.6,
+            "max_tokens": 800
+        }
+
+    def get_industry_insights(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Get industry insights and trends based on resume analysis."""
+        return self._run_json_analysis(**self._industry_insights_request(resume_text, target_role))
+
+    async def get_industry_insights_async(self, resume_text: str, target_role: Optional[str] = None) -> Dict:
+        """Async version of get_industry_insights that does not block the event loop."""
+        return await self._arun_json_analysis(**self._industry_insights_request(resume_text, target_role))
@@ -0,0 +1,37 @@
+"""
+Streamlit UI shim for job_search.py.
+
+job_search only imports this module when it is running inside a Streamlit
+app, so the FastAPI backend never loads Streamlit. Each helper falls back to
+printing if Streamlit cannot render (e.g. outside a script run context).
+"""
+from contextlib import ExitStack, contextmanager
+
+import streamlit as st
+
+
+@contextmanager
+def spinner(message: str):
+    """Show a Streamlit spinner while the block runs."""
+    with ExitStack() as stack:
+        try:
+            stack.enter_context(st.spinner(message))
+        except Exception:
+            print(f"[INFO] {message}")
+        yield
+
+
+def warning(message: str):
+    """Show a Streamlit warning."""
+    try:
+        st.warning(message)
+    except Exception:
+        print(f"[WARNING] {message}")
+
+
+def error(message: str):
+    """Show a Streamlit error."""
+    try:
+        st.error(message)
+    except Exception:
+        print(f"[ERROR] {message}")